@@ -0,0 +1,3 @@
+"""
+Benchmarks of the core hot paths.
+"""
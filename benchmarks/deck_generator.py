@@ -0,0 +1,53 @@
+"""
+Synthetic deck generation for benchmarks.
+"""
+import random
+from datetime import date, timedelta
+from typing import List, Optional
+from core.flashcard import Flashcard
+
+SYLLABLES = (
+    'ab', 'an', 'be', 'ber', 'de', 'der', 'ei', 'en', 'er', 'ge', 'hal', 'ich',
+    'kau', 'lich', 'mä', 'nen', 'ö', 'sch', 'stra', 'te', 'ung', 'ü', 'ver', 'zei',
+    'ká', 'gy', 'ő', 'ny', 'ség', 'ta', 'ul', 'vá', 'ző'
+)
+ARTICLES = ('der', 'die', 'das')
+
+def _word(rng: random.Random) -> str:
+    """Build a random pseudo word."""
+    return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+def generate_cards(count: int, category: str = 'Benchmark', seed: int = 0,
+                   new_fraction: float = 0.3, today: Optional[date] = None) -> List[Flashcard]:
+    """
+    Generate a deck with a realistic mix of new and reviewed cards.
+
+    Questions look like German nouns with article and plural, answers like
+    short phrases; reviewed cards have random intervals and review dates
+    in the past two months so part of the deck is due.
+
+    Args:
+        count: Number of cards
+        category: Category of the cards
+        seed: Random seed
+        new_fraction: Fraction of cards that were never reviewed
+        today: Reference day for review dates, defaults to today
+
+    Returns:
+        List[Flashcard]: Cards with unique question/answer pairs
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    cards = []
+    for i in range(count):
+        noun = _word(rng).capitalize()
+        question = f"{rng.choice(ARTICLES)} {noun}{i}, die {noun}{i}en"
+        answer = ' '.join(_word(rng) for _ in range(rng.randint(1, 3)))
+        card = Flashcard(question=question, answer=answer, category=category)
+        if rng.random() >= new_fraction:
+            card.repetitions = rng.randint(1, 8)
+            card.interval = rng.randint(1, 60)
+            card.easiness = round(rng.uniform(1.3, 3.0), 2)
+            card.last_review = (today - timedelta(days=rng.randint(0, 60))).strftime('%Y-%m-%d')
+        cards.append(card)
+    return cards
@@ -0,0 +1,275 @@
+"""
+Benchmarks of the core hot paths on generated decks.
+
+Measures loading, saving, due queries, duplicate checks, answer
+comparison and search at several deck sizes and writes throughput,
+latency percentiles and peak memory as JSON.
+
+Usage:
+    python -m benchmarks.run_benchmarks --sizes 10000 100000 1000000
+    python -m benchmarks.run_benchmarks --sizes 10000 --compare baseline.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from benchmarks.deck_generator import generate_cards
+from core.manager import FlashcardManager
+from core.search_index import SearchIndex
+from core.storage import JsonStorageBackend
+from core.utils.text_processing import compare_answers
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+CATEGORY = 'Benchmark'
+# Hits per batch shown by SearchScreen._do_search (RESULT_BATCH_SIZE)
+SEARCH_BATCH_SIZE = 50
+SEARCH_QUERIES = ('a', 'de', 'ber', 'die ver', 'kau', 'ség', 'xyz')
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmarked path at one deck size."""
+    name: str
+    cards: int
+    unit: str
+    ops_per_call: int
+    latencies: List[float] = field(repr=False)  # Seconds per call
+    peak_memory: int = 0  # Bytes allocated at peak during one call
+
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float) -> float:
+        """Get a percentile of sorted values by nearest rank."""
+        index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the result as JSON-serializable data."""
+        ordered = sorted(self.latencies)
+        total = sum(ordered)
+        return {
+            'name': self.name,
+            'cards': self.cards,
+            'unit': self.unit,
+            'calls': len(ordered),
+            'throughput_per_second': self.ops_per_call * len(ordered) / total if total else None,
+            'latency_ms': {
+                'mean': 1000 * total / len(ordered),
+                'p50': 1000 * self._percentile(ordered, 0.50),
+                'p90': 1000 * self._percentile(ordered, 0.90),
+                'p99': 1000 * self._percentile(ordered, 0.99),
+                'max': 1000 * ordered[-1]
+            },
+            'peak_memory_bytes': self.peak_memory
+        }
+
+def measure(name: str, cards: int, call: Callable[[Any], Any], calls: int,
+            setup: Callable[[], Any] = lambda: None, unit: str = 'calls',
+            ops_per_call: int = 1) -> BenchmarkResult:
+    """
+    Time a call repeatedly, then measure its peak memory once.
+
+    Args:
+        name: Benchmark name
+        cards: Deck size
+        call: Benchmarked call, receiving the value returned by setup
+        calls: Number of timed calls
+        setup: Untimed preparation run before every call
+        unit: What ops_per_call counts, for throughput
+        ops_per_call: Units of work done by one call
+
+    Returns:
+        BenchmarkResult: Latencies and peak memory
+    """
+    call(setup())  # Warm up caches
+    latencies = []
+    gc.collect()
+    for _ in range(calls):
+        argument = setup()
+        start = time.perf_counter()
+        call(argument)
+        latencies.append(time.perf_counter() - start)
+
+    argument = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name, cards, unit, ops_per_call, latencies, peak)
+
+def _calls_for(size: int, budget: int) -> int:
+    """Scale the number of calls of a whole-deck operation to the deck size."""
+    return max(3, min(50, budget // size))
+
+def run_size(size: int, seed: int = 0) -> List[BenchmarkResult]:
+    """
+    Run all benchmarks on a generated deck.
+
+    Args:
+        size: Number of cards in the deck
+        seed: Random seed of the deck and the workloads
+
+    Returns:
+        List[BenchmarkResult]: One result per benchmarked path
+    """
+    rng = random.Random(seed)
+    storage = tempfile.mkdtemp(prefix='flashcards-bench-')
+    try:
+        cards = generate_cards(size, CATEGORY, seed)
+        JsonStorageBackend(storage).save_category(CATEGORY, cards)
+        deck_calls = _calls_for(size, 100_000)
+        results = []
+
+        # FlashcardManager._load_cards via the constructor
+        results.append(measure(
+            'manager.load_cards', size,
+            lambda _: FlashcardManager(storage_path=storage, category=CATEGORY),
+            deck_calls, unit='cards', ops_per_call=size
+        ))
+        manager = FlashcardManager(storage_path=storage, category=CATEGORY)
+        loaded = manager.cards
+
+        # Full rewrite of the deck after a change
+        def change_card():
+            rng.choice(loaded).score += 1
+        results.append(measure(
+            'manager.save_cards', size, lambda _: manager.save_cards(),
+            deck_calls, setup=change_card, unit='cards', ops_per_call=size
+        ))
+
+        # Journaled single-card save after a review
+        results.append(measure(
+            'manager.review_card', size,
+            lambda card: manager.review_card(card, rng.choice(('again', 'good', 'easy'))),
+            200, setup=lambda: rng.choice(loaded)
+        ))
+
+        # Due queries: building the schedule, then querying it
+        results.append(measure(
+            'manager.get_due_cards.cold', size,
+            lambda _: manager.get_due_cards(CATEGORY), deck_calls,
+            setup=manager._schedulers.clear, unit='cards', ops_per_call=size
+        ))
+        results.append(measure(
+            'manager.get_due_cards', size,
+            lambda _: manager.get_due_cards(CATEGORY), deck_calls
+        ))
+
+        # Duplicate checks: half existing pairs (either direction), half new
+        def duplicate_pair():
+            card = rng.choice(loaded)
+            roll = rng.random()
+            if roll < 0.25:
+                return card.question, card.answer
+            if roll < 0.5:
+                return card.answer, card.question
+            return card.question, card.answer + ' neu'
+        results.append(measure(
+            'manager.is_duplicate', size,
+            lambda pair: manager._is_duplicate(*pair), 2000, setup=duplicate_pair
+        ))
+
+        # Answer checks: correct answers with different formatting and wrong answers
+        def user_answer():
+            card = rng.choice(loaded)
+            answer = card.answer.upper() if rng.random() < 0.5 else card.answer + ' x'
+            return card, answer
+        results.append(measure(
+            'compare_answers', size,
+            lambda item: compare_answers(item[1], item[0].answer), 2000, setup=user_answer
+        ))
+        results.append(measure(
+            'flashcard.check_answer', size,
+            lambda item: item[0].check_answer(item[1]), 2000, setup=user_answer
+        ))
+
+        # Search: building the index, then the first batch SearchScreen._do_search shows
+        results.append(measure(
+            'search.build_index', size, lambda _: SearchIndex(loaded),
+            _calls_for(size, 100_000), unit='cards', ops_per_call=size
+        ))
+        index = SearchIndex(loaded)
+        queries = iter(SEARCH_QUERIES * 100)
+        results.append(measure(
+            'search.first_batch', size,
+            lambda query: next(index.iter_search(query, batch_size=SEARCH_BATCH_SIZE), []),
+            len(SEARCH_QUERIES) * 10, setup=lambda: next(queries)
+        ))
+        manager.flush()
+        return results
+    finally:
+        shutil.rmtree(storage, ignore_errors=True)
+
+def _git_revision() -> Optional[str]:
+    """Get the current git commit, if available."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+            cwd=os.path.dirname(RESULTS_DIR), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]]) -> None:
+    """Print the median latency change against a baseline run."""
+    previous = {(r['name'], r['cards']): r for r in baseline}
+    print(f"\n{'benchmark':32} {'cards':>8} {'p50 ms':>10} {'baseline':>10} {'change':>8}")
+    for result in results:
+        old = previous.get((result['name'], result['cards']))
+        if old is None:
+            continue
+        new_p50, old_p50 = result['latency_ms']['p50'], old['latency_ms']['p50']
+        change = (new_p50 / old_p50 - 1) * 100 if old_p50 else 0.0
+        print(f"{result['name']:32} {result['cards']:>8} {new_p50:>10.3f} {old_p50:>10.3f} {change:>+7.1f}%")
+
+def main():
+    """Run the benchmarks and write the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark core hot paths on generated decks.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="Deck sizes.")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed.")
+    parser.add_argument('--output', help="Result file, defaults to benchmarks/results/<timestamp>.json.")
+    parser.add_argument('--compare', help="Earlier result file to compare median latencies against.")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        for result in run_size(size, args.seed):
+            data = result.to_dict()
+            results.append(data)
+            print(f"{data['name']:32} {size:>8} cards  p50 {data['latency_ms']['p50']:9.3f} ms  "
+                  f"p99 {data['latency_ms']['p99']:9.3f} ms  peak {data['peak_memory_bytes'] / 1e6:8.1f} MB")
+
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'results': results
+    }
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"benchmark-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(results, json.load(f)['results'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,273 @@
+"""
+Long-horizon review simulator for the SM2 scheduler.
+
+Simulates daily study sessions over a deck to forecast the review
+workload, retention and study time of scheduling settings. Card state is
+kept in NumPy arrays and updated with sm2_batch, so a million cards over
+a year of sessions runs in seconds.
+
+Run as a script to simulate a synthetic deck:
+    python -m core.algorithm.simulator --cards 1000000 --days 365
+"""
+import argparse
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence
+import numpy as np
+from core.algorithm.sm2 import today_ordinal
+from core.algorithm.sm2_batch import calculate_next_reviews
+
+# Quality scores of the study screen's difficulty buttons
+QUALITY_AGAIN, QUALITY_HARD, QUALITY_GOOD, QUALITY_EASY = 0, 2, 3, 5
+
+# Returns the recall probability of cards given the days since their last
+# review and their current interval and easiness
+RecallModel = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+class ExponentialRecallModel:
+    """
+    Exponential forgetting curve anchored at the scheduled interval.
+
+    A card reviewed exactly on its due day is recalled with probability
+    retention_at_due; recall decays exponentially with overdue time.
+    Easier cards decay more slowly.
+    """
+
+    def __init__(self, retention_at_due: float = 0.9, easiness_weight: float = 0.5):
+        """
+        Initialize the model.
+
+        Args:
+            retention_at_due: Recall probability after exactly one interval
+            easiness_weight: How strongly easiness above 2.5 slows forgetting
+        """
+        self.log_retention = math.log(retention_at_due)
+        self.easiness_weight = easiness_weight
+
+    def __call__(self, elapsed: np.ndarray, interval: np.ndarray, easiness: np.ndarray) -> np.ndarray:
+        stability = interval * (1.0 + self.easiness_weight * (easiness - 2.5))
+        return np.exp(self.log_retention * elapsed / np.maximum(stability, 0.5))
+
+@dataclass
+class SimulationDeck:
+    """Array-backed review state of a deck, one element per card."""
+    easiness: np.ndarray     # float64
+    interval: np.ndarray     # int64
+    repetitions: np.ndarray  # int64
+    last_day: np.ndarray     # int64 ordinal of the last review, -1 for new cards
+
+    def __len__(self) -> int:
+        return len(self.easiness)
+
+    @classmethod
+    def synthetic(cls, count: int) -> 'SimulationDeck':
+        """Create a deck of new cards."""
+        return cls(
+            easiness=np.full(count, 2.5),
+            interval=np.ones(count, dtype=np.int64),
+            repetitions=np.zeros(count, dtype=np.int64),
+            last_day=np.full(count, -1, dtype=np.int64)
+        )
+
+    @classmethod
+    def from_cards(cls, cards: Sequence[Any]) -> 'SimulationDeck':
+        """
+        Create a deck from the current state of flashcards.
+
+        Args:
+            cards: Flashcards (or objects with the same review fields)
+
+        Returns:
+            SimulationDeck: Copy of the cards' review state
+        """
+        return cls(
+            easiness=np.fromiter((card.easiness for card in cards), dtype=np.float64, count=len(cards)),
+            interval=np.fromiter((card.interval for card in cards), dtype=np.int64, count=len(cards)),
+            repetitions=np.fromiter((card.repetitions for card in cards), dtype=np.int64, count=len(cards)),
+            last_day=np.fromiter(
+                (card.due_day - card.interval if card.last_review else -1 for card in cards),
+                dtype=np.int64, count=len(cards)
+            )
+        )
+
+    def copy(self) -> 'SimulationDeck':
+        """Get an independent copy of the deck state."""
+        return SimulationDeck(
+            self.easiness.copy(), self.interval.copy(),
+            self.repetitions.copy(), self.last_day.copy()
+        )
+
+@dataclass
+class SessionSettings:
+    """Daily session limits and answer timing."""
+    new_per_day: int = 20                  # New cards introduced per day
+    max_reviews_per_day: Optional[int] = None  # Cap on due reviews, most overdue first
+    first_recall: float = 0.3              # Chance of knowing a new card on first sight
+    easy_fraction: float = 0.3             # Recalled answers rated easy instead of good
+    hard_fraction: float = 0.5             # Forgotten answers rated hard instead of again
+    seconds_per_review: float = 8.0
+    seconds_per_lapse: float = 20.0
+    seconds_per_new: float = 25.0
+
+@dataclass
+class SimulationResult:
+    """Per-day outcome of a simulation."""
+    reviews: np.ndarray    # Due cards reviewed
+    new_cards: np.ndarray  # New cards introduced
+    recalled: np.ndarray   # Reviews answered correctly
+    backlog: np.ndarray    # Due cards left over by the review cap
+    seconds: np.ndarray    # Study time
+    learned: int = 0       # Cards introduced by the end
+    deck: Optional[SimulationDeck] = field(default=None, repr=False)
+
+    @property
+    def retention(self) -> np.ndarray:
+        """Fraction of due reviews recalled per day (NaN on days without reviews)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.recalled / self.reviews
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the simulation.
+
+        Returns:
+            Dict[str, float]: Totals and daily averages
+        """
+        total_reviews = int(self.reviews.sum())
+        return {
+            'days': len(self.reviews),
+            'cards_learned': self.learned,
+            'total_reviews': total_reviews,
+            'mean_reviews_per_day': float(self.reviews.mean()) if len(self.reviews) else 0.0,
+            'peak_reviews_per_day': int(self.reviews.max()) if len(self.reviews) else 0,
+            'retention': float(self.recalled.sum() / total_reviews) if total_reviews else 0.0,
+            'mean_minutes_per_day': float(self.seconds.mean() / 60) if len(self.seconds) else 0.0,
+            'final_backlog': int(self.backlog[-1]) if len(self.backlog) else 0
+        }
+
+def _grade(recalled: np.ndarray, settings: SessionSettings, rng: np.random.Generator) -> np.ndarray:
+    """Pick the difficulty button pressed for each answer."""
+    roll = rng.random(len(recalled))
+    return np.where(
+        recalled,
+        np.where(roll < settings.easy_fraction, QUALITY_EASY, QUALITY_GOOD),
+        np.where(roll < settings.hard_fraction, QUALITY_HARD, QUALITY_AGAIN)
+    )
+
+def simulate(
+    deck: SimulationDeck,
+    days: int,
+    settings: Optional[SessionSettings] = None,
+    recall_model: Optional[RecallModel] = None,
+    start_day: Optional[int] = None,
+    seed: Optional[int] = None
+) -> SimulationResult:
+    """
+    Simulate daily study sessions.
+
+    Each day the due cards are reviewed (most overdue first, up to the
+    review cap), then up to new_per_day new cards are introduced in deck
+    order. Whether an answer is recalled is drawn from the recall model
+    and the resulting grade is applied with the batch SM2 update.
+
+    Args:
+        deck: Initial deck state (left unchanged)
+        days: Number of days to simulate
+        settings: Session limits and timing, defaults to SessionSettings()
+        recall_model: Recall probability model, defaults to ExponentialRecallModel()
+        start_day: Ordinal of the first simulated day, defaults to today
+        seed: Random seed for reproducible runs
+
+    Returns:
+        SimulationResult: Per-day statistics and the final deck state
+    """
+    settings = settings or SessionSettings()
+    recall_model = recall_model or ExponentialRecallModel()
+    start_day = today_ordinal() if start_day is None else start_day
+    rng = np.random.default_rng(seed)
+    state = deck.copy()
+
+    due_day = np.where(state.last_day >= 0, state.last_day + state.interval, np.iinfo(np.int64).max)
+    new_queue = np.flatnonzero(state.last_day < 0)
+    next_new = 0
+
+    result = SimulationResult(
+        reviews=np.zeros(days, dtype=np.int64),
+        new_cards=np.zeros(days, dtype=np.int64),
+        recalled=np.zeros(days, dtype=np.int64),
+        backlog=np.zeros(days, dtype=np.int64),
+        seconds=np.zeros(days)
+    )
+
+    for offset in range(days):
+        day = start_day + offset
+
+        # Due reviews, capped to the most overdue cards
+        due = np.flatnonzero(due_day <= day)
+        cap = settings.max_reviews_per_day
+        if cap is not None and len(due) > cap:
+            due = due[np.argpartition(due_day[due], cap - 1)[:cap]]
+            result.backlog[offset] = np.count_nonzero(due_day <= day) - cap
+
+        # New cards in deck order
+        introduced = new_queue[next_new:next_new + settings.new_per_day]
+        next_new += len(introduced)
+
+        if len(due):
+            elapsed = day - state.last_day[due]
+            probability = recall_model(elapsed, state.interval[due], state.easiness[due])
+            recalled = rng.random(len(due)) < probability
+        else:
+            recalled = np.zeros(0, dtype=bool)
+        first_recalled = rng.random(len(introduced)) < settings.first_recall
+
+        cards = np.concatenate((due, introduced))
+        success = np.concatenate((recalled, first_recalled))
+        updated = calculate_next_reviews(
+            _grade(success, settings, rng),
+            state.easiness[cards], state.interval[cards], state.repetitions[cards],
+            today=day
+        )
+        state.easiness[cards] = updated.easiness
+        state.interval[cards] = updated.interval
+        state.repetitions[cards] = updated.repetitions
+        state.last_day[cards] = day
+        due_day[cards] = updated.due_day
+
+        recalled_count = int(np.count_nonzero(recalled))
+        result.reviews[offset] = len(due)
+        result.new_cards[offset] = len(introduced)
+        result.recalled[offset] = recalled_count
+        result.seconds[offset] = (
+            recalled_count * settings.seconds_per_review +
+            (len(due) - recalled_count) * settings.seconds_per_lapse +
+            len(introduced) * settings.seconds_per_new
+        )
+
+    result.learned = next_new + int(np.count_nonzero(deck.last_day >= 0))
+    result.deck = state
+    return result
+
+def main():
+    """Simulate a synthetic deck from the command line and print a JSON summary."""
+    parser = argparse.ArgumentParser(description="Simulate SM2 review workload and retention.")
+    parser.add_argument('--cards', type=int, default=10000, help="Number of new cards in the deck.")
+    parser.add_argument('--days', type=int, default=365, help="Number of days to simulate.")
+    parser.add_argument('--new-per-day', type=int, default=20, help="New cards introduced per day.")
+    parser.add_argument('--max-reviews', type=int, default=None, help="Cap on reviews per day.")
+    parser.add_argument('--retention', type=float, default=0.9, help="Recall probability at the due day.")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed.")
+    args = parser.parse_args()
+
+    result = simulate(
+        SimulationDeck.synthetic(args.cards),
+        args.days,
+        SessionSettings(new_per_day=args.new_per_day, max_reviews_per_day=args.max_reviews),
+        ExponentialRecallModel(args.retention),
+        seed=args.seed
+    )
+    print(json.dumps(result.summary(), indent=4))
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,8 @@ between reviews based on the learner's performance.
 """
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 
 @dataclass
 class SM2Data:
@@ -89,13 +90,43 @@ def quality_from_difficulty(difficulty: str) -> int:
     }
     return quality_map.get(difficulty, 3)  # Default to 'good' if unknown
 
-def is_due(last_review: str | None, interval: int) -> bool:
+@lru_cache(maxsize=4096)
+def _review_day(last_review: str) -> int:
+    """Parse a review date (YYYY-MM-DD) into a proleptic Gregorian ordinal."""
+    return datetime.strptime(last_review, '%Y-%m-%d').toordinal()
+
+def today_ordinal() -> int:
+    """
+    Get today's date as a proleptic Gregorian ordinal.
+    
+    Returns:
+        int: Ordinal of the current day
+    """
+    return datetime.now().toordinal()
+
+def due_day(last_review: str | None, interval: int) -> int:
+    """
+    Compute the day a card becomes due.
+    
+    Args:
+        last_review: Date of last review (YYYY-MM-DD format)
+        interval: Current interval in days
+        
+    Returns:
+        int: Ordinal of the due day (0 for cards that were never reviewed)
+    """
+    if not last_review:
+        return 0
+    return _review_day(last_review) + interval
+
+def is_due(last_review: str | None, interval: int, today: Optional[int] = None) -> bool:
     """
     Check if a card is due for review.
     
     Args:
         last_review: Date of last review (YYYY-MM-DD format)
         interval: Current interval in days
+        today: Ordinal of the current day, computed if not given
         
     Returns:
         bool: True if card is due for review
@@ -103,6 +134,6 @@ def is_due(last_review: str | None, interval: int) -> bool:
     if not last_review:
         return True
         
-    last_date = datetime.strptime(last_review, '%Y-%m-%d')
-    next_review = last_date + timedelta(days=interval)
-    return datetime.now() >= next_review
\ No newline at end of file
+    if today is None:
+        today = today_ordinal()
+    return today >= due_day(last_review, interval)
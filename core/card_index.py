@@ -0,0 +1,107 @@
+"""
+In-memory indexes over a flashcard collection.
+"""
+from typing import Dict, Iterable, List, Set, Tuple
+from core.flashcard import Flashcard
+
+class CardIndex:
+    """
+    Keeps a category -> cards mapping and a hashed set of (question, answer)
+    keys so that duplicate checks and category lookups are constant-time.
+    """
+
+    def __init__(self, cards: Iterable[Flashcard] = ()):
+        """Initialize the index, optionally from existing cards."""
+        self._by_category: Dict[str, List[Flashcard]] = {}
+        self._keys: Set[Tuple[str, str]] = set()
+        self._unkeyed: List[Flashcard] = []  # Cards added by extend_unique, not yet in _keys
+        self.extend(cards)
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._unkeyed)
+
+    def _build_keys(self) -> None:
+        """Add the keys of cards added without duplicate checks."""
+        if self._unkeyed:
+            self._keys.update((card.question, card.answer) for card in self._unkeyed)
+            self._unkeyed = []
+
+    def add(self, card: Flashcard) -> bool:
+        """
+        Add a card to the index.
+
+        Args:
+            card: Card to index
+
+        Returns:
+            bool: False if a card with the same question and answer was already indexed
+        """
+        self._build_keys()
+        key = (card.question, card.answer)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self._by_category.setdefault(card.category, []).append(card)
+        return True
+
+    def extend(self, cards: Iterable[Flashcard]) -> None:
+        """Add several cards to the index."""
+        for card in cards:
+            self.add(card)
+
+    def extend_unique(self, cards: Iterable[Flashcard]) -> None:
+        """
+        Add cards known to have distinct questions and answers.
+
+        Their keys are built on the first duplicate check, so cards whose
+        text is loaded lazily are not read just to be indexed.
+
+        Args:
+            cards: Cards without duplicates among themselves or the index
+        """
+        cards = list(cards)
+        for card in cards:
+            self._by_category.setdefault(card.category, []).append(card)
+        self._unkeyed.extend(cards)
+
+    def remove(self, card: Flashcard) -> None:
+        """Remove a card from the index if present."""
+        self._build_keys()
+        self._keys.discard((card.question, card.answer))
+        category_cards = self._by_category.get(card.category)
+        if category_cards and card in category_cards:
+            category_cards.remove(card)
+            if not category_cards:
+                del self._by_category[card.category]
+
+    def clear(self) -> None:
+        """Drop all indexed cards."""
+        self._by_category.clear()
+        self._keys.clear()
+        self._unkeyed = []
+
+    def has_key(self, question: str, answer: str) -> bool:
+        """Check whether a card with exactly this question and answer exists."""
+        self._build_keys()
+        return (question, answer) in self._keys
+
+    def has_pair(self, question: str, answer: str) -> bool:
+        """Check whether a card exists for this pair in either direction."""
+        self._build_keys()
+        return (question, answer) in self._keys or (answer, question) in self._keys
+
+    def get_category(self, category: str) -> List[Flashcard]:
+        """
+        Get the cards of a category.
+
+        Args:
+            category: Category name
+
+        Returns:
+            List[Flashcard]: Cards in the category (empty list if unknown)
+        """
+        return self._by_category.get(category, [])
+
+    def categories(self) -> List[str]:
+        """Get the sorted names of all indexed categories."""
+        return sorted(self._by_category)
@@ -0,0 +1,298 @@
+"""
+Columnar storage for large decks.
+"""
+from array import array
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
+from core.flashcard import Flashcard, STORED_FIELDS
+from core.utils.text_processing import AnswerKey
+from core.algorithm.sm2 import due_day
+
+if TYPE_CHECKING:
+    from core.storage.binary_deck import BinaryDeck
+
+@lru_cache(maxsize=4096)
+def _format_day(day: int) -> str:
+    """Format a day ordinal as a review date (YYYY-MM-DD)."""
+    return date.fromordinal(day).strftime('%Y-%m-%d')
+
+class CardStore:
+    """
+    Deck kept as parallel columns instead of one object per card.
+
+    Numeric fields live in typed arrays, review dates as day ordinals and
+    categories as indexes into a table of interned names. Cards are
+    exposed as CardView objects that read and write the columns; a row's
+    view is created on first access and reused, so views can be used as
+    card identities the same way Flashcard objects are.
+    """
+
+    def __init__(self, cards: Iterable[Union[Flashcard, Dict[str, Any]]] = ()):
+        """Initialize the store, optionally from cards or stored card data."""
+        self._questions: List[str] = []
+        self._answers: List[str] = []
+        self._normalized: List[Optional[str]] = []  # Normalized answers, None until built
+        self._category_names: List[str] = []
+        self._category_ids: Dict[str, int] = {}
+        self._categories = array('I')
+        self._intervals = array('i')
+        self._repetitions = array('i')
+        self._scores = array('i')
+        self._easiness = array('d')
+        self._review_days = array('i')  # 0 for cards that were never reviewed
+        self._views: List[Optional['CardView']] = []
+        self.deck: Optional['BinaryDeck'] = None  # Mapped deck file backing the text columns
+        self.extend(cards)
+
+    @classmethod
+    def from_deck(cls, deck: 'BinaryDeck') -> 'CardStore':
+        """
+        Create a store over a mapped binary deck file.
+
+        Scheduling fields are copied into the columns in one pass; card
+        text stays in the file and is decoded when it is accessed.
+
+        Args:
+            deck: Mapped deck file
+
+        Returns:
+            CardStore: Store holding the deck's cards
+        """
+        (questions, answers, normalized, categories, intervals,
+         repetitions, scores, review_days, easiness) = deck.record_columns()
+        store = cls()
+        store.deck = deck
+        store._questions = deck.text_column(questions)
+        store._answers = deck.text_column(answers)
+        store._normalized = deck.text_column(normalized)
+        names = {index: store._category_id(deck.string(index)) for index in set(categories)}
+        store._categories = array('I', map(names.__getitem__, categories))
+        store._intervals = array('i', intervals)
+        store._repetitions = array('i', repetitions)
+        store._scores = array('i', scores)
+        store._easiness = array('d', easiness)
+        store._review_days = array('i', review_days)
+        store._views = [None] * len(questions)
+        return store
+
+    def detach(self) -> None:
+        """Read the mapped deck's text into memory and unmap the file."""
+        if self.deck is None:
+            return
+        self._questions = list(self._questions)
+        self._answers = list(self._answers)
+        self._normalized = [
+            answer if normalized == answer else normalized
+            for normalized, answer in zip(self._normalized, self._answers)
+        ]
+        self.deck.close()
+        self.deck = None
+
+    def is_mapped(self, row: int) -> bool:
+        """Check whether a row is a card of the mapped deck with its stored text unchanged."""
+        return (self.deck is not None and row < len(self.deck) and
+                self._questions.is_mapped(row) and self._answers.is_mapped(row))
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self.view(i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        return self.view(row)
+
+    def __iter__(self) -> Iterator['CardView']:
+        for row in range(len(self)):
+            yield self.view(row)
+
+    def view(self, row: int) -> 'CardView':
+        """Get the view of a row, creating it on first access."""
+        card = self._views[row]
+        if card is None:
+            card = self._views[row] = CardView(self, row)
+        return card
+
+    def _category_id(self, category: str) -> int:
+        """Get the index of an interned category name."""
+        category_id = self._category_ids.get(category)
+        if category_id is None:
+            category_id = self._category_ids[category] = len(self._category_names)
+            self._category_names.append(category)
+        return category_id
+
+    def append(self, card: Union[Flashcard, Dict[str, Any]]) -> 'CardView':
+        """
+        Add a card.
+
+        Args:
+            card: Flashcard or stored card data
+
+        Returns:
+            CardView: View of the added row
+        """
+        if not isinstance(card, Flashcard):
+            card = Flashcard.from_dict(card)
+        self._questions.append(card.question)
+        self._answers.append(card.answer)
+        self._normalized.append(self._share(card.answer, card.answer_key))
+        self._categories.append(self._category_id(card.category))
+        self._intervals.append(card.interval)
+        self._repetitions.append(card.repetitions)
+        self._scores.append(card.score)
+        self._easiness.append(card.easiness)
+        self._review_days.append(due_day(card.last_review, 0))
+        self._views.append(None)
+        return self.view(len(self) - 1)
+
+    @staticmethod
+    def _share(answer: str, key: Optional[AnswerKey]) -> Optional[str]:
+        """Get the normalized answer to keep, reusing the answer string when equal."""
+        if key is None:
+            return None
+        return answer if key.normalized == answer else key.normalized
+
+    def extend(self, cards: Iterable[Union[Flashcard, Dict[str, Any]]]) -> List['CardView']:
+        """Add several cards and return their views."""
+        return [self.append(card) for card in cards]
+
+    def nbytes(self) -> int:
+        """Estimate the memory held by the columns and views."""
+        arrays = (self._categories, self._intervals, self._repetitions,
+                  self._scores, self._easiness, self._review_days)
+        views = sum(1 for card in self._views if card is not None)
+        if self.deck is not None:
+            # Mapped text stays in the file
+            text = sum(column.nbytes() for column in (self._questions, self._answers, self._normalized))
+        else:
+            text = sum(len(q) + len(a) + 98 for q, a in zip(self._questions, self._answers))
+            text += sum(len(n) + 49 for n, a in zip(self._normalized, self._answers) if n is not None and n is not a)
+        return (sum(a.itemsize * len(a) for a in arrays) + 40 * len(self) +
+                CardView.SIZE * views + text)
+
+class CardView:
+    """Card backed by a row of a CardStore, with the interface of Flashcard."""
+
+    __slots__ = ('_store', '_row')
+    # Approximate bytes per view object
+    SIZE = 56
+
+    def __init__(self, store: CardStore, row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def question(self) -> str:
+        return self._store._questions[self._row]
+
+    @question.setter
+    def question(self, value: str) -> None:
+        self._store._questions[self._row] = value
+
+    @property
+    def answer(self) -> str:
+        return self._store._answers[self._row]
+
+    @answer.setter
+    def answer(self, value: str) -> None:
+        self._store._answers[self._row] = value
+        self._store._normalized[self._row] = None
+
+    @property
+    def category(self) -> str:
+        return self._store._category_names[self._store._categories[self._row]]
+
+    @category.setter
+    def category(self, value: str) -> None:
+        self._store._categories[self._row] = self._store._category_id(value)
+
+    @property
+    def interval(self) -> int:
+        return self._store._intervals[self._row]
+
+    @interval.setter
+    def interval(self, value: int) -> None:
+        self._store._intervals[self._row] = value
+
+    @property
+    def last_review(self) -> Optional[str]:
+        day = self._store._review_days[self._row]
+        return _format_day(day) if day else None
+
+    @last_review.setter
+    def last_review(self, value: Optional[str]) -> None:
+        self._store._review_days[self._row] = due_day(value, 0)
+
+    @property
+    def repetitions(self) -> int:
+        return self._store._repetitions[self._row]
+
+    @repetitions.setter
+    def repetitions(self, value: int) -> None:
+        self._store._repetitions[self._row] = value
+
+    @property
+    def easiness(self) -> float:
+        return self._store._easiness[self._row]
+
+    @easiness.setter
+    def easiness(self, value: float) -> None:
+        self._store._easiness[self._row] = value
+
+    @property
+    def score(self) -> int:
+        return self._store._scores[self._row]
+
+    @score.setter
+    def score(self, value: int) -> None:
+        self._store._scores[self._row] = value
+
+    @property
+    def answer_key(self) -> Optional[AnswerKey]:
+        normalized = self._store._normalized[self._row]
+        return AnswerKey(normalized) if normalized is not None else None
+
+    @property
+    def due_day(self) -> int:
+        """Ordinal of the day this card becomes due (0 if never reviewed)."""
+        day = self._store._review_days[self._row]
+        return day + self._store._intervals[self._row] if day else 0
+
+    def get_answer_key(self) -> AnswerKey:
+        """Get the comparison key of the answer, building it on first use."""
+        key = self.answer_key
+        if key is None:
+            key = AnswerKey.build(self.answer)
+            self._store._normalized[self._row] = self._store._share(self.answer, key)
+        return key
+
+    # Same grading and SM2 update as Flashcard, applied through the column accessors
+    get_answer_language = Flashcard.get_answer_language
+    check_answer = Flashcard.check_answer
+    grade_answer = Flashcard.grade_answer
+    prepare_answer = Flashcard.prepare_answer
+    update_review = Flashcard.update_review
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the card data for storage."""
+        data = {name: getattr(self, name) for name in STORED_FIELDS}
+        data['answer_key'] = self.get_answer_key().to_dict()
+        return data
+
+    def to_flashcard(self) -> Flashcard:
+        """Copy the row into a standalone Flashcard."""
+        return Flashcard(answer_key=self.answer_key, **{name: getattr(self, name) for name in STORED_FIELDS})
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (CardView, Flashcard)):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in STORED_FIELDS)
+
+    # Mutable like Flashcard, so unhashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in STORED_FIELDS)
+        return f"CardView({values})"
@@ -0,0 +1,362 @@
+"""
+Process-wide cache of lazily loaded decks shared across screens.
+"""
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from core.card_store import CardStore
+from core.flashcard import Flashcard
+from core.manager import FlashcardManager, DEFAULT_STORAGE_PATH
+from core.search_index import SearchIndex
+from core.storage import CategorySummary, StorageBackend, JsonStorageBackend
+
+# Rough per-card cost of the Flashcard object, its __dict__ and index entries
+CARD_OVERHEAD_BYTES = 600
+
+def estimate_deck_bytes(cards: Sequence[Flashcard]) -> int:
+    """
+    Estimate the memory held by a loaded deck.
+
+    Args:
+        cards: Cards of the deck
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    if isinstance(cards, CardStore):
+        return cards.nbytes()
+    text_bytes = sum(sys.getsizeof(card.question) + sys.getsizeof(card.answer) for card in cards)
+    return text_bytes + CARD_OVERHEAD_BYTES * len(cards)
+
+def pair_hashes(pairs: Iterable[Tuple[str, str]]) -> array:
+    """Get the sorted hashes of (question, answer) pairs."""
+    return array('q', sorted(hash(pair) for pair in pairs))
+
+def _contains(hashes: array, value: int) -> bool:
+    """Check a sorted hash array for a value."""
+    index = bisect_left(hashes, value)
+    return index < len(hashes) and hashes[index] == value
+
+class DeckCache:
+    """
+    Loads each category on first access and shares one manager per category.
+
+    Entries are invalidated when the category's storage signature (file mtime
+    and size for JSON decks) changes behind the cache's back, and the least
+    recently used categories are evicted once the estimated memory of the
+    loaded decks exceeds memory_budget. Decks are kept in columnar CardStores.
+
+    Categories pinned by a screen that holds their manager are never
+    evicted, so no second manager for them is loaded while it is in use.
+    Duplicate checks of decks that are not loaded use the hashes of their
+    stored card pairs instead of loading them.
+    """
+
+    def __init__(self, storage_path: Optional[str] = None,
+                 backend: Optional[StorageBackend] = None,
+                 memory_budget: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            storage_path: Directory of the deck files, defaults to ./storage
+            backend: Storage backend shared by all cached decks
+            memory_budget: Estimated bytes of loaded decks to keep before evicting
+        """
+        self.storage_path = storage_path or DEFAULT_STORAGE_PATH
+        self.backend = backend or JsonStorageBackend(self.storage_path)
+        self.memory_budget = memory_budget
+        self._lock = threading.RLock()
+        self._decks: 'OrderedDict[str, FlashcardManager]' = OrderedDict()
+        self._signatures: Dict[str, Optional[Tuple]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._loading: Dict[str, threading.Event] = {}  # Categories being read
+        self._pins: Dict[str, int] = {}  # Categories in use -> pin count
+        # Categories not loaded -> (signature, sorted hashes of their card pairs);
+        # a None signature marks hashes of an evicted deck whose flush is pending
+        self._pairs: Dict[str, Tuple[Optional[Tuple], array]] = {}
+        self._categories: Optional[List[str]] = None
+        self._categories_signature: Optional[Tuple] = None
+        self._search_index: Optional[SearchIndex] = None
+
+    def categories(self) -> List[str]:
+        """Get the sorted names of all stored categories."""
+        with self._lock:
+            signature = self.backend.storage_signature()
+            if self._categories is None or signature is None or signature != self._categories_signature:
+                self._categories = self.backend.list_categories()
+                self._categories_signature = signature
+            # Include loaded decks whose first write is still pending
+            loaded = {category for category, manager in self._decks.items() if manager.cards}
+            return sorted(loaded.union(self._categories))
+
+    def category_summaries(self) -> List[CategorySummary]:
+        """
+        Get card counts for every category.
+
+        Counts come from the backend, except for loaded decks with changes
+        that have not been flushed yet.
+
+        Returns:
+            List[CategorySummary]: Summaries sorted by category name
+        """
+        summaries = {summary.category: summary for summary in self.backend.category_summaries()}
+        with self._lock:
+            for category, manager in self._decks.items():
+                if manager.has_unsaved_changes() or (category not in summaries and manager.cards):
+                    summaries[category] = CategorySummary.from_cards(category, manager.cards)
+        return [summaries[category] for category in sorted(summaries)]
+
+    def get_manager(self, category: str,
+                    progress: Optional[Callable[[int, int], None]] = None) -> FlashcardManager:
+        """
+        Get the shared manager of a category, loading it if needed.
+
+        Safe to call from a worker thread. The deck is read without holding
+        the cache lock; concurrent callers for the same category wait for
+        that load, and a failed or cancelled load is retried by the next one.
+
+        Args:
+            category: Category name
+            progress: Called with (cards read, cards stored) if the deck is loaded
+
+        Returns:
+            FlashcardManager: Manager holding the category's cards
+        """
+        while True:
+            with self._lock:
+                manager = self._decks.get(category)
+                if manager is not None:
+                    signature = self.backend.category_signature(category)
+                    if signature is None or signature == self._signatures.get(category) \
+                            or manager.has_unsaved_changes():
+                        self._decks.move_to_end(category)
+                        return manager
+                    # Changed on disk by another writer; reload below
+                loading = self._loading.get(category)
+                if loading is None:
+                    loading = self._loading[category] = threading.Event()
+                    break
+            # Another caller is loading this category; use its deck once read
+            loading.wait()
+        try:
+            # Read without the lock so other categories stay available meanwhile
+            manager = self._load(category, progress)
+            with self._lock:
+                self._add(category, manager)
+                evicted = self._pop_over_budget(keep=category)
+        finally:
+            with self._lock:
+                del self._loading[category]
+            loading.set()
+        # Flush outside the lock: flushing notifies _on_saved from the flusher thread
+        for old_manager in evicted:
+            self._flushed(old_manager.category, old_manager)
+        return manager
+
+    def _load(self, category: str,
+              progress: Optional[Callable[[int, int], None]] = None) -> FlashcardManager:
+        """Read a category's deck into a new manager."""
+        manager = FlashcardManager(
+            storage_path=self.storage_path, category=category,
+            backend=self.backend, write_behind=True, compact=True, progress=progress
+        )
+        manager.add_save_listener(self._on_saved)
+        manager.add_card_listener(self._on_cards_added)
+        return manager
+
+    def _add(self, category: str, manager: FlashcardManager) -> None:
+        """Put a loaded manager into the cache (called with the lock held)."""
+        if self._search_index is not None:
+            self._search_index.remove_category(category)
+            self._search_index.add_cards(manager.cards)
+        self._decks[category] = manager
+        self._decks.move_to_end(category)
+        self._pairs.pop(category, None)
+        self._signatures[category] = self.backend.category_signature(category)
+        self._sizes[category] = estimate_deck_bytes(manager.cards)
+
+    def _on_saved(self, category: str) -> None:
+        """Accept our own writes as the category's current signature."""
+        with self._lock:
+            if category in self._decks:
+                self._signatures[category] = self.backend.category_signature(category)
+                self._sizes[category] = estimate_deck_bytes(self._decks[category].cards)
+
+    def _on_cards_added(self, cards: List[Flashcard]) -> None:
+        """Keep the search index current when cards are added."""
+        if self._search_index is not None:
+            self._search_index.add_cards(cards)
+
+    def search_index(self) -> SearchIndex:
+        """
+        Get the search index over all categories, building it on first use.
+
+        Returns:
+            SearchIndex: Index kept current as decks are added to or reloaded
+        """
+        with self._lock:
+            if self._search_index is not None:
+                return self._search_index
+        # Build without holding the lock; loading may flush evicted decks
+        index = SearchIndex()
+        for category in self.categories():
+            index.add_cards(self.get_manager(category).cards)
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = index
+            return self._search_index
+
+    def _pop_over_budget(self, keep: str) -> List[FlashcardManager]:
+        """Remove least recently used, unpinned decks until the memory budget is met."""
+        evicted = []
+        total = sum(self._sizes.values())
+        for category in list(self._decks):
+            if total <= self.memory_budget or len(self._decks) <= 1:
+                break
+            if category == keep or category in self._pins:
+                continue
+            evicted.append(self._pop(category))
+            total = sum(self._sizes.values())
+        return evicted
+
+    def _pop(self, category: str) -> FlashcardManager:
+        """Remove a loaded deck, keeping its pair hashes for duplicate checks (lock held)."""
+        manager = self._decks.pop(category)
+        self._signatures.pop(category, None)
+        self._sizes.pop(category, None)
+        self._pairs[category] = (None, pair_hashes((card.question, card.answer) for card in manager.cards))
+        return manager
+
+    def _flushed(self, category: str, manager: FlashcardManager) -> None:
+        """Flush an evicted deck and accept the written file for its pair hashes."""
+        manager.flush()
+        with self._lock:
+            entry = self._pairs.get(category)
+            if entry is not None and entry[0] is None:
+                self._pairs[category] = (self.backend.category_signature(category), entry[1])
+
+    def _stored_pairs(self, category: str) -> array:
+        """Get the pair hashes of a deck that is not loaded, reading it if they are stale."""
+        signature = self.backend.category_signature(category)
+        with self._lock:
+            entry = self._pairs.get(category)
+            if entry is not None and (entry[0] is None or (signature is not None and entry[0] == signature)):
+                return entry[1]
+        hashes = pair_hashes((data.get('question', ''), data.get('answer', ''))
+                             for data in self.backend.load_category(category))
+        with self._lock:
+            if category not in self._decks:
+                self._pairs[category] = (signature, hashes)
+        return hashes
+
+    def pin(self, category: str) -> None:
+        """
+        Keep a category loaded while its manager is in use.
+
+        Args:
+            category: Category name
+        """
+        with self._lock:
+            self._pins[category] = self._pins.get(category, 0) + 1
+
+    def unpin(self, category: str) -> None:
+        """
+        Release a pin taken with pin().
+
+        Args:
+            category: Category name
+        """
+        with self._lock:
+            count = self._pins.get(category, 0) - 1
+            if count > 0:
+                self._pins[category] = count
+            else:
+                self._pins.pop(category, None)
+
+    def evict(self, category: str) -> None:
+        """
+        Remove a category from the cache after writing its pending changes.
+
+        Pinned categories stay loaded.
+
+        Args:
+            category: Category name
+        """
+        with self._lock:
+            if category not in self._decks or category in self._pins:
+                return
+            manager = self._pop(category)
+        self._flushed(category, manager)
+
+    def loaded_categories(self) -> List[str]:
+        """Get the currently loaded categories, least recently used first."""
+        with self._lock:
+            return list(self._decks)
+
+    def all_cards(self) -> List[Flashcard]:
+        """Get the cards of every category, loading categories as needed."""
+        cards = []
+        for category in self.categories():
+            cards.extend(self.get_manager(category).cards)
+        return cards
+
+    def is_duplicate(self, question: str, answer: str) -> bool:
+        """
+        Check all categories for a card with this pair in either direction.
+
+        Loaded decks are checked in memory and the others by the hashes of
+        their stored pairs, so checks do not load decks into the cache.
+        """
+        keys = (hash((question, answer)), hash((answer, question)))
+        for category in self.categories():
+            with self._lock:
+                manager = self._decks.get(category)
+            if manager is not None:
+                if manager._is_duplicate(question, answer):
+                    return True
+            elif any(_contains(self._stored_pairs(category), key) for key in keys):
+                return True
+        return False
+
+    def add_card(self, question: str, answer: str, category: str) -> bool:
+        """
+        Add a card pair to a category unless it exists in any category.
+
+        Args:
+            question: Question text
+            answer: Answer text
+            category: Target category, created if new
+
+        Returns:
+            bool: False if the card already exists
+        """
+        if self.is_duplicate(question, answer):
+            return False
+        return self.get_manager(category).add_card(question, answer, category)
+
+    def flush(self) -> None:
+        """Write pending changes of all loaded categories."""
+        with self._lock:
+            managers = list(self._decks.values())
+        for manager in managers:
+            manager.flush()
+
+_shared_cache: Optional[DeckCache] = None
+_shared_lock = threading.Lock()
+
+def get_deck_cache() -> DeckCache:
+    """
+    Get the process-wide deck cache, creating it on first use.
+
+    Returns:
+        DeckCache: The shared cache
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = DeckCache()
+        return _shared_cache
@@ -2,11 +2,21 @@
 Core flashcard model implementation.
 """
 from datetime import datetime
-from dataclasses import dataclass
-from core.utils.text_processing import normalize_text, compare_answers
-from core.algorithm.sm2 import SM2Data, calculate_next_review, quality_from_difficulty
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional
+from core.utils.text_processing import (
+    AnswerKey, AnswerVerdict, grade_answer, grade_answer_key, normalize_answer
+)
+from core.utils.text_processing.folding import card_answer_language
+from core.algorithm.sm2 import SM2Data, calculate_next_review, quality_from_difficulty, due_day
 
-@dataclass
+# Card fields written to storage, in order (answer_key is stored separately)
+STORED_FIELDS = (
+    'question', 'answer', 'category', 'interval',
+    'last_review', 'repetitions', 'easiness', 'score'
+)
+
+@dataclass(slots=True)
 class Flashcard:
     """Represents a single flashcard with question, answer, and review data."""
     
@@ -18,10 +28,71 @@ class Flashcard:
     repetitions: int = 0
     easiness: float = 2.5
     score: int = 0
+    # Cached comparison forms of the answer, stored with the deck
+    answer_key: Optional[AnswerKey] = field(default=None, compare=False, repr=False)
+    _key_answer: Optional[str] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        # Answer text the cached key was built for
+        self._key_answer = self.answer if self.answer_key is not None else None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Flashcard':
+        """
+        Create a card from stored data, ignoring unknown keys.
+        
+        Args:
+            data: Card data as stored in a deck file
+            
+        Returns:
+            Flashcard: The restored card
+        """
+        values = {key: value for key, value in data.items() if key in INIT_FIELDS}
+        if 'answer_key' in values:
+            values['answer_key'] = AnswerKey.from_dict(values['answer_key'])
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the card data for storage."""
+        data = {name: getattr(self, name) for name in STORED_FIELDS}
+        data['answer_key'] = self.get_answer_key().to_dict()
+        return data
+
+    def get_answer_key(self) -> AnswerKey:
+        """Get the comparison key of the answer, rebuilding it if stale."""
+        if self.answer_key is None or self._key_answer != self.answer:
+            self.answer_key = AnswerKey.build(self.answer)
+            self._key_answer = self.answer
+        return self.answer_key
+
+    @property
+    def due_day(self) -> int:
+        """Ordinal of the day this card becomes due (0 if never reviewed)."""
+        return due_day(self.last_review, self.interval)
+
+    def get_answer_language(self) -> Optional[str]:
+        """Get the folding language of the answer, if the category selects languages."""
+        return card_answer_language(self.category, self.question, self.answer)
 
     def check_answer(self, user_answer: str) -> bool:
         """Check if the user's answer matches the correct answer."""
-        return compare_answers(user_answer, self.answer)
+        return self.grade_answer(user_answer, tolerate_typos=False) is AnswerVerdict.CORRECT
+
+    def grade_answer(self, user_answer: str, tolerate_typos: bool = True) -> AnswerVerdict:
+        """Grade the user's answer, optionally accepting small typos."""
+        language = self.get_answer_language()
+        if language is None:
+            # Only the input is normalized; the card caches its answer key
+            return grade_answer_key(user_answer, self.get_answer_key(), tolerate_typos)
+        return grade_answer(user_answer, self.answer, language, tolerate_typos)
+
+    def prepare_answer(self) -> None:
+        """Build and cache the normalized answer ahead of grading."""
+        language = self.get_answer_language()
+        if language is None:
+            self.get_answer_key()
+        else:
+            normalize_answer(self.answer, language)
 
     def update_review(self, difficulty: str) -> None:
         """
@@ -51,4 +122,7 @@ class Flashcard:
         if quality >= 4:
             self.score += 1
         elif quality <= 2:
-            self.score = max(0, self.score - 1)
\ No newline at end of file
+            self.score = max(0, self.score - 1)
+
+# Constructor arguments of Flashcard, for filtering stored card data
+INIT_FIELDS = frozenset(f.name for f in fields(Flashcard) if f.init)
@@ -1,63 +1,192 @@
 """
 Flashcard management system implementation.
 """
+import json
 import os
-from typing import List, Optional
+import threading
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Set
 from core.flashcard import Flashcard
-from core.utils.file_handler import ensure_storage_dir, load_json_file, save_json_file
-from core.utils.text_formatter import format_category_filename
-from core.algorithm.sm2 import is_due
+from core.card_index import CardIndex
+from core.card_store import CardStore
+from core.scheduler import DueScheduler
+from core.storage import StorageBackend, JsonStorageBackend, WriteBehindFlusher
+from core.tracing import span
+from core.utils.file_handler import write_file_atomic
+from core.utils.text_processing import (
+    add_answer_sides, clear_answer_sides, get_category_languages, set_category_languages
+)
+
+DEFAULT_STORAGE_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'storage')
+# Folding languages selected per category, stored next to the decks
+LANGUAGES_FILENAME = 'categories.languages'
+# Cards built between two load progress reports
+PROGRESS_STEP = 500
 
 class FlashcardManager:
     """Manages flashcard operations and persistence."""
     
-    def __init__(self, storage_path: Optional[str] = None, category: Optional[str] = None):
-        """Initialize the flashcard manager."""
+    def __init__(self, storage_path: Optional[str] = None, category: Optional[str] = None,
+                 backend: Optional[StorageBackend] = None, write_behind: bool = False,
+                 flush_delay: float = 2.0, compact: bool = False,
+                 progress: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize the flashcard manager.
+        
+        Args:
+            storage_path: Directory of the deck files, defaults to ./storage
+            category: Only load and save this category if given
+            backend: Storage backend, defaults to JSON files in storage_path
+            write_behind: Coalesce saves into a delayed background flush
+            flush_delay: Seconds between the first unsaved change and its flush
+            compact: Keep cards in a columnar CardStore instead of Flashcard objects
+            progress: Called with (cards read, cards stored) while loading; an
+                exception raised by it aborts the load
+        """
         self.category = category
-        self.storage_path = storage_path or os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 'storage'
-        )
-        ensure_storage_dir(self.storage_path)
+        self.compact = compact
+        self.storage_path = storage_path or DEFAULT_STORAGE_PATH
+        self.backend = backend or JsonStorageBackend(self.storage_path)
+        self.index = CardIndex()
+        self._schedulers: Dict[str, DueScheduler] = {}
+        self._lock = threading.RLock()
+        self._pending: Dict[str, Dict[int, Flashcard]] = {}  # Unsaved changed cards
+        self._full_saves: Set[str] = set()  # Categories to rewrite completely
+        self._save_listeners: List[Callable[[str], None]] = []
+        self._card_listeners: List[Callable[[List[Flashcard]], None]] = []
+        self._flusher = WriteBehindFlusher(self._write_category, flush_delay) if write_behind else None
+        self._progress = progress
+        self._load_category_languages()
         self.cards = self._load_cards()
+        self._progress = None
 
-    def _load_cards(self) -> List[Flashcard]:
+    def _load_cards(self) -> Sequence[Flashcard]:
         """Load flashcards from storage."""
-        cards = []
-        seen_cards = set()  # Track unique cards to prevent duplicates
+        with span('load_cards', 'load', category=self.category,
+                  backend=type(self.backend).__name__):
+            cards = self._read_cards()
+        for category in ([self.category] if self.category else self.index.categories()):
+            self._record_answer_sides(category)
+        return cards
+
+    def _record_answer_sides(self, category: str) -> None:
+        """Record the answer sides of a category's cards if it selects folding languages."""
+        clear_answer_sides(category)
+        if get_category_languages(category):
+            add_answer_sides(category, (
+                (card.question, card.answer) for card in self.index.get_category(category)
+            ))
+
+    def _read_cards(self) -> Sequence[Flashcard]:
+        """Read the cards of the manager's category, or all cards, from the backend."""
+        self.index.clear()
+        self._schedulers.clear()
+        if self.compact and self.category:
+            # Memory-mapped decks are written from an index, so hold no duplicates
+            mapped = self.backend.map_category(self.category)
+            if mapped is not None:
+                self.index.extend_unique(mapped)
+                self._report_progress(len(mapped), len(mapped))
+                return mapped
+        cards = CardStore() if self.compact else []
         
-        # If category is specified, only load that category's file
+        # If category is specified, only load that category's cards
         if self.category:
-            filename = format_category_filename(self.category) + '.json'
-            file_path = os.path.join(self.storage_path, filename)
-            if os.path.exists(file_path):
-                data = load_json_file(file_path)
-                for card_data in data:
-                    card_id = f"{card_data.get('question')}:{card_data.get('answer')}"
-                    if card_id not in seen_cards:
-                        cards.append(Flashcard(**card_data))
-                        seen_cards.add(card_id)
-            return cards
-        
-        # If no category specified, load all files
-        for file in os.listdir(self.storage_path):
-            if file.endswith('.json'):
-                file_path = os.path.join(self.storage_path, file)
-                data = load_json_file(file_path)
-                for card_data in data:
-                    card_id = f"{card_data.get('question')}:{card_data.get('answer')}"
-                    if card_id not in seen_cards:
-                        cards.append(Flashcard(**card_data))
-                        seen_cards.add(card_id)
+            stored = self.backend.load_category(self.category)
+        else:
+            stored = self.backend.load_all()
+            
+        total = len(stored)
+        self._report_progress(0, total)
+        for done, card_data in enumerate(stored, 1):
+            if done % PROGRESS_STEP == 0:
+                self._report_progress(done, total)
+            card = Flashcard.from_dict(card_data)
+            # Skip cards already seen with the same question and answer
+            if self.index.has_key(card.question, card.answer):
+                continue
+            if self.compact:
+                card = cards.append(card)
+            else:
+                cards.append(card)
+            self.index.add(card)
+        self._report_progress(total, total)
         return cards
 
+    def _report_progress(self, done: int, total: int) -> None:
+        """Pass load progress to the progress callback, if any."""
+        if self._progress is not None:
+            self._progress(done, total)
+
+    def _languages_path(self) -> str:
+        """Get the path of the category languages file."""
+        return os.path.join(self.storage_path, LANGUAGES_FILENAME)
+
+    def _read_category_languages(self) -> Dict[str, List[str]]:
+        """Read the category languages file."""
+        try:
+            with open(self._languages_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load_category_languages(self) -> None:
+        """Select the stored folding languages of the categories."""
+        for category, languages in self._read_category_languages().items():
+            try:
+                set_category_languages(category, languages)
+            except ValueError:
+                continue  # Profile no longer available
+
+    def set_category_languages(self, category: str, languages: Optional[Sequence[str]]) -> bool:
+        """
+        Select the languages of a category's card sides for answer checking.
+        
+        Args:
+            category: Category name
+            languages: Folding profile names, e.g. ('de', 'hu'), or None
+                for the language-independent folding
+            
+        Returns:
+            bool: True if the selection was saved
+            
+        Raises:
+            ValueError: If a language has no folding profile
+        """
+        set_category_languages(category, languages)
+        if self._owns_category(category):
+            self._record_answer_sides(category)
+        data = self._read_category_languages()
+        if get_category_languages(category):
+            data[category] = list(languages)
+        else:
+            data.pop(category, None)
+        return write_file_atomic(self._languages_path(), json.dumps(data, ensure_ascii=False, indent=4))
+
+    def get_categories(self) -> List[str]:
+        """Get the sorted names of all loaded categories."""
+        return self.index.categories()
+
+    def _get_scheduler(self, category: str) -> DueScheduler:
+        """Get the due-date scheduler of a category, building it on first use."""
+        scheduler = self._schedulers.get(category)
+        if scheduler is None:
+            scheduler = DueScheduler(self.index.get_category(category))
+            self._schedulers[category] = scheduler
+        return scheduler
+
     def get_due_cards(self, category: str) -> List[Flashcard]:
         """Get due cards for a specific category."""
-        # Filter cards by category and due status
-        category_cards = [
-            card for card in self.cards 
-            if card.category == category and is_due(card.last_review, card.interval)
-        ]
-        return category_cards
+        return self._get_scheduler(category).due_cards()
+
+    def get_next_due_cards(self, category: str, count: int) -> List[Flashcard]:
+        """Get the next cards to become due in a category, due or not."""
+        return self._get_scheduler(category).next_due(count)
+
+    def time_until_next_due(self, category: str) -> Optional[timedelta]:
+        """Get the time until the next card of a category becomes due."""
+        return self._get_scheduler(category).time_until_next_due()
 
     def add_card(self, question: str, answer: str, category: str) -> bool:
         """Add a new flashcard."""
@@ -68,27 +197,119 @@ class FlashcardManager:
         new_card = Flashcard(question=question, answer=answer, category=category)
         reverse_card = Flashcard(question=answer, answer=question, category=category)
         
-        self.cards.extend([new_card, reverse_card])
-        self.save_cards()
+        if self.compact:
+            new_card, reverse_card = self.cards.extend([new_card, reverse_card])
+        else:
+            self.cards.extend([new_card, reverse_card])
+        self.index.extend([new_card, reverse_card])
+        if get_category_languages(category):
+            add_answer_sides(category, [(question, answer), (answer, question)])
+        for callback in self._card_listeners:
+            callback([new_card, reverse_card])
+        if category in self._schedulers:
+            self._schedulers[category].add(new_card)
+            self._schedulers[category].add(reverse_card)
+        self._persist(category, [new_card, reverse_card])
         return True
 
-    def save_cards(self) -> None:
-        """Save flashcards to storage."""
-        if not self.category:
-            return  # Don't save if no category specified
+    def review_card(self, card: Flashcard, difficulty: str) -> None:
+        """
+        Apply a review rating to a card and persist it.
+        
+        Args:
+            card: Card that was reviewed
+            difficulty: User-rated difficulty ('again', 'hard', 'good', 'easy')
+        """
+        card.update_review(difficulty)
+        if card.category in self._schedulers:
+            self._schedulers[card.category].reschedule(card)
+        self._persist(card.category, [card])
+
+    def add_save_listener(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback run with the category name after each write.
+        
+        Args:
+            callback: Function called after a category was written to storage
+        """
+        self._save_listeners.append(callback)
+
+    def add_card_listener(self, callback: Callable[[List[Flashcard]], None]) -> None:
+        """
+        Register a callback run with the new cards after each addition.
+        
+        Args:
+            callback: Function called with the cards created by add_card
+        """
+        self._card_listeners.append(callback)
+
+    def _notify_saved(self, category: str) -> None:
+        """Run the save listeners for a written category."""
+        for callback in self._save_listeners:
+            callback(category)
+
+    def _owns_category(self, category: str) -> bool:
+        """Check whether all cards of a category are loaded in this manager."""
+        return self.category is None or self.category == category
+
+    def _persist(self, category: str, changed: Sequence[Flashcard]) -> None:
+        """Write added or reviewed cards of a category to storage."""
+        if not self._owns_category(category):
+            return  # Saving would drop the cards this manager did not load
+        if self._flusher is None:
+            if self.backend.save_cards(category, changed, self.index.get_category(category)):
+                self._notify_saved(category)
+            return
             
-        filename = format_category_filename(self.category) + '.json'
-        file_path = os.path.join(self.storage_path, filename)
+        with self._lock:
+            pending = self._pending.setdefault(category, {})
+            for card in changed:
+                pending[id(card)] = card
+        self._flusher.mark_dirty(category)
+
+    def save_cards(self, category: Optional[str] = None) -> None:
+        """
+        Save flashcards to storage.
         
-        # Only save cards belonging to this category
-        category_cards = [card for card in self.cards if card.category == self.category]
-        cards_data = [vars(card) for card in category_cards]
-        save_json_file(file_path, cards_data)
+        Args:
+            category: Category to save, defaults to the manager's category
+        """
+        category = category or self.category
+        if not category or not self._owns_category(category):
+            return  # Don't save if no category specified
+        if self._flusher is None:
+            if self.backend.save_category(category, self.index.get_category(category)):
+                self._notify_saved(category)
+            return
+            
+        with self._lock:
+            self._full_saves.add(category)
+        self._flusher.mark_dirty(category)
+
+    def _write_category(self, category: str) -> None:
+        """Write the pending changes of a category (called by the flusher)."""
+        with self._lock:
+            changed = list(self._pending.pop(category, {}).values())
+            category_cards = self.index.get_category(category)
+            if category in self._full_saves:
+                self._full_saves.discard(category)
+                saved = self.backend.save_category(category, category_cards)
+            elif changed:
+                saved = self.backend.save_cards(category, changed, category_cards)
+            else:
+                return
+        if saved:
+            self._notify_saved(category)
+
+    def has_unsaved_changes(self) -> bool:
+        """Check whether changes are waiting for a write-behind flush."""
+        return bool(self._flusher and self._flusher.dirty)
+
+    def flush(self) -> None:
+        """Write pending write-behind changes immediately."""
+        if self._flusher is not None:
+            self._flusher.flush()
 
     def _is_duplicate(self, question: str, answer: str) -> bool:
         """Check for duplicate cards."""
-        return any(
-            (card.question == question and card.answer == answer) or
-            (card.question == answer and card.answer == question)
-            for card in self.cards
-        )
\ No newline at end of file
+        return self.index.has_pair(question, answer)
@@ -0,0 +1,146 @@
+"""
+Due-date priority queue for scheduling flashcard reviews.
+"""
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from core.flashcard import Flashcard
+from core.algorithm.sm2 import today_ordinal
+
+class DueScheduler:
+    """
+    Min-heap of cards keyed by their precomputed due day.
+
+    reschedule() must be called whenever a card's review data changes;
+    FlashcardManager.review_card does so for every review. It pushes a
+    fresh heap entry, and outdated entries are discarded lazily when they
+    reach the top of the heap, so results are exact under that contract.
+
+    As a safety net, an entry whose card was reviewed without reschedule()
+    is re-queued under the card's current due day when it reaches the top.
+    This only repairs cards whose due day moved later: a card moved
+    earlier keeps its old position until reschedule() is called.
+    """
+
+    def __init__(self, cards: Iterable[Flashcard] = ()):
+        """Initialize the scheduler, optionally from existing cards."""
+        self._counter = itertools.count()
+        self._keys: Dict[int, int] = {}  # id(card) -> due day of its live entry
+        self._heap: List[Tuple[int, int, Flashcard]] = []
+        for card in cards:
+            day = card.due_day
+            self._keys[id(card)] = day
+            self._heap.append((day, next(self._counter), card))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, card: Flashcard) -> None:
+        """Add a card, or re-key it if it is already scheduled."""
+        self.reschedule(card)
+
+    def reschedule(self, card: Flashcard) -> None:
+        """
+        Re-key a card after its review data changed.
+
+        Pushes a new entry whenever the card's due day differs from its
+        current key, whether the day moved earlier or later.
+
+        Args:
+            card: Card whose due day should be refreshed
+        """
+        day = card.due_day
+        if self._keys.get(id(card)) == day:
+            return
+        self._keys[id(card)] = day
+        heapq.heappush(self._heap, (day, next(self._counter), card))
+        if len(self._heap) > 2 * len(self._keys) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop superseded heap entries."""
+        self._heap = [
+            entry for entry in self._heap
+            if self._keys.get(id(entry[2])) == entry[0]
+        ]
+        heapq.heapify(self._heap)
+
+    def remove(self, card: Flashcard) -> None:
+        """Stop scheduling a card."""
+        self._keys.pop(id(card), None)
+
+    def _pop_live(self) -> Optional[Tuple[int, int, Flashcard]]:
+        """Pop the next entry that is still current, re-keying stale cards."""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            day, _, card = entry
+            if self._keys.get(id(card)) != day:
+                continue  # Superseded by a newer entry or removed
+            current_day = card.due_day
+            if current_day != day:
+                # Reviewed without reschedule(); queue under its real key
+                self._keys[id(card)] = current_day
+                heapq.heappush(self._heap, (current_day, next(self._counter), card))
+                continue
+            return entry
+        return None
+
+    def _take(self, limit: Optional[int], max_day: Optional[int]) -> List[Flashcard]:
+        """Collect cards in due order without removing them from the schedule."""
+        taken = []
+        while limit is None or len(taken) < limit:
+            entry = self._pop_live()
+            if entry is None:
+                break
+            if max_day is not None and entry[0] > max_day:
+                heapq.heappush(self._heap, entry)
+                break
+            taken.append(entry)
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+        return [card for _, _, card in taken]
+
+    def due_cards(self, today: Optional[int] = None) -> List[Flashcard]:
+        """
+        Get all cards due on or before a day, most overdue first.
+
+        Args:
+            today: Ordinal of the current day, computed if not given
+
+        Returns:
+            List[Flashcard]: Due cards
+        """
+        if today is None:
+            today = today_ordinal()
+        return self._take(None, today)
+
+    def next_due(self, count: int) -> List[Flashcard]:
+        """
+        Get the next cards to become due, whether or not they are due yet.
+
+        Args:
+            count: Maximum number of cards to return
+
+        Returns:
+            List[Flashcard]: Up to count cards in due order
+        """
+        return self._take(count, None)
+
+    def time_until_next_due(self, now: Optional[datetime] = None) -> Optional[timedelta]:
+        """
+        Get the time left until the next card becomes due.
+
+        Args:
+            now: Current time, defaults to datetime.now()
+
+        Returns:
+            Optional[timedelta]: Zero if a card is already due, None if nothing is scheduled
+        """
+        upcoming = self.next_due(1)
+        if not upcoming:
+            return None
+        now = now or datetime.now()
+        due_at = datetime.fromordinal(max(upcoming[0].due_day, 1))
+        return max(due_at - now, timedelta(0))
@@ -0,0 +1,328 @@
+"""
+Inverted trigram index for searching card questions and answers.
+"""
+import heapq
+import threading
+import unicodedata
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from core.flashcard import Flashcard
+
+Span = Tuple[int, int]
+
+class _FoldTable(dict):
+    """str.translate table that folds each character on first sight."""
+
+    def __missing__(self, codepoint: int) -> str:
+        decomposed = unicodedata.normalize('NFKD', chr(codepoint))
+        folded = ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+        self[codepoint] = folded
+        return folded
+
+_fold_table = _FoldTable()
+
+def _fold_char(char: str) -> str:
+    """Fold a single character: lowercase with accents removed."""
+    return _fold_table[ord(char)]
+
+def fold_text(text: str) -> str:
+    """
+    Fold text for searching: lowercase, accents removed, whitespace collapsed.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        str: Folded text
+    """
+    if text.isascii():
+        folded = text.lower()
+    else:
+        folded = text.translate(_fold_table)
+    return ' '.join(folded.split())
+
+def fold_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """
+    Fold text and map every folded character back to its source index.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Tuple[str, List[int]]: Folded text (as fold_text) and source offsets
+    """
+    chars: List[str] = []
+    offsets: List[int] = []
+    pending_space = False
+    for index, char in enumerate(text):
+        if char.isspace():
+            pending_space = bool(chars)
+            continue
+        if pending_space:
+            chars.append(' ')
+            offsets.append(index - 1)
+            pending_space = False
+        for folded in _fold_char(char):
+            chars.append(folded)
+            offsets.append(index)
+    return ''.join(chars), offsets
+
+def _occurrences(text: str, query: str) -> Iterable[int]:
+    """Yield the start positions of query in text."""
+    position = text.find(query)
+    while position >= 0:
+        yield position
+        position = text.find(query, position + 1)
+
+def _trigrams(text: str) -> Set[str]:
+    """Get the distinct trigrams of folded text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _token_prefixes(text: str) -> Set[str]:
+    """Get the one- and two-character prefixes of the tokens of folded text."""
+    prefixes = set()
+    for token in text.split():
+        prefixes.add(token[:1])
+        prefixes.add(token[:2])
+    return prefixes
+
+@dataclass
+class SearchHit:
+    """A ranked search result with match spans for highlighting."""
+    card: Flashcard
+    score: float
+    question_spans: List[Span] = field(default_factory=list)
+    answer_spans: List[Span] = field(default_factory=list)
+
+class SearchIndex:
+    """
+    Accent-folded inverted index over both sides of every card.
+
+    Queries of three or more characters are matched as substrings using
+    trigram posting lists; shorter queries match word prefixes. Candidates
+    are verified against the folded text and the best matches are ranked
+    with exact and prefix matches first and questions above answers.
+    """
+
+    QUESTION_WEIGHT = 2.0
+    ANSWER_WEIGHT = 1.0
+
+    def __init__(self, cards: Iterable[Flashcard] = ()):
+        """Initialize the index, optionally from existing cards."""
+        self._lock = threading.RLock()
+        self._cards: List[Optional[Flashcard]] = []
+        self._folded: List[Optional[Tuple[str, str]]] = []
+        self._doc_ids: Dict[int, int] = {}  # id(card) -> doc id
+        self._category_docs: Dict[str, Set[int]] = {}
+        self._trigrams: Dict[str, array] = {}
+        self._prefixes: Dict[str, array] = {}
+        self._removed = 0
+        self.add_cards(cards)
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def add_cards(self, cards: Iterable[Flashcard]) -> None:
+        """Index several cards."""
+        with self._lock:
+            for card in cards:
+                self._add(card)
+
+    def add_card(self, card: Flashcard) -> None:
+        """Index a card."""
+        with self._lock:
+            self._add(card)
+
+    def _add(self, card: Flashcard) -> None:
+        """Index a card (lock held)."""
+        if id(card) in self._doc_ids:
+            return
+        doc_id = len(self._cards)
+        question = fold_text(card.question)
+        answer = fold_text(card.answer)
+        self._cards.append(card)
+        self._folded.append((question, answer))
+        self._doc_ids[id(card)] = doc_id
+        self._category_docs.setdefault(card.category, set()).add(doc_id)
+        for table, keys in (
+            (self._trigrams, _trigrams(question) | _trigrams(answer)),
+            (self._prefixes, _token_prefixes(question) | _token_prefixes(answer))
+        ):
+            for key in keys:
+                postings = table.get(key)
+                if postings is None:
+                    table[key] = array('I', (doc_id,))
+                else:
+                    postings.append(doc_id)
+
+    def remove_card(self, card: Flashcard) -> None:
+        """Remove a card from the index."""
+        with self._lock:
+            doc_id = self._doc_ids.pop(id(card), None)
+            if doc_id is None:
+                return
+            self._cards[doc_id] = None
+            self._folded[doc_id] = None
+            self._category_docs.get(card.category, set()).discard(doc_id)
+            self._removed += 1
+            if self._removed > len(self._doc_ids):
+                self._rebuild()
+
+    def update_card(self, card: Flashcard) -> None:
+        """Re-index a card after its question or answer was edited."""
+        with self._lock:
+            self.remove_card(card)
+            self._add(card)
+
+    def remove_category(self, category: str) -> None:
+        """Remove all cards of a category, e.g. before indexing a reloaded deck."""
+        with self._lock:
+            cards = [self._cards[doc_id] for doc_id in self._category_docs.get(category, ())]
+            for card in cards:
+                if card is not None:
+                    self.remove_card(card)
+            self._category_docs.pop(category, None)
+
+    def _rebuild(self) -> None:
+        """Drop removed documents from the posting lists."""
+        cards = [card for card in self._cards if card is not None]
+        self._cards = []
+        self._folded = []
+        self._doc_ids = {}
+        self._category_docs = {}
+        self._trigrams = {}
+        self._prefixes = {}
+        self._removed = 0
+        for card in cards:
+            self._add(card)
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        """Get document ids that may contain the folded query."""
+        if len(query) < 3:
+            return self._prefixes.get(query, ())
+        postings = []
+        for gram in _trigrams(query):
+            posting = self._trigrams.get(gram)
+            if posting is None:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return candidates
+
+    @staticmethod
+    def _field_score(text: str, query: str, prefix_only: bool) -> float:
+        """Score how well a folded field matches the folded query."""
+        positions = list(_occurrences(text, query))
+        if not positions:
+            return 0.0
+        if text == query:
+            base = 100.0
+        elif positions[0] == 0:
+            base = 60.0
+        elif any(text[position - 1] == ' ' for position in positions):
+            base = 40.0
+        elif prefix_only:
+            return 0.0
+        else:
+            base = 20.0
+        # Prefer short fields where the query covers more of the text
+        return base + 10.0 * len(query) / len(text)
+
+    def _rank(self, query: str, limit: Optional[int] = None) -> List[Tuple[float, Flashcard]]:
+        """Score the candidates of a folded query, best first."""
+        prefix_only = len(query) < 3
+        with self._lock:
+            scored = []
+            for doc_id in self._candidates(query):
+                texts = self._folded[doc_id]
+                if texts is None:
+                    continue
+                score = (
+                    self.QUESTION_WEIGHT * self._field_score(texts[0], query, prefix_only) +
+                    self.ANSWER_WEIGHT * self._field_score(texts[1], query, prefix_only)
+                )
+                if score > 0:
+                    scored.append((score, -doc_id))
+            if limit is None:
+                scored.sort(reverse=True)
+            else:
+                scored = heapq.nlargest(limit, scored)
+            return [(score, self._cards[-neg_id]) for score, neg_id in scored]
+
+    @staticmethod
+    def _make_hits(ranked: List[Tuple[float, Flashcard]], query: str) -> List[SearchHit]:
+        """Build hits with match spans for ranked cards."""
+        return [
+            SearchHit(
+                card=card,
+                score=score,
+                question_spans=match_spans(card.question, query),
+                answer_spans=match_spans(card.answer, query)
+            )
+            for score, card in ranked
+        ]
+
+    def search(self, query: str, limit: int = 50) -> List[SearchHit]:
+        """
+        Find the best matching cards.
+
+        Args:
+            query: Search text (case and accents are ignored)
+            limit: Maximum number of hits to return
+
+        Returns:
+            List[SearchHit]: Hits ordered by descending score
+        """
+        folded = fold_text(query)
+        if not folded:
+            return []
+        return self._make_hits(self._rank(folded, limit), folded)
+
+    def iter_search(self, query: str, batch_size: int = 50) -> Iterator[List[SearchHit]]:
+        """
+        Find all matching cards, yielding hits in ranked batches.
+
+        Ranking is done up front; match spans are only computed for the
+        batches that are actually consumed.
+
+        Args:
+            query: Search text (case and accents are ignored)
+            batch_size: Number of hits per batch
+
+        Yields:
+            List[SearchHit]: Next hits in descending score order
+        """
+        folded = fold_text(query)
+        if not folded:
+            return
+        ranked = self._rank(folded)
+        for start in range(0, len(ranked), batch_size):
+            yield self._make_hits(ranked[start:start + batch_size], folded)
+
+def match_spans(text: str, query: str) -> List[Span]:
+    """
+    Locate a folded query in original text.
+
+    Args:
+        text: Original text
+        query: Folded query
+
+    Returns:
+        List[Span]: Sorted, disjoint (start, end) offsets into the original
+            text; overlapping occurrences are merged into one span
+    """
+    folded, offsets = fold_with_offsets(text)
+    spans: List[Span] = []
+    for position in _occurrences(folded, query):
+        start, end = offsets[position], offsets[position + len(query) - 1] + 1
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+    return spans
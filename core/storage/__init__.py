@@ -0,0 +1,23 @@
+"""
+Storage backend package initialization.
+"""
+from .base import CategorySummary, StorageBackend, migrate
+from .json_backend import JsonStorageBackend
+from .binary_backend import BinaryStorageBackend
+from .binary_deck import BinaryDeck, binary_to_json, json_to_binary
+from .sqlite_backend import SqliteStorageBackend
+from .write_behind import WriteBehindFlusher, flush_all
+
+__all__ = [
+    'CategorySummary',
+    'StorageBackend',
+    'migrate',
+    'JsonStorageBackend',
+    'BinaryStorageBackend',
+    'BinaryDeck',
+    'binary_to_json',
+    'json_to_binary',
+    'SqliteStorageBackend',
+    'WriteBehindFlusher',
+    'flush_all'
+]
@@ -0,0 +1,196 @@
+"""
+Storage backend interface for flashcard persistence.
+"""
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from core.flashcard import Flashcard
+from core.algorithm.sm2 import today_ordinal
+
+if TYPE_CHECKING:
+    from core.card_store import CardStore
+
+@dataclass
+class CategorySummary:
+    """Card counts of one stored category."""
+    category: str
+    cards: int = 0
+    new: int = 0
+    due_days: Dict[int, int] = field(default_factory=dict)  # due day -> number of cards
+
+    @classmethod
+    def from_cards(cls, category: str, cards: Iterable[Flashcard]) -> 'CategorySummary':
+        """
+        Summarize the cards of a category.
+        
+        Args:
+            category: Category name
+            cards: Cards of the category
+            
+        Returns:
+            CategorySummary: Counts of the cards
+        """
+        total = 0
+        new = 0
+        due_days: Counter = Counter()
+        for card in cards:
+            total += 1
+            if not card.last_review:
+                new += 1
+            due_days[card.due_day] += 1
+        return cls(category=category, cards=total, new=new, due_days=dict(due_days))
+
+    def due_count(self, today: Optional[int] = None) -> int:
+        """
+        Count the cards due on a day.
+        
+        Args:
+            today: Ordinal of the current day, computed if not given
+            
+        Returns:
+            int: Number of due cards
+        """
+        if today is None:
+            today = today_ordinal()
+        return sum(count for day, count in self.due_days.items() if day <= today)
+
+class StorageBackend(ABC):
+    """Base class for flashcard storage backends."""
+
+    @abstractmethod
+    def list_categories(self) -> List[str]:
+        """Get the names of all stored categories."""
+
+    @abstractmethod
+    def load_category(self, category: str) -> List[Dict[str, Any]]:
+        """
+        Load the stored card data of a category.
+        
+        Args:
+            category: Category name
+            
+        Returns:
+            List[Dict[str, Any]]: Card data (empty if the category is unknown)
+        """
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Load the stored card data of every category."""
+        cards = []
+        for category in self.list_categories():
+            cards.extend(self.load_category(category))
+        return cards
+
+    @abstractmethod
+    def save_category(self, category: str, cards: Sequence[Flashcard]) -> bool:
+        """
+        Replace the stored cards of a category.
+        
+        Args:
+            category: Category name
+            cards: All cards of the category
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+
+    def category_summaries(self) -> List[CategorySummary]:
+        """
+        Get card counts for every stored category.
+        
+        The default loads each category; backends override this with
+        cheaper lookups.
+        
+        Returns:
+            List[CategorySummary]: Summaries sorted by category name
+        """
+        return [
+            CategorySummary.from_cards(
+                category,
+                (Flashcard.from_dict(data) for data in self.load_category(category))
+            )
+            for category in self.list_categories()
+        ]
+
+    def map_category(self, category: str) -> Optional['CardStore']:
+        """
+        Get the cards of a category as a store backed by the stored file.
+        
+        Backends with a memory-mappable format override this; the
+        default has no such store.
+        
+        Args:
+            category: Category name
+            
+        Returns:
+            Optional[CardStore]: Store of the cards, or None if unavailable
+        """
+        return None
+
+    def save_cards(self, category: str, changed: Sequence[Flashcard],
+                   category_cards: Sequence[Flashcard]) -> bool:
+        """
+        Persist changed cards of a category.
+        
+        Backends that can write single records override this; the default
+        rewrites the whole category.
+        
+        Args:
+            category: Category name
+            changed: Cards that were added or reviewed
+            category_cards: All cards of the category
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.save_category(category, category_cards)
+
+    def category_signature(self, category: str) -> Optional[Tuple]:
+        """
+        Get a cheap fingerprint of a category's stored data.
+        
+        Caches compare fingerprints to detect changes made by other writers.
+        
+        Args:
+            category: Category name
+            
+        Returns:
+            Optional[Tuple]: Fingerprint, or None if the backend cannot provide one
+        """
+        return None
+
+    def storage_signature(self) -> Optional[Tuple]:
+        """
+        Get a cheap fingerprint of the set of stored categories.
+        
+        Returns:
+            Optional[Tuple]: Fingerprint, or None if the backend cannot provide one
+        """
+        return None
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+    def __enter__(self) -> 'StorageBackend':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def migrate(source: StorageBackend, target: StorageBackend) -> int:
+    """
+    Copy every category from one backend into another.
+    
+    Args:
+        source: Backend to read from
+        target: Backend to write to
+        
+    Returns:
+        int: Number of cards copied
+    """
+    copied = 0
+    for category in source.list_categories():
+        cards = [Flashcard.from_dict(data) for data in source.load_category(category)]
+        target.save_category(category, cards)
+        copied += len(cards)
+    return copied
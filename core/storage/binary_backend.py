@@ -0,0 +1,146 @@
+"""
+Binary deck storage backend (one memory-mapped file per category).
+"""
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from core.card_store import CardStore, CardView
+from core.flashcard import Flashcard
+from core.storage.base import StorageBackend
+from core.storage.binary_deck import BinaryDeck, SCHEDULE, SCHEDULE_OFFSET, write_binary_deck
+from core.algorithm.sm2 import due_day
+from core.utils.file_handler import ensure_storage_dir
+from core.utils.text_formatter import format_category_filename
+
+DECK_SUFFIX = '.deck'
+
+class BinaryStorageBackend(StorageBackend):
+    """
+    Stores each category as a binary deck file.
+
+    Decks are memory-mapped: map_category reads the scheduling records
+    and leaves card text in the file until it is accessed. Reviews of
+    mapped cards overwrite their fixed-width records in place; any other
+    change rewrites the file atomically.
+
+    A category's map is released when its deck is mapped again or
+    rewritten, and all maps on close(); the stores read their remaining
+    text into memory first, so their cards stay usable.
+    """
+
+    def __init__(self, storage_path: str):
+        """
+        Initialize the backend on a storage directory.
+
+        Args:
+            storage_path: Directory of the deck files
+        """
+        self.storage_path = storage_path
+        self._mapped: Dict[str, Tuple[CardStore, Optional[Tuple]]] = {}  # Stores over current files
+        ensure_storage_dir(storage_path)
+
+    def category_path(self, category: str) -> str:
+        """Get the file path of a category."""
+        return os.path.join(self.storage_path, format_category_filename(category) + DECK_SUFFIX)
+
+    def _deck_files(self) -> List[str]:
+        """Get the paths of all deck files."""
+        return [
+            os.path.join(self.storage_path, file)
+            for file in sorted(os.listdir(self.storage_path))
+            if file.endswith(DECK_SUFFIX)
+        ]
+
+    def list_categories(self) -> List[str]:
+        """Get the names of all stored categories from the deck headers."""
+        categories = set()
+        for deck_path in self._deck_files():
+            try:
+                with BinaryDeck(deck_path) as deck:
+                    categories.add(deck.category)
+            except ValueError:
+                continue
+        return sorted(categories)
+
+    def map_category(self, category: str) -> Optional[CardStore]:
+        """Map the deck file of a category into a store."""
+        deck_path = self.category_path(category)
+        signature = self.category_signature(category)
+        try:
+            store = CardStore.from_deck(BinaryDeck(deck_path))
+        except (FileNotFoundError, ValueError):
+            return None
+        self._release(category)
+        self._mapped[category] = (store, signature)
+        return store
+
+    def _release(self, category: str) -> None:
+        """Unmap the deck file of a category, keeping its store usable."""
+        mapped = self._mapped.pop(category, None)
+        if mapped is not None:
+            mapped[0].detach()
+
+    def load_category(self, category: str) -> List[Dict[str, Any]]:
+        """Load the stored card data of a category."""
+        deck_path = self.category_path(category)
+        try:
+            with BinaryDeck(deck_path) as deck:
+                return [card.to_dict() for card in CardStore.from_deck(deck)]
+        except (FileNotFoundError, ValueError):
+            return []
+
+    def save_category(self, category: str, cards: Sequence[Flashcard]) -> bool:
+        """Replace the deck file of a category."""
+        # An open map would keep the old file locked on Windows
+        self._release(category)
+        return write_binary_deck(self.category_path(category), cards, category)
+
+    def save_cards(self, category: str, changed: Sequence[Flashcard],
+                   category_cards: Sequence[Flashcard]) -> bool:
+        """Overwrite the records of reviewed mapped cards, or rewrite the deck."""
+        if not self._patch_records(category, changed, category_cards):
+            return self.save_category(category, category_cards)
+        return True
+
+    def _patch_records(self, category: str, changed: Sequence[Flashcard],
+                       category_cards: Sequence[Flashcard]) -> bool:
+        """Write the scheduling fields of changed cards into their records in place."""
+        mapped = self._mapped.get(category)
+        if mapped is None:
+            return False
+        store, signature = mapped
+        if (signature != self.category_signature(category) or
+                len(category_cards) != len(store.deck)):
+            return False
+        for card in changed:
+            if not (isinstance(card, CardView) and card._store is store and
+                    card.category == category and store.is_mapped(card._row)):
+                return False
+        try:
+            with open(store.deck.path, 'r+b') as f:
+                for card in changed:
+                    f.seek(store.deck.record_offset(card._row) + SCHEDULE_OFFSET)
+                    f.write(SCHEDULE.pack(card.interval, card.repetitions, card.score,
+                                          due_day(card.last_review, 0), card.easiness))
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            return False
+        self._mapped[category] = (store, self.category_signature(category))
+        return True
+
+    def category_signature(self, category: str) -> Optional[Tuple]:
+        """Fingerprint a category by the mtime and size of its deck file."""
+        try:
+            stat = os.stat(self.category_path(category))
+        except FileNotFoundError:
+            return (None,)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def storage_signature(self) -> Optional[Tuple]:
+        """Fingerprint the deck set by the storage directory's mtime."""
+        return (os.stat(self.storage_path).st_mtime_ns,)
+
+    def close(self) -> None:
+        """Unmap all mapped deck files."""
+        for category in list(self._mapped):
+            self._release(category)
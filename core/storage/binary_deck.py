@@ -0,0 +1,290 @@
+"""
+Memory-mapped binary deck format.
+
+A deck file holds one category:
+
+    header   MAGIC, format version, normalizer version, card count,
+             string count and the string index of the category name
+    records  one fixed-width record of scheduling data per card, with the
+             card's text as indexes into the string table
+    offsets  string_count + 1 offsets into the heap
+    heap     the distinct strings of the deck, UTF-8 encoded
+
+Numbers are little-endian. Records are read in one pass when a deck is
+mapped; strings are decoded only when a card's text is accessed.
+
+Usage:
+    python -m core.storage.binary_deck storage/Lektion_7.json storage/Lektion_7.deck
+    python -m core.storage.binary_deck storage/Lektion_7.deck storage/Lektion_7.json
+"""
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from core.algorithm.sm2 import due_day
+from core.card_store import CardStore
+from core.flashcard import Flashcard
+from core.utils.file_handler import dump_json, load_json_file, write_bytes_atomic, write_file_atomic
+from core.utils.text_processing import NORMALIZER_VERSION
+
+MAGIC = b'FCDK'
+FORMAT_VERSION = 1
+# magic, format version, normalizer version, cards, strings, category string, reserved
+HEADER = struct.Struct('<4sHHIIII')
+# question, answer, normalized answer, category (string indexes),
+# interval, repetitions, score, review day ordinal (0 if never reviewed), easiness
+RECORD = struct.Struct('<IIIIiiiid')
+RECORD_FIELDS = 9
+# Scheduling part of a record, after the four string indexes
+SCHEDULE = struct.Struct('<iiiid')
+SCHEDULE_OFFSET = 16
+OFFSET = struct.Struct('<Q')
+OFFSET_PAIR = struct.Struct('<QQ')
+# String index of a missing normalized answer
+NO_STRING = 0xFFFFFFFF
+
+def encode_deck(cards: Iterable[Flashcard], category: str) -> bytes:
+    """
+    Serialize cards in the binary deck format.
+
+    Args:
+        cards: Cards of the deck
+        category: Category name stored in the header
+
+    Returns:
+        bytes: Deck file content
+    """
+    strings: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    category_index = intern(category)
+    records = bytearray()
+    count = 0
+    for card in cards:
+        records += RECORD.pack(
+            intern(card.question), intern(card.answer),
+            intern(card.get_answer_key().normalized), intern(card.category),
+            card.interval, card.repetitions, card.score,
+            due_day(card.last_review, 0), card.easiness
+        )
+        count += 1
+
+    heap = bytearray()
+    offsets = bytearray(OFFSET.pack(0))
+    for text in strings:
+        heap += text.encode('utf-8')
+        offsets += OFFSET.pack(len(heap))
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, NORMALIZER_VERSION,
+                         count, len(strings), category_index, 0)
+    return b''.join((header, records, offsets, heap))
+
+def write_binary_deck(path: str, cards: Iterable[Flashcard], category: str) -> bool:
+    """
+    Write cards to a binary deck file atomically.
+
+    Args:
+        path: Deck file path
+        cards: Cards of the deck
+        category: Category name stored in the header
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return write_bytes_atomic(path, encode_deck(cards, category))
+
+class BinaryDeck:
+    """
+    Read-only memory map of a binary deck file.
+
+    Raises:
+        ValueError: If the file is not a deck of a supported version
+    """
+
+    def __init__(self, path: str):
+        """Map a deck file."""
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Empty deck file: {path}") from None
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"Truncated deck file: {path}")
+        magic, version, self.normalizer_version, self.count, self.string_count, \
+            category_index, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported deck file: {path}")
+        self._offsets_at = HEADER.size + self.count * RECORD.size
+        self._heap_at = self._offsets_at + (self.string_count + 1) * OFFSET.size
+        if len(self._map) < self._heap_at or len(self._map) < self._heap_at + self._heap_size():
+            self.close()
+            raise ValueError(f"Truncated deck file: {path}")
+        self.category = self.string(category_index)
+
+    def __enter__(self) -> 'BinaryDeck':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _heap_size(self) -> int:
+        """Get the heap size from the last string offset."""
+        return OFFSET.unpack_from(self._map, self._offsets_at + self.string_count * OFFSET.size)[0]
+
+    def string(self, index: int) -> str:
+        """Decode a string of the string table."""
+        start, end = OFFSET_PAIR.unpack_from(self._map, self._offsets_at + index * OFFSET.size)
+        return str(self._map[self._heap_at + start:self._heap_at + end], 'utf-8')
+
+    def record_offset(self, row: int) -> int:
+        """Get the file offset of a card record."""
+        return HEADER.size + row * RECORD.size
+
+    def record_columns(self) -> List[Tuple]:
+        """Get the record fields of all cards as one tuple per field, in RECORD order."""
+        if not self.count:
+            return [()] * RECORD_FIELDS
+        records = memoryview(self._map)[HEADER.size:self._offsets_at]
+        try:
+            columns = list(zip(*RECORD.iter_unpack(records)))
+        finally:
+            records.release()
+        if self.normalizer_version != NORMALIZER_VERSION:
+            # Normalized answers of another normalizer are rebuilt on use
+            columns[2] = (NO_STRING,) * self.count
+        return columns
+
+    def text_column(self, indexes: Iterable[int]) -> 'LazyTextColumn':
+        """Get a lazily decoded column of strings from their indexes."""
+        return LazyTextColumn(self, array('I', indexes))
+
+    def close(self) -> None:
+        """Unmap the file; strings not yet decoded can no longer be read."""
+        self._map.close()
+
+class LazyTextColumn:
+    """
+    Text column of a mapped deck, decoding each string on access.
+
+    Strings assigned or appended after mapping are kept in memory and
+    take precedence over the file.
+    """
+
+    def __init__(self, deck: BinaryDeck, indexes: array):
+        """
+        Initialize the column.
+
+        Args:
+            deck: Mapped deck holding the strings
+            indexes: String index of every row (NO_STRING for none)
+        """
+        self._deck = deck
+        self._indexes = indexes
+        self._overrides: Dict[int, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        if row in self._overrides:
+            return self._overrides[row]
+        index = self._indexes[row]
+        return None if index == NO_STRING else self._deck.string(index)
+
+    def __setitem__(self, row: int, value: Optional[str]) -> None:
+        self._overrides[row] = value
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def append(self, value: Optional[str]) -> None:
+        """Add a row held in memory."""
+        self._indexes.append(NO_STRING)
+        self._overrides[len(self._indexes) - 1] = value
+
+    def is_mapped(self, row: int) -> bool:
+        """Check whether a row still holds the text stored in the file."""
+        return row not in self._overrides
+
+    def nbytes(self) -> int:
+        """Estimate the memory held by the column without decoding it."""
+        return (self._indexes.itemsize * len(self._indexes) +
+                sum(len(text) + 49 for text in self._overrides.values() if text is not None))
+
+def json_to_binary(json_path: str, deck_path: str, category: Optional[str] = None) -> int:
+    """
+    Convert a JSON deck file to the binary format.
+
+    Args:
+        json_path: Source JSON deck file
+        deck_path: Target binary deck file
+        category: Category name, defaults to the category of the first card
+
+    Returns:
+        int: Number of cards converted
+
+    Raises:
+        OSError: If the target cannot be written
+    """
+    cards, seen = [], set()
+    for data in load_json_file(json_path):
+        card = Flashcard.from_dict(data)
+        # Drop repeated cards the way FlashcardManager does when loading
+        if (card.question, card.answer) not in seen:
+            seen.add((card.question, card.answer))
+            cards.append(card)
+    if category is None:
+        category = cards[0].category if cards else os.path.splitext(os.path.basename(json_path))[0]
+    if not write_binary_deck(deck_path, cards, category):
+        raise OSError(f"Could not write {deck_path}")
+    return len(cards)
+
+def binary_to_json(deck_path: str, json_path: str) -> int:
+    """
+    Convert a binary deck file to the JSON format.
+
+    Args:
+        deck_path: Source binary deck file
+        json_path: Target JSON deck file
+
+    Returns:
+        int: Number of cards converted
+
+    Raises:
+        OSError: If the target cannot be written
+    """
+    with BinaryDeck(deck_path) as deck:
+        cards = [card.to_dict() for card in CardStore.from_deck(deck)]
+    if not write_file_atomic(json_path, dump_json(cards)):
+        raise OSError(f"Could not write {json_path}")
+    return len(cards)
+
+def main():
+    """Convert a deck file between the JSON and binary formats."""
+    parser = argparse.ArgumentParser(description="Convert deck files between JSON and the binary format.")
+    parser.add_argument('source', help="Deck file to convert (.json or .deck).")
+    parser.add_argument('target', help="Output file.")
+    parser.add_argument('--category', help="Category name for JSON input, defaults to the cards' category.")
+    args = parser.parse_args()
+
+    if args.source.endswith('.json'):
+        count = json_to_binary(args.source, args.target, args.category)
+    else:
+        count = binary_to_json(args.source, args.target)
+    print(f"{count} flashcards converted to {args.target}")
+
+if __name__ == '__main__':
+    main()
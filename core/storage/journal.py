@@ -0,0 +1,126 @@
+"""
+Append-only review journal for crash-safe incremental saves.
+"""
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+class ReviewJournal:
+    """
+    Write-ahead log of card records for one deck file.
+
+    Each line holds the full stored state of one card, so replaying the
+    journal in order on top of the last snapshot is idempotent. A torn
+    final line left by a crash is ignored on read.
+    """
+
+    def __init__(self, path: str, fsync: bool = True):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Path to the journal file
+            fsync: Whether to fsync after each append
+        """
+        self.path = path
+        self.fsync = fsync
+        self._count: Optional[int] = None
+        self._tail_checked = False
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = len(self.read())
+        return self._count
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Append card records to the journal.
+
+        Args:
+            records: Card data to append
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        lines = [json.dumps(record, ensure_ascii=False) + '\n' for record in records]
+        if not lines:
+            return True
+        count = len(self) + len(lines)
+        if not self._tail_checked:
+            # Terminate a torn line so the new records start on their own line
+            if self._has_torn_tail():
+                lines.insert(0, '\n')
+            self._tail_checked = True
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+        except OSError:
+            return False
+        self._count = count
+        return True
+
+    def _has_torn_tail(self) -> bool:
+        """Check whether the journal ends in an unterminated line."""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b'\n'
+        except OSError:
+            return False  # Missing or empty journal
+
+    def read(self) -> List[Dict[str, Any]]:
+        """
+        Read all complete records from the journal.
+
+        Returns:
+            List[Dict[str, Any]]: Card records in append order
+        """
+        records = []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # Torn write from a crash
+        except FileNotFoundError:
+            pass
+        self._count = len(records)
+        return records
+
+    def clear(self) -> None:
+        """Remove the journal after its records were folded into the snapshot."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self._count = 0
+        self._tail_checked = True
+
+def replay(snapshot: List[Dict[str, Any]], records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Apply journal records on top of a snapshot.
+
+    Args:
+        snapshot: Card data from the deck file
+        records: Journal records in append order
+
+    Returns:
+        List[Dict[str, Any]]: Card data with the journal applied
+    """
+    positions = {
+        (card.get('question'), card.get('answer')): i
+        for i, card in enumerate(snapshot)
+    }
+    for record in records:
+        key = (record.get('question'), record.get('answer'))
+        position = positions.get(key)
+        if position is None:
+            positions[key] = len(snapshot)
+            snapshot.append(record)
+        else:
+            snapshot[position] = record
+    return snapshot
@@ -0,0 +1,177 @@
+"""
+JSON file storage backend (one file per category).
+"""
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from core.flashcard import Flashcard
+from core.storage.base import CategorySummary, StorageBackend
+from core.storage.journal import ReviewJournal, replay
+from core.storage.manifest import CategoryManifest
+from core.utils.file_handler import ensure_storage_dir, dump_json, write_file_atomic
+from core.utils.text_formatter import format_category_filename
+
+JOURNAL_SUFFIX = '.journal'
+
+class JsonStorageBackend(StorageBackend):
+    """
+    Stores each category as a JSON list in its own file.
+    
+    Reviews and additions are appended to a per-category journal next to
+    the deck file instead of rewriting it. The journal is replayed on load
+    and folded back into the deck file once it reaches compact_threshold
+    records. Rewrites whose content matches the deck file are skipped.
+    Category names and counts come from a manifest that is only refreshed
+    for decks whose files changed.
+    """
+
+    def __init__(self, storage_path: str, journal: bool = True, compact_threshold: int = 200):
+        """
+        Initialize the backend on a storage directory.
+        
+        Args:
+            storage_path: Directory of the deck files
+            journal: Whether to journal incremental saves
+            compact_threshold: Journal records that trigger a compaction
+        """
+        self.storage_path = storage_path
+        self.journal = journal
+        self.compact_threshold = compact_threshold
+        self._journals: Dict[str, ReviewJournal] = {}
+        self._digests: Dict[str, str] = {}
+        ensure_storage_dir(storage_path)
+        self.manifest = CategoryManifest(
+            storage_path, self._deck_files, self._deck_signature, self._load_deck
+        )
+
+    def category_path(self, category: str) -> str:
+        """Get the file path of a category."""
+        filename = format_category_filename(category) + '.json'
+        return os.path.join(self.storage_path, filename)
+
+    def _journal_for(self, deck_path: str) -> ReviewJournal:
+        """Get the journal belonging to a deck file."""
+        journal = self._journals.get(deck_path)
+        if journal is None:
+            journal = ReviewJournal(os.path.splitext(deck_path)[0] + JOURNAL_SUFFIX)
+            self._journals[deck_path] = journal
+        return journal
+
+    def _deck_files(self) -> List[str]:
+        """Get the paths of all deck files, including journal-only decks."""
+        stems = set()
+        for file in os.listdir(self.storage_path):
+            stem, ext = os.path.splitext(file)
+            if ext == '.json' or (self.journal and ext == JOURNAL_SUFFIX):
+                stems.add(stem)
+        return [os.path.join(self.storage_path, stem + '.json') for stem in sorted(stems)]
+
+    @staticmethod
+    def _digest(content: bytes) -> str:
+        """Hash serialized deck content."""
+        return hashlib.sha1(content).hexdigest()
+
+    def _read_snapshot(self, deck_path: str) -> List[Dict[str, Any]]:
+        """Read a deck file and remember the hash of its content."""
+        try:
+            with open(deck_path, 'rb') as f:
+                content = f.read()
+            cards = json.loads(content.decode('utf-8'))
+        except (FileNotFoundError, UnicodeDecodeError, json.JSONDecodeError):
+            return []
+        self._digests[deck_path] = self._digest(content)
+        return cards
+
+    def _load_deck(self, deck_path: str) -> List[Dict[str, Any]]:
+        """Load a deck file with its journal replayed on top."""
+        cards = self._read_snapshot(deck_path)
+        if self.journal:
+            cards = replay(cards, self._journal_for(deck_path).read())
+        return cards
+
+    def _deck_signature(self, deck_path: str) -> list:
+        """Get the mtime and size of a deck file and its journal."""
+        signature = []
+        for path in (deck_path, self._journal_for(deck_path).path):
+            try:
+                stat = os.stat(path)
+                signature.append([stat.st_mtime_ns, stat.st_size])
+            except FileNotFoundError:
+                signature.append(None)
+        return signature
+
+    def category_signature(self, category: str) -> Optional[Tuple]:
+        """Fingerprint a category by the mtime and size of its deck and journal files."""
+        return tuple(
+            tuple(part) if part else None
+            for part in self._deck_signature(self.category_path(category))
+        )
+
+    def storage_signature(self) -> Optional[Tuple]:
+        """Fingerprint the deck set by the storage directory's mtime."""
+        return (os.stat(self.storage_path).st_mtime_ns,)
+
+    def list_categories(self) -> List[str]:
+        """Get the names of all stored categories."""
+        return sorted({summary.category for summary in self.manifest.summaries()})
+
+    def category_summaries(self) -> List[CategorySummary]:
+        """Get card counts for every stored category from the manifest."""
+        return self.manifest.summaries()
+
+    def load_category(self, category: str) -> List[Dict[str, Any]]:
+        """Load the stored card data of a category."""
+        return self._load_deck(self.category_path(category))
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Load the stored card data of every deck file."""
+        cards = []
+        for deck_path in self._deck_files():
+            cards.extend(self._load_deck(deck_path))
+        return cards
+
+    def save_category(self, category: str, cards: Sequence[Flashcard]) -> bool:
+        """Replace the stored cards of a category and reset its journal."""
+        deck_path = self.category_path(category)
+        text = dump_json([card.to_dict() for card in cards])
+        digest = self._digest(text.encode('utf-8'))
+        if self._digests.get(deck_path) != digest or not os.path.exists(deck_path):
+            if not write_file_atomic(deck_path, text):
+                return False
+            self._digests[deck_path] = digest
+        if self.journal:
+            self._journal_for(deck_path).clear()
+        self.manifest.update(deck_path, category, cards)
+        return True
+
+    def save_cards(self, category: str, changed: Sequence[Flashcard],
+                   category_cards: Sequence[Flashcard]) -> bool:
+        """Append changed cards to the category journal, compacting when it grows."""
+        deck_path = self.category_path(category)
+        if not self.journal or not os.path.exists(deck_path):
+            return self.save_category(category, category_cards)
+            
+        journal = self._journal_for(deck_path)
+        if not journal.append(card.to_dict() for card in changed):
+            return self.save_category(category, category_cards)
+        if len(journal) >= self.compact_threshold:
+            return self.compact(category, category_cards)
+        self.manifest.update_cards(deck_path, category, changed, category_cards)
+        return True
+
+    def compact(self, category: str, cards: Sequence[Flashcard]) -> bool:
+        """
+        Fold the journal of a category into its deck file.
+        
+        The snapshot is written atomically before the journal is removed,
+        so a crash in between only replays records already in the snapshot.
+        
+        Args:
+            category: Category name
+            cards: All cards of the category
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.save_category(category, cards)
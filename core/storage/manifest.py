@@ -0,0 +1,234 @@
+"""
+Category manifest caching per-deck card counts.
+"""
+import json
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from core.flashcard import Flashcard
+from core.storage.base import CategorySummary
+from core.utils.file_handler import write_file_atomic
+
+MANIFEST_FILENAME = 'categories.manifest'
+MANIFEST_VERSION = 1
+
+def _card_state(card: Flashcard) -> int:
+    """Pack what a card contributes to its entry: its due day and whether it is new."""
+    return card.due_day * 2 + (not card.last_review)
+
+class _CardStates:
+    """
+    Counted state of every card of a deck, for adjusting its entry by deltas.
+
+    Cards are identified by the hash of their (question, answer) pair and
+    kept in two sorted arrays, about 12 bytes per card, rather than a dict
+    holding each card's text.
+    """
+
+    __slots__ = ('_keys', '_states')
+
+    def __init__(self, cards: Sequence[Flashcard]):
+        """Record the states of all cards of a deck."""
+        pairs = sorted((hash((card.question, card.answer)), _card_state(card)) for card in cards)
+        self._keys = array('q', (key for key, _ in pairs))
+        self._states = array('i', (state for _, state in pairs))
+
+    def replace(self, card: Flashcard) -> Tuple[Optional[Tuple[bool, int]], Tuple[bool, int]]:
+        """
+        Record a card's current state.
+
+        Returns:
+            Tuple: The previously counted (is new, due day), None for a card
+            not counted before, and the current one
+        """
+        key = hash((card.question, card.answer))
+        state = _card_state(card)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            old = self._states[index]
+            self._states[index] = state
+            old_state = (bool(old & 1), old >> 1)
+        else:
+            self._keys.insert(index, key)
+            self._states.insert(index, state)
+            old_state = None
+        return old_state, (bool(state & 1), state >> 1)
+
+class CategoryManifest:
+    """
+    Index file with the category name and card counts of every deck file.
+
+    Each entry stores the signature of its deck file. Listing categories
+    only stats the deck files; a deck is parsed again only if its
+    signature no longer matches. Saves update the entry of the saved
+    category without touching the others; journaled reviews adjust the
+    entry by the changed cards only.
+    """
+
+    def __init__(self, storage_path: str,
+                 deck_files: Callable[[], List[str]],
+                 signature: Callable[[str], list],
+                 load_deck: Callable[[str], List[Dict[str, Any]]]):
+        """
+        Initialize the manifest.
+
+        Args:
+            storage_path: Directory holding the deck files and the manifest
+            deck_files: Returns the paths of all deck files
+            signature: Returns the current signature of a deck file
+            load_deck: Loads the card data of a deck file
+        """
+        self.path = os.path.join(storage_path, MANIFEST_FILENAME)
+        self._deck_files = deck_files
+        self._signature = signature
+        self._load_deck = load_deck
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None  # deck file name -> entry
+        self._card_states: Dict[str, _CardStates] = {}  # deck file name -> states counted in its entry
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read the manifest file, returning no entries if it is missing or outdated."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if data.get('version') != MANIFEST_VERSION:
+            return {}
+        return data.get('decks', {})
+
+    def _write(self) -> None:
+        """Write the manifest file."""
+        data = {'version': MANIFEST_VERSION, 'decks': self._entries}
+        write_file_atomic(self.path, json.dumps(data, ensure_ascii=False))
+
+    @staticmethod
+    def _make_entry(summary: CategorySummary, signature: list) -> Dict[str, Any]:
+        """Build a manifest entry."""
+        return {
+            'category': summary.category,
+            'cards': summary.cards,
+            'new': summary.new,
+            'due_days': [[day, count] for day, count in sorted(summary.due_days.items())],
+            'signature': signature
+        }
+
+    @staticmethod
+    def _to_summary(entry: Dict[str, Any]) -> CategorySummary:
+        """Convert a manifest entry into a summary."""
+        return CategorySummary(
+            category=entry['category'],
+            cards=entry['cards'],
+            new=entry['new'],
+            due_days={day: count for day, count in entry['due_days']}
+        )
+
+    def _build_entry(self, deck_path: str) -> Optional[Dict[str, Any]]:
+        """Parse a deck file and summarize it."""
+        signature = self._signature(deck_path)
+        cards = [Flashcard.from_dict(data) for data in self._load_deck(deck_path)]
+        if not cards:
+            return None
+        summary = CategorySummary.from_cards(cards[0].category, cards)
+        return self._make_entry(summary, signature)
+
+    def summaries(self) -> List[CategorySummary]:
+        """
+        Get the summaries of all decks, re-reading only changed deck files.
+
+        Returns:
+            List[CategorySummary]: Summaries sorted by category name
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            changed = False
+            deck_paths = {os.path.basename(path): path for path in self._deck_files()}
+            for name in list(self._entries):
+                if name not in deck_paths:
+                    del self._entries[name]
+                    self._card_states.pop(name, None)
+                    changed = True
+            for name, deck_path in deck_paths.items():
+                entry = self._entries.get(name)
+                if entry is not None and entry['signature'] == self._signature(deck_path):
+                    continue
+                entry = self._build_entry(deck_path)
+                # Changed by another writer; count the whole deck on its next update
+                self._card_states.pop(name, None)
+                if entry is None:
+                    self._entries.pop(name, None)
+                else:
+                    self._entries[name] = entry
+                changed = True
+            if changed:
+                self._write()
+            return sorted(
+                (self._to_summary(entry) for entry in self._entries.values()),
+                key=lambda summary: summary.category
+            )
+
+    def _summarize(self, name: str, category: str, cards: Sequence[Flashcard]) -> CategorySummary:
+        """Count all cards of a deck and remember each card's state for later deltas."""
+        self._card_states[name] = _CardStates(cards)
+        return CategorySummary.from_cards(category, cards)
+
+    def update(self, deck_path: str, category: str, cards: Sequence[Flashcard]) -> None:
+        """
+        Refresh the entry of a deck after it was saved.
+
+        Args:
+            deck_path: Path of the saved deck file
+            category: Category name
+            cards: All cards of the category
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            name = os.path.basename(deck_path)
+            summary = self._summarize(name, category, cards)
+            self._entries[name] = self._make_entry(summary, self._signature(deck_path))
+            self._write()
+
+    def update_cards(self, deck_path: str, category: str, changed: Sequence[Flashcard],
+                     cards: Sequence[Flashcard]) -> None:
+        """
+        Adjust the entry of a deck for cards added or reviewed since its last update.
+
+        Only the changed cards are counted, so the cost does not grow with
+        the deck; the whole deck is counted once per process, on the first
+        update of a deck this manifest has not summarized yet.
+
+        Args:
+            deck_path: Path of the saved deck file
+            category: Category name
+            changed: Cards that were added or reviewed
+            cards: All cards of the category
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            name = os.path.basename(deck_path)
+            states = self._card_states.get(name)
+            if states is None or name not in self._entries:
+                summary = self._summarize(name, category, cards)
+            else:
+                summary = self._to_summary(self._entries[name])
+                for card in changed:
+                    old, (is_new, day) = states.replace(card)
+                    if old is None:
+                        summary.cards += 1
+                    else:
+                        was_new, old_day = old
+                        summary.new -= was_new
+                        remaining = summary.due_days[old_day] - 1
+                        if remaining:
+                            summary.due_days[old_day] = remaining
+                        else:
+                            del summary.due_days[old_day]
+                    summary.new += is_new
+                    summary.due_days[day] = summary.due_days.get(day, 0) + 1
+            self._entries[name] = self._make_entry(summary, self._signature(deck_path))
+            self._write()
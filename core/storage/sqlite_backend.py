@@ -0,0 +1,166 @@
+"""
+SQLite storage backend with per-card upserts.
+"""
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+from core.flashcard import Flashcard, STORED_FIELDS
+from core.storage.base import CategorySummary, StorageBackend
+from core.utils.file_handler import ensure_storage_dir
+
+CARD_COLUMNS = STORED_FIELDS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    category TEXT NOT NULL,
+    interval INTEGER NOT NULL DEFAULT 1,
+    last_review TEXT,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    easiness REAL NOT NULL DEFAULT 2.5,
+    score INTEGER NOT NULL DEFAULT 0,
+    due_day INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (category, question, answer)
+);
+CREATE INDEX IF NOT EXISTS idx_cards_category_due ON cards (category, due_day);
+"""
+
+UPSERT_SQL = """
+INSERT INTO cards ({columns}, due_day) VALUES ({placeholders}, ?)
+ON CONFLICT (category, question, answer) DO UPDATE SET
+    interval = excluded.interval,
+    last_review = excluded.last_review,
+    repetitions = excluded.repetitions,
+    easiness = excluded.easiness,
+    score = excluded.score,
+    due_day = excluded.due_day
+""".format(
+    columns=', '.join(CARD_COLUMNS),
+    placeholders=', '.join('?' for _ in CARD_COLUMNS)
+)
+
+SELECT_SQL = "SELECT {columns} FROM cards".format(columns=', '.join(CARD_COLUMNS))
+
+class SqliteStorageBackend(StorageBackend):
+    """
+    Stores all cards in one SQLite database running in WAL mode.
+
+    A review writes a single row, and cards are indexed by category and
+    due day so due queries do not have to load the whole category.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the backend.
+
+        Args:
+            db_path: Path to the database file, created if missing
+        """
+        self.db_path = db_path
+        ensure_storage_dir(os.path.dirname(os.path.abspath(db_path)))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    @staticmethod
+    def _row_values(card: Flashcard) -> tuple:
+        """Get the column values of a card."""
+        return tuple(getattr(card, column) for column in CARD_COLUMNS) + (card.due_day,)
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a select and return the rows as card data."""
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip(CARD_COLUMNS, row)) for row in rows]
+
+    def list_categories(self) -> List[str]:
+        """Get the names of all stored categories."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT category FROM cards ORDER BY category"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def load_category(self, category: str) -> List[Dict[str, Any]]:
+        """Load the stored card data of a category."""
+        return self._query(SELECT_SQL + " WHERE category = ? ORDER BY rowid", (category,))
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Load the stored card data of every category."""
+        return self._query(SELECT_SQL + " ORDER BY rowid")
+
+    def load_due(self, category: str, today: int, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Load the cards of a category that are due, most overdue first.
+
+        Args:
+            category: Category name
+            today: Ordinal of the current day
+            limit: Maximum number of cards to return
+
+        Returns:
+            List[Dict[str, Any]]: Card data of due cards
+        """
+        sql = SELECT_SQL + " WHERE category = ? AND due_day <= ? ORDER BY due_day, rowid"
+        params: tuple = (category, today)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return self._query(sql, params)
+
+    def count_due(self, category: str, today: int) -> int:
+        """Count the due cards of a category."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM cards WHERE category = ? AND due_day <= ?",
+                (category, today)
+            ).fetchone()
+        return row[0]
+
+    def category_summaries(self) -> List[CategorySummary]:
+        """Get card counts for every category with aggregate queries."""
+        with self._lock:
+            totals = self._conn.execute(
+                "SELECT category, COUNT(*), SUM(last_review IS NULL) FROM cards "
+                "GROUP BY category ORDER BY category"
+            ).fetchall()
+            days = self._conn.execute(
+                "SELECT category, due_day, COUNT(*) FROM cards GROUP BY category, due_day"
+            ).fetchall()
+        summaries = {
+            category: CategorySummary(category=category, cards=cards, new=new or 0)
+            for category, cards, new in totals
+        }
+        for category, day, count in days:
+            summaries[category].due_days[day] = count
+        return list(summaries.values())
+
+    def save_category(self, category: str, cards: Sequence[Flashcard]) -> bool:
+        """Replace the stored cards of a category."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM cards WHERE category = ?", (category,))
+                self._conn.executemany(UPSERT_SQL, [self._row_values(card) for card in cards])
+            return True
+        except sqlite3.Error:
+            return False
+
+    def save_cards(self, category: str, changed: Sequence[Flashcard],
+                   category_cards: Sequence[Flashcard]) -> bool:
+        """Upsert only the changed cards."""
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(UPSERT_SQL, [self._row_values(card) for card in changed])
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
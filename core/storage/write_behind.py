@@ -0,0 +1,68 @@
+"""
+Write-behind persistence with dirty tracking and background flushing.
+"""
+import threading
+import weakref
+from typing import Callable, Optional, Set
+
+_active_flushers: 'weakref.WeakSet[WriteBehindFlusher]' = weakref.WeakSet()
+
+def flush_all() -> None:
+    """Flush every live write-behind flusher, e.g. when the app pauses or stops."""
+    for flusher in list(_active_flushers):
+        flusher.flush()
+
+class WriteBehindFlusher:
+    """
+    Coalesces writes of dirty categories into one delayed flush.
+
+    The first category marked dirty starts a timer; everything marked dirty
+    before it fires is written in a single flush on the timer thread.
+    """
+
+    def __init__(self, write: Callable[[str], None], delay: float = 2.0):
+        """
+        Initialize the flusher.
+
+        Args:
+            write: Callback persisting one category
+            delay: Seconds to wait before flushing dirty categories
+        """
+        self._write = write
+        self.delay = delay
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        _active_flushers.add(self)
+
+    @property
+    def dirty(self) -> Set[str]:
+        """Categories waiting to be written."""
+        with self._lock:
+            return set(self._dirty)
+
+    def mark_dirty(self, category: str) -> None:
+        """
+        Schedule a category to be written on the next flush.
+
+        Args:
+            category: Category name
+        """
+        with self._lock:
+            self._dirty.add(category)
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write all dirty categories now."""
+        with self._flush_lock:
+            with self._lock:
+                categories, self._dirty = self._dirty, set()
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            for category in sorted(categories):
+                self._write(category)
@@ -0,0 +1,165 @@
+"""
+Opt-in start-up tracing in the Chrome trace event format.
+
+Set FLASHCARDS_TRACE to an output path, e.g.
+
+    FLASHCARDS_TRACE=startup.json python main.py
+
+and open the written file in chrome://tracing or Perfetto. Without the
+variable every span is a no-op.
+"""
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+
+TRACE_ENV = 'FLASHCARDS_TRACE'
+
+_NO_SPAN = nullcontext()
+
+class StartupTrace:
+    """
+    Collects wall-clock spans as Chrome trace 'complete' events.
+
+    Spans on one thread nest by time, so nested imports and the screens
+    built inside App.build show up as a flame chart.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the trace.
+
+        Args:
+            path: File the trace is written to
+        """
+        self.path = path
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._original_import = None
+
+    def _now(self) -> float:
+        """Get the microseconds since the trace started."""
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def add(self, name: str, cat: str, start: float, end: float,
+            args: Optional[Dict[str, Any]] = None) -> None:
+        """Record a finished span; times are from _now."""
+        event = {
+            'name': name, 'cat': cat, 'ph': 'X',
+            'ts': round(start, 1), 'dur': round(end - start, 1),
+            'pid': self._pid, 'tid': threading.get_ident()
+        }
+        if args:
+            event['args'] = args
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, cat: str, **args) -> Iterator[None]:
+        """Record the time spent in a block."""
+        start = self._now()
+        try:
+            yield
+        finally:
+            self.add(name, cat, start, self._now(), args)
+
+    def trace_imports(self) -> None:
+        """Record a span for every module imported from now on."""
+        if self._original_import is not None:
+            return
+        original_import = self._original_import = builtins.__import__
+
+        def traced_import(name, globals=None, locals=None, fromlist=(), level=0):
+            module = name
+            if level and globals:
+                package = globals.get('__package__') or ''
+                base = package.rsplit('.', level - 1)[0] if level > 1 else package
+                module = f'{base}.{name}' if name else base
+            if module in sys.modules:
+                return original_import(name, globals, locals, fromlist, level)
+            with self.span(module, 'import'):
+                return original_import(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = traced_import
+
+    def stop_imports(self) -> None:
+        """Stop recording imports."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def save(self) -> bool:
+        """
+        Write the spans recorded so far.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        with self._lock:
+            data = {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            return True
+        except OSError:
+            return False
+
+_trace: Optional[StartupTrace] = None
+
+def start_trace(path: Optional[str] = None) -> Optional[StartupTrace]:
+    """
+    Start tracing if a path is given or FLASHCARDS_TRACE is set.
+
+    Args:
+        path: Output file; defaults to the environment variable
+
+    Returns:
+        Optional[StartupTrace]: The active trace, or None if tracing is off
+    """
+    global _trace
+    path = path or os.environ.get(TRACE_ENV)
+    if not path:
+        return None
+    if _trace is None:
+        _trace = StartupTrace(path)
+        _trace.trace_imports()
+    return _trace
+
+def stop_trace() -> None:
+    """Write and end the active trace."""
+    global _trace
+    if _trace is not None:
+        _trace.stop_imports()
+        _trace.save()
+        _trace = None
+
+def get_trace() -> Optional[StartupTrace]:
+    """Get the active trace, if any."""
+    return _trace
+
+def span(name: str, cat: str = 'app', **args):
+    """
+    Time a block in the active trace.
+
+    Args:
+        name: Span name
+        cat: Span category, e.g. 'kv', 'screen' or 'load'
+        **args: Details shown with the span
+
+    Returns:
+        A context manager; a shared no-op one when tracing is off
+    """
+    if _trace is None:
+        return _NO_SPAN
+    return _trace.span(name, cat, **args)
+
+def save_trace() -> None:
+    """Write the spans recorded so far, keeping the trace active."""
+    if _trace is not None:
+        _trace.save()
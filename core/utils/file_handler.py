@@ -31,9 +31,65 @@ def load_json_file(file_path: str) -> List[Dict[str, Any]]:
     except (FileNotFoundError, json.JSONDecodeError):
         return []
 
+def write_file_atomic(file_path: str, text: str) -> bool:
+    """
+    Writes text to a file atomically, UTF-8 encoded.
+    
+    Args:
+        file_path (str): Path to the file
+        text (str): The text to write
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        data = text.encode('utf-8')
+    except UnicodeEncodeError:
+        return False
+    return write_bytes_atomic(file_path, data)
+
+def write_bytes_atomic(file_path: str, data: bytes) -> bool:
+    """
+    Writes binary data to a file atomically.
+
+    The data is written and synced to a temporary file that then replaces
+    the target, so a crash mid-write never leaves a truncated file behind.
+
+    Args:
+        file_path (str): Path to the file
+        data (bytes): The data to write
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    temp_path = file_path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+        return True
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+def dump_json(data: List[Dict[str, Any]]) -> str:
+    """
+    Serializes data in the deck file format.
+    
+    Args:
+        data: The data to serialize
+        
+    Returns:
+        str: The JSON text
+    """
+    return json.dumps(data, ensure_ascii=False, indent=4)
+
 def save_json_file(file_path: str, data: List[Dict[str, Any]]) -> bool:
     """
-    Saves data to a JSON file.
+    Saves data to a JSON file atomically.
     
     Args:
         file_path (str): Path to the JSON file
@@ -43,8 +99,7 @@ def save_json_file(file_path: str, data: List[Dict[str, Any]]) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        return True
-    except Exception:
-        return False
\ No newline at end of file
+        text = dump_json(data)
+    except (TypeError, ValueError):
+        return False
+    return write_file_atomic(file_path, text)
@@ -1,21 +1,49 @@
 """
 Text processing package initialization.
 """
-from .normalizer import normalize_text
+from .normalizer import normalize_text, normalize_answer, NormalizedText, NORMALIZER_VERSION
 from .formatter import format_display_text
+from .layout import TextLayout, get_layout, wrap_text
 from .validator import validate_text_input
-from .answer_processor import process_answer, compare_answers
+from .answer_processor import (
+    process_answer, compare_answers, compare_answer_key, grade_answer, grade_answer_key,
+    AnswerKey, AnswerVerdict
+)
 from .line_processor import process_line_breaks
 from .special_chars import normalize_special_chars
 from .grammar_processor import compare_grammar
+from .fuzzy_matcher import bounded_edit_distance
+from .folding import (
+    FoldingProfile, PROFILES, set_category_languages, get_category_languages,
+    add_answer_sides, clear_answer_sides, card_answer_language
+)
 
 __all__ = [
     'normalize_text',
+    'normalize_answer',
+    'NormalizedText',
+    'NORMALIZER_VERSION',
     'format_display_text',
+    'TextLayout',
+    'get_layout',
+    'wrap_text',
     'validate_text_input',
     'process_answer',
     'compare_answers',
+    'compare_answer_key',
+    'grade_answer',
+    'grade_answer_key',
+    'AnswerKey',
+    'AnswerVerdict',
     'process_line_breaks',
     'normalize_special_chars',
-    'compare_grammar'
+    'compare_grammar',
+    'bounded_edit_distance',
+    'FoldingProfile',
+    'PROFILES',
+    'set_category_languages',
+    'get_category_languages',
+    'add_answer_sides',
+    'clear_answer_sides',
+    'card_answer_language'
 ]
\ No newline at end of file
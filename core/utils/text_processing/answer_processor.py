@@ -1,9 +1,59 @@
 """
 Answer processing utilities for flashcard validation.
 """
-from .normalizer import normalize_text
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+from .normalizer import normalize_answer, normalize_text, NORMALIZER_VERSION
 from .line_processor import process_line_breaks
-from .grammar_processor import compare_grammar
+from .fuzzy_matcher import match_with_typos
+
+class AnswerVerdict(Enum):
+    """Result of grading a user answer."""
+    CORRECT = 'correct'
+    TYPO = 'typo'  # Close enough to accept, with typos
+    WRONG = 'wrong'
+
+@dataclass(frozen=True, slots=True)
+class AnswerKey:
+    """Precomputed comparison form of a correct answer."""
+    normalized: str
+    version: int = NORMALIZER_VERSION
+
+    @classmethod
+    def build(cls, answer: str) -> 'AnswerKey':
+        """Normalize a correct answer once for repeated comparisons."""
+        return cls(normalized=normalize_text(answer))
+
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """Grammar parts of the answer, split from the normalized form."""
+        # The normalized form is folded already; only commas are split off,
+        # as normalize_answer does, without going through its shared cache
+        return tuple(self.normalized.replace(',', ' , ').split())
+
+    @classmethod
+    def from_dict(cls, data: Any) -> Optional['AnswerKey']:
+        """
+        Restore a stored key.
+
+        Args:
+            data: Key data as stored in a deck file
+
+        Returns:
+            Optional[AnswerKey]: The key, or None if it is malformed or was
+            built by another normalizer version
+        """
+        try:
+            if data['version'] != NORMALIZER_VERSION:
+                return None
+            return cls(normalized=data['normalized'])
+        except (KeyError, TypeError):
+            return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the key data for storage."""
+        return {'version': self.version, 'normalized': self.normalized}
 
 def process_answer(answer: str, preserve_formatting: bool = False) -> str:
     """
@@ -31,20 +81,72 @@ def compare_answers(user_answer: str, correct_answer: str) -> bool:
     Returns:
         bool: True if answers match
     """
-    # Normalize both answers for comparison
-    normalized_user = normalize_text(user_answer)
-    normalized_correct = normalize_text(correct_answer)
-    
-    # First try exact match after normalization
-    if normalized_user == normalized_correct:
-        return True
-        
-    # Try comparing with preserved line breaks
-    processed_user = process_line_breaks(user_answer)
-    processed_correct = process_line_breaks(correct_answer)
-    if processed_user == processed_correct:
-        return True
-        
-    # If no exact match, try grammar comparison
-    is_match, _ = compare_grammar(user_answer, correct_answer)
-    return is_match
\ No newline at end of file
+    # Normalize both answers once; equal texts up to line breaks normalize
+    # equally, and otherwise the grammar parts are compared
+    normalized_user = normalize_answer(user_answer)
+    normalized_correct = normalize_answer(correct_answer)
+    return (normalized_user.text == normalized_correct.text or
+            normalized_user.parts == normalized_correct.parts)
+
+def grade_answer_key(user_answer: str, key: AnswerKey, tolerate_typos: bool = True) -> AnswerVerdict:
+    """
+    Grade a user answer against a precomputed answer key.
+
+    Args:
+        user_answer: User's input answer
+        key: Key of the correct answer
+        tolerate_typos: Accept answers whose words are slightly misspelled
+
+    Returns:
+        AnswerVerdict: CORRECT for a match, TYPO for a match up to typos,
+        WRONG otherwise
+    """
+    normalized_user = normalize_answer(user_answer)
+    if normalized_user.text == key.normalized:
+        return AnswerVerdict.CORRECT
+    # Answers equal up to line breaks normalize equally, so that check is
+    # covered above; fall back to the grammar comparison
+    correct_parts = key.tokens
+    if normalized_user.parts == correct_parts:
+        return AnswerVerdict.CORRECT
+    if tolerate_typos and match_with_typos(normalized_user.parts, correct_parts):
+        return AnswerVerdict.TYPO
+    return AnswerVerdict.WRONG
+
+def grade_answer(user_answer: str, correct_answer: str, language: Optional[str] = None,
+                 tolerate_typos: bool = True) -> AnswerVerdict:
+    """
+    Grade a user answer with the folding profile of the answer's language.
+
+    Args:
+        user_answer: User's input answer
+        correct_answer: Correct answer to compare against
+        language: Folding profile name, None for the default folding
+        tolerate_typos: Accept answers whose words are slightly misspelled
+
+    Returns:
+        AnswerVerdict: CORRECT, TYPO or WRONG
+    """
+    normalized_user = normalize_answer(user_answer, language)
+    normalized_correct = normalize_answer(correct_answer, language)
+    if (normalized_user.text == normalized_correct.text or
+            normalized_user.parts == normalized_correct.parts):
+        return AnswerVerdict.CORRECT
+    if tolerate_typos and match_with_typos(normalized_user.parts, normalized_correct.parts):
+        return AnswerVerdict.TYPO
+    return AnswerVerdict.WRONG
+
+def compare_answer_key(user_answer: str, key: AnswerKey) -> bool:
+    """
+    Compare a user answer with a precomputed answer key.
+
+    Equivalent to compare_answers, but only the user's answer is normalized.
+
+    Args:
+        user_answer: User's input answer
+        key: Key of the correct answer
+
+    Returns:
+        bool: True if answers match
+    """
+    return grade_answer_key(user_answer, key, tolerate_typos=False) is AnswerVerdict.CORRECT
@@ -0,0 +1,187 @@
+"""
+Language-aware character folding for answer comparison.
+"""
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
+
+@dataclass(frozen=True)
+class FoldingProfile:
+    """
+    Character folding rules of one language.
+
+    The folding table is compiled once into a str.translate table, so
+    folding a text is a single C-level pass.
+    """
+    name: str
+    char_map: Dict[str, str] = field(hash=False)
+    # Strip accents the table leaves, e.g. of loanwords
+    strip_accents: bool = True
+    # Characters and words that identify text of this language
+    marker_chars: FrozenSet[str] = frozenset()
+    marker_words: FrozenSet[str] = frozenset()
+    table: Dict[int, str] = field(init=False, hash=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'table', str.maketrans(self.char_map))
+
+    def fold(self, text: str) -> str:
+        """Fold lowercase text for comparison."""
+        if text.isascii():
+            return text
+        # Compose first so decomposed input (e.g. o + combining diaeresis) matches the table
+        text = unicodedata.normalize('NFC', text).translate(self.table)
+        if self.strip_accents:
+            text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+        return text
+
+GERMAN = FoldingProfile(
+    name='de',
+    # Umlauts fold to their usual transliteration, so 'Kaese' matches 'Käse'
+    char_map={'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'},
+    marker_chars=frozenset('äß'),
+    marker_words=frozenset(('der', 'die', 'das', 'ein', 'eine', 'sich', 'hat', 'ist', 'und'))
+)
+
+HUNGARIAN = FoldingProfile(
+    name='hu',
+    # Accents are meaningful ('kör' is not 'kor'); circumflex and tilde are
+    # common substitutes for the double acute on keyboards without ő and ű
+    char_map={'ô': 'ő', 'õ': 'ő', 'û': 'ű', 'ũ': 'ű'},
+    strip_accents=False,
+    marker_chars=frozenset('áéíóőúű'),
+    marker_words=frozenset(('a', 'az', 'egy', 'és', 'nem', 'van', 'meg'))
+)
+
+PROFILES: Dict[str, FoldingProfile] = {profile.name: profile for profile in (GERMAN, HUNGARIAN)}
+
+# Languages of the two sides of each category's cards, e.g. ('de', 'hu')
+_category_languages: Dict[str, Tuple[str, ...]] = {}
+# Side of each paired card's answer by creation order: category -> (question, answer) -> side
+_answer_sides: Dict[str, Dict[Tuple[str, str], int]] = {}
+
+def set_category_languages(category: str, languages: Optional[Sequence[str]]) -> None:
+    """
+    Select the folding profiles of a category.
+
+    Args:
+        category: Category name
+        languages: Profile names of the card sides, or None for the
+            language-independent folding
+
+    Raises:
+        ValueError: If a language has no profile
+    """
+    if not languages:
+        _category_languages.pop(category, None)
+        return
+    unknown = [language for language in languages if language not in PROFILES]
+    if unknown:
+        raise ValueError(f"No folding profile for language(s): {', '.join(unknown)}")
+    _category_languages[category] = tuple(languages)
+
+def get_category_languages(category: str) -> Optional[Tuple[str, ...]]:
+    """Get the languages selected for a category, if any."""
+    return _category_languages.get(category)
+
+def add_answer_sides(category: str, pairs: Iterable[Tuple[str, str]]) -> None:
+    """
+    Record which side the answers of a category's cards are on.
+
+    Cards are created in pairs: the card as entered, with its question on
+    the first side and its answer on the second, followed by its reverse.
+    Of two cards with swapped question and answer, the earlier one is
+    therefore the entered card. Cards without their reverse among the
+    pairs are left to language detection.
+
+    Args:
+        category: Category name
+        pairs: (question, answer) of the cards in creation order
+    """
+    sides = _answer_sides.setdefault(category, {})
+    unpaired = set()
+    for question, answer in pairs:
+        key = (question, answer)
+        if key in sides:
+            continue
+        if (answer, question) in unpaired:
+            unpaired.discard((answer, question))
+            sides[(answer, question)] = 1
+            sides[key] = 0
+        else:
+            unpaired.add(key)
+
+def clear_answer_sides(category: str) -> None:
+    """Forget the recorded answer sides of a category."""
+    _answer_sides.pop(category, None)
+
+def detect_language(text: str, languages: Sequence[str]) -> Optional[str]:
+    """
+    Guess which of some languages a text is written in.
+
+    Args:
+        text: Text to classify
+        languages: Candidate profile names
+
+    Returns:
+        Optional[str]: The only language with the most markers, or None
+    """
+    lowered = text.lower()
+    words = set(lowered.replace(',', ' ').split())
+    scores = {}
+    for language in languages:
+        profile = PROFILES[language]
+        scores[language] = (sum(1 for char in lowered if char in profile.marker_chars) +
+                            len(words & profile.marker_words))
+    best = max(scores.values(), default=0)
+    winners = [language for language, score in scores.items() if score == best]
+    return winners[0] if best and len(winners) == 1 else None
+
+@lru_cache(maxsize=4096)
+def answer_language(question: str, answer: str, languages: Tuple[str, ...]) -> Optional[str]:
+    """
+    Get the language of a card's answer.
+
+    Cards are created in both directions, so the answer side is detected
+    from the answer itself or, failing that, as the language the
+    question is not in.
+
+    Args:
+        question: Card question
+        answer: Card answer
+        languages: Languages of the category
+
+    Returns:
+        Optional[str]: Profile name, or None if the side is ambiguous
+    """
+    language = detect_language(answer, languages)
+    if language is not None:
+        return language
+    question_language = detect_language(question, languages)
+    others = [other for other in languages if other != question_language]
+    return others[0] if question_language is not None and len(others) == 1 else None
+
+def card_answer_language(category: str, question: str, answer: str) -> Optional[str]:
+    """
+    Get the language of a card's answer in its category.
+
+    The side recorded from the card's creation order decides; cards
+    without a recorded side fall back to detection.
+
+    Args:
+        category: Category of the card
+        question: Card question
+        answer: Card answer
+
+    Returns:
+        Optional[str]: Profile name, or None if the category selects no
+        languages or the side cannot be told
+    """
+    languages = _category_languages.get(category)
+    if not languages:
+        return None
+    side = _answer_sides.get(category, {}).get((question, answer))
+    if side is not None and len(languages) == 2:
+        return languages[side]
+    return answer_language(question, answer, languages)
@@ -1,6 +1,7 @@
 """
 Text formatting utilities.
 """
+from .layout import wrap_text
 
 def format_display_text(text: str, max_length: int = 40) -> str:
     """
@@ -13,19 +14,4 @@ def format_display_text(text: str, max_length: int = 40) -> str:
     Returns:
         Formatted text with line breaks
     """
-    words = text.split()
-    lines = []
-    current_line = []
-    
-    for word in words:
-        if len(' '.join(current_line + [word])) <= max_length:
-            current_line.append(word)
-        else:
-            if current_line:
-                lines.append(' '.join(current_line))
-            current_line = [word]
-    
-    if current_line:
-        lines.append(' '.join(current_line))
-    
-    return '\n'.join(lines)
\ No newline at end of file
+    return wrap_text(text, max_length)
@@ -0,0 +1,90 @@
+"""
+Typo-tolerant matching of normalized answers.
+"""
+from typing import Dict, Sequence
+
+def bounded_edit_distance(text1: str, text2: str, max_distance: int) -> int:
+    """
+    Edit distance of two strings, computed up to a bound.
+
+    Counts insertions, deletions, substitutions and swaps of adjacent
+    characters (optimal string alignment). Uses Hyyrö's bit-parallel
+    algorithm with the shorter string as the pattern, so each character
+    of the longer string costs a few integer operations regardless of
+    the pattern length. The scan stops as soon as the distance is known
+    to exceed max_distance.
+
+    Args:
+        text1: First string
+        text2: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        int: The distance, or max_distance + 1 if it is larger
+    """
+    if text1 == text2:
+        return 0
+    if len(text1) > len(text2):
+        text1, text2 = text2, text1
+    m, n = len(text1), len(text2)
+    if n - m > max_distance:
+        return max_distance + 1
+    if not m:
+        return n
+
+    peq: Dict[str, int] = {}  # Bit mask of the pattern positions of each character
+    for i, char in enumerate(text1):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    vp, vn, d0, previous_eq, score = mask, 0, 0, 0, m
+    for j, char in enumerate(text2):
+        eq = peq.get(char, 0)
+        swap = ((~d0 & eq) << 1) & previous_eq
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn | swap
+        hp = vn | ~(d0 | vp)
+        hn = d0 & vp
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        # The remaining characters can lower the distance by at most one each
+        if score - (n - j - 1) > max_distance:
+            return max_distance + 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(d0 | hp)) & mask
+        vn = d0 & hp & mask
+        previous_eq = eq
+    return score if score <= max_distance else max_distance + 1
+
+def typo_allowance(word: str) -> int:
+    """Get the number of typos accepted in a word; short words must match exactly."""
+    if len(word) < 4:
+        return 0
+    return 1 if len(word) < 9 else 2
+
+def match_with_typos(user_parts: Sequence[str], correct_parts: Sequence[str]) -> bool:
+    """
+    Check whether an answer differs from the correct one only by typos.
+
+    Parts are compared pairwise, each within the allowance of the correct
+    part, so a misspelled word is accepted but a wrong article is not.
+    Answers split into a different number of parts are only accepted if
+    they differ in spacing alone.
+
+    Args:
+        user_parts: Grammar parts of the normalized user answer
+        correct_parts: Grammar parts of the normalized correct answer
+
+    Returns:
+        bool: True if every difference is within the typo allowance
+    """
+    if len(user_parts) != len(correct_parts):
+        return ''.join(user_parts) == ''.join(correct_parts)
+    for user, correct in zip(user_parts, correct_parts):
+        if user != correct:
+            allowance = typo_allowance(correct)
+            if not allowance or bounded_edit_distance(user, correct, allowance) > allowance:
+                return False
+    return True
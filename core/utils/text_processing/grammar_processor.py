@@ -2,15 +2,12 @@
 Grammar-specific text processing utilities.
 """
 from typing import List, Tuple
-from .normalizer import normalize_text
+from .normalizer import normalize_answer
 
 def extract_grammar_parts(text: str) -> List[str]:
     """Extract grammatical components from text."""
     # Normalize first to handle special characters
-    text = normalize_text(text)
-    # Split by common grammar separators
-    parts = text.replace(',', ' , ').split()
-    return [part.strip() for part in parts if part.strip()]
+    return list(normalize_answer(text).parts)
 
 def compare_grammar(text1: str, text2: str) -> Tuple[bool, List[str]]:
     """Compare two texts for grammatical equivalence."""
@@ -0,0 +1,107 @@
+"""
+Word wrapping for card display.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+# Wrapped texts kept per layout
+LAYOUT_CACHE_SIZE = 1024
+# Word widths kept per layout before the table is reset
+WORD_CACHE_SIZE = 8192
+
+class TextLayout:
+    """
+    Greedy word wrapping in the width units of a font.
+
+    Words are measured once and lines are filled by adding up word
+    widths, so wrapping is linear in the length of the text. Wrapped
+    texts are cached by text and width.
+    """
+
+    def __init__(self, measure: Callable[[str], float] = len, cache_size: int = LAYOUT_CACHE_SIZE):
+        """
+        Initialize the layout.
+
+        Args:
+            measure: Width of a string; by default its length in characters
+            cache_size: Number of wrapped texts to keep
+        """
+        self.measure = measure
+        self.cache_size = cache_size
+        self._word_widths: Dict[str, float] = {}
+        self._wrapped: 'OrderedDict[Tuple[str, float], str]' = OrderedDict()
+
+    def word_width(self, word: str) -> float:
+        """Get the width of a word, measuring it on first use."""
+        width = self._word_widths.get(word)
+        if width is None:
+            if len(self._word_widths) >= WORD_CACHE_SIZE:
+                self._word_widths.clear()
+            width = self._word_widths[word] = self.measure(word)
+        return width
+
+    def wrap(self, text: str, max_width: float) -> str:
+        """
+        Break text into lines no wider than max_width.
+
+        Words wider than a line get a line of their own.
+
+        Args:
+            text: Text to wrap; existing whitespace is collapsed
+            max_width: Line width in the units of measure
+
+        Returns:
+            str: Lines joined by line breaks
+        """
+        key = (text, max_width)
+        wrapped = self._wrapped.get(key)
+        if wrapped is not None:
+            self._wrapped.move_to_end(key)
+            return wrapped
+
+        space = self.word_width(' ')
+        lines = []
+        line = []
+        line_width = 0.0
+        for word in text.split():
+            width = self.word_width(word)
+            if line and line_width + space + width > max_width:
+                lines.append(' '.join(line))
+                line = [word]
+                line_width = width
+            else:
+                line_width = line_width + space + width if line else width
+                line.append(word)
+        if line:
+            lines.append(' '.join(line))
+        wrapped = '\n'.join(lines)
+
+        self._wrapped[key] = wrapped
+        if len(self._wrapped) > self.cache_size:
+            self._wrapped.popitem(last=False)
+        return wrapped
+
+# Layout measuring characters, used when no font is known
+CHARACTER_LAYOUT = TextLayout()
+
+_layouts: Dict[Hashable, TextLayout] = {}
+
+def get_layout(font: Hashable, measure: Optional[Callable[[str], float]] = None) -> TextLayout:
+    """
+    Get the shared layout of a font, creating it on first use.
+
+    Args:
+        font: Key identifying the font, e.g. (font name, font size)
+        measure: Width function of the font, used when the layout is created
+
+    Returns:
+        TextLayout: Layout with the font's caches
+    """
+    layout = _layouts.get(font)
+    if layout is None:
+        layout = _layouts[font] = TextLayout(measure or len)
+    return layout
+
+def wrap_text(text: str, max_length: int = 40) -> str:
+    """Wrap text to lines of at most max_length characters."""
+    return CHARACTER_LAYOUT.wrap(text, max_length)
@@ -2,6 +2,51 @@
 Text normalization utilities.
 """
 import unicodedata
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+from .folding import PROFILES
+
+# Bump whenever normalize_text output changes so stored answer keys are rebuilt
+NORMALIZER_VERSION = 1
+
+# Recently normalized inputs kept for repeated checks of the same answer
+NORMALIZE_CACHE_SIZE = 1024
+
+class NormalizedText(NamedTuple):
+    """Comparison form of a text."""
+    text: str  # Normalized text
+    parts: Tuple[str, ...]  # Grammar parts, commas split off as separate parts
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_answer(text: str, language: Optional[str] = None) -> NormalizedText:
+    """
+    Normalize text and split it into grammar parts in one pass.
+    
+    ASCII input skips Unicode decomposition. Results are memoized, so
+    checking the same input again costs a cache lookup.
+    
+    Args:
+        text: Text to normalize
+        language: Folding profile name; by default all accents are removed
+        
+    Returns:
+        NormalizedText: Normalized text and its grammar parts
+    """
+    if text.isascii():
+        words = text.lower().split()
+        normalized = ' '.join(words)
+    elif language is not None:
+        words = PROFILES[language].fold(text.lower()).split()
+        normalized = ' '.join(words)
+    else:
+        # Decomposing may drop characters, so spaces are collapsed before it
+        normalized = ' '.join(text.split()).lower()
+        normalized = unicodedata.normalize('NFKD', normalized).encode('ascii', 'ignore').decode('ascii')
+        normalized = normalized.strip()
+        words = normalized.split()
+    if ',' in normalized:
+        words = normalized.replace(',', ' , ').split()
+    return NormalizedText(normalized, tuple(words))
 
 def normalize_text(text: str) -> str:
     """
@@ -13,11 +58,4 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text suitable for comparison
     """
-    # Remove line breaks and extra spaces
-    text = ' '.join(text.split())
-    
-    # Convert to lowercase and remove accents
-    text = text.lower()
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
-    
-    return text.strip()
\ No newline at end of file
+    return normalize_answer(text).text
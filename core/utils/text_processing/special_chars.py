@@ -19,6 +19,9 @@ def create_char_map() -> Dict[str, str]:
         'ò': 'o'
     }
 
+# Translation table of create_char_map, compiled once
+_CHAR_TABLE = str.maketrans(create_char_map())
+
 def normalize_special_chars(text: str) -> str:
     """
     Normalize special characters while preserving meaning.
@@ -29,11 +32,5 @@ def normalize_special_chars(text: str) -> str:
     Returns:
         Normalized text
     """
-    char_map = create_char_map()
-    normalized = unicodedata.normalize('NFKD', text)
-    
-    # Replace known special characters
-    for special, replacement in char_map.items():
-        normalized = normalized.replace(special, replacement)
-        
-    return normalized
\ No newline at end of file
+    # Replace known special characters in one pass
+    return unicodedata.normalize('NFKD', text).translate(_CHAR_TABLE)
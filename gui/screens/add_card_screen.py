@@ -1,16 +1,9 @@
 from kivy.uix.screenmanager import Screen
-from kivy.properties import ObjectProperty
-from core.manager import FlashcardManager
+from core.deck_cache import get_deck_cache
 from core.utils.validation import validate_card_input
 from gui.utils.ui_helpers import get_feedback_color
 
 class AddCardScreen(Screen):
-    flashcard_manager = ObjectProperty(None)
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.flashcard_manager = FlashcardManager()
-
     def on_kv_post(self, base_widget):
         """Called after kv file is loaded."""
         super().on_kv_post(base_widget)
@@ -30,9 +23,8 @@ class AddCardScreen(Screen):
 
     def get_categories(self):
         """Retrieve a sorted list of unique categories."""
-        categories = {getattr(card, 'category', 'Uncategorized') 
-                     for card in self.flashcard_manager.cards}
-        return sorted(categories) if categories else ["Default"]
+        categories = get_deck_cache().categories()
+        return categories if categories else ["Default"]
 
     def toggle_custom_category(self, selected_text):
         """Enable/disable the custom category input based on selection."""
@@ -58,7 +50,7 @@ class AddCardScreen(Screen):
             return
 
         # Add the card
-        result = self.flashcard_manager.add_card(question, answer, category)
+        result = get_deck_cache().add_card(question, answer, category)
         if not result:
             self.display_feedback("Card already exists!", get_feedback_color(False))
             return
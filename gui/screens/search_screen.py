@@ -1,88 +1,139 @@
 """
 Search screen implementation.
 """
+import queue
+import threading
 from kivy.uix.screenmanager import Screen
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.properties import StringProperty
 from kivy.clock import Clock
-from core.manager import FlashcardManager
+from kivy.utils import escape_markup
+from core.deck_cache import get_deck_cache
 from functools import partial
 
+# Number of hits appended to the result list per frame
+RESULT_BATCH_SIZE = 50
+# Batches a search worker computes ahead of the result list
+BATCHES_AHEAD = 2
+
+def highlight_spans(text, spans):
+    """Wrap the matched spans of a text in bold markup."""
+    parts = []
+    last = 0
+    for start, end in sorted(spans):
+        # Overlapping spans only bold the part not shown yet
+        start = max(start, last)
+        if end <= start:
+            continue
+        parts.append(escape_markup(text[last:start]))
+        parts.append(f"[b]{escape_markup(text[start:end])}[/b]")
+        last = end
+    parts.append(escape_markup(text[last:]))
+    return ''.join(parts)
+
+class SearchResultRow(RecycleDataViewBehavior, BoxLayout):
+    """Recycled row view showing one search hit."""
+    question_text = StringProperty('')
+    answer_text = StringProperty('')
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Render the markup of the hit this view is reused for."""
+        hit = data['hit']
+        self.question_text = highlight_spans(hit.card.question, hit.question_spans)
+        self.answer_text = highlight_spans(hit.card.answer, hit.answer_spans)
+        return super().refresh_view_attrs(rv, index, data)
+
+class SearchRequest:
+    """
+    A query answered on a worker thread.
+
+    The worker builds the search index if needed, ranks the matches and
+    computes match spans, queueing hit batches for the main thread to
+    take one per frame. At most BATCHES_AHEAD batches wait in the queue;
+    a None batch marks the end of the results.
+    """
+
+    def __init__(self, query, batch_size=RESULT_BATCH_SIZE):
+        self.query = query
+        self.batch_size = batch_size
+        self.batches = queue.Queue(maxsize=BATCHES_AHEAD)
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='search', daemon=True)
+
+    @property
+    def cancelled(self):
+        """Whether the search was cancelled."""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Cancel the search; the worker stops before its next batch."""
+        self._cancelled.set()
+
+    def start(self):
+        """Start the worker thread."""
+        self._thread.start()
+        return self
+
+    def _run(self):
+        """Rank the query's hits and queue them in batches (worker thread)."""
+        try:
+            index = get_deck_cache().search_index()
+            for batch in index.iter_search(self.query, batch_size=self.batch_size):
+                if not self._put(batch):
+                    return
+        finally:
+            self._put(None)
+
+    def _put(self, batch):
+        """Queue a batch once there is room; False if cancelled meanwhile."""
+        while not self.cancelled:
+            try:
+                self.batches.put(batch, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
 class SearchScreen(Screen):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.flashcard_manager = FlashcardManager()
-        
+    # Search whose hits are being fed into the result list
+    _request = None
+
     def on_text_change(self, instance, value):
         """Handle search text changes with debouncing."""
         Clock.unschedule(self._do_search)
         Clock.schedule_once(partial(self._do_search, value), 0.5)
         
     def _do_search(self, search_text, *args):
-        """Perform search in questions and update results."""
-        self.ids.results_grid.clear_widgets()
+        """Search questions and answers in the background and stream hits into the list."""
+        self._stop_feeding()
+        self.ids.results_list.data = []
         if not search_text:
             return
             
-        search_text = search_text.lower()
-        matching_cards = [
-            card for card in self.flashcard_manager.cards
-            if search_text in card.question.lower()
-        ]
-        
-        for card in matching_cards:
-            self.add_result_card(card)
-            
-    def add_result_card(self, card):
-        """Add a card-style result to the grid."""
-        from kivy.uix.boxlayout import BoxLayout
-        from kivy.uix.label import Label
-        
-        # Create card container
-        card_box = BoxLayout(
-            orientation='vertical',
-            size_hint_y=None,
-            height='120dp',
-            padding='10dp',
-            spacing='5dp'
-        )
-        
-        # Add white background with rounded corners
-        with card_box.canvas.before:
-            from kivy.graphics import Color, RoundedRectangle
-            Color(1, 1, 1, 0.9)
-            RoundedRectangle(pos=card_box.pos, size=card_box.size, radius=[15])
-        
-        # Question label
-        question_label = Label(
-            text=f"{card.question}",
-            color=(0.2, 0.2, 0.2, 1),
-            size_hint_y=None,
-            height='40dp',
-            halign='left',
-            valign='middle'
-        )
-        question_label.bind(width=lambda *x: setattr(question_label, 'text_size', (question_label.width, None)))
-        
-        # Answer label
-        answer_label = Label(
-            text=f"{card.answer}",
-            color=(0.2, 0.2, 0.2, 1),
-            size_hint_y=None,
-            height='40dp',
-            halign='left',
-            valign='middle'
-        )
-        answer_label.bind(width=lambda *x: setattr(answer_label, 'text_size', (answer_label.width, None)))
+        self._request = SearchRequest(search_text).start()
+        Clock.schedule_interval(self._feed_batch, 0)
         
-        card_box.bind(size=self._update_card_background)
-        card_box.add_widget(question_label)
-        card_box.add_widget(answer_label)
+    def _feed_batch(self, dt):
+        """Append the next ready batch of hits; stop once the results are exhausted."""
+        if self._request is None:
+            return False
+        try:
+            batch = self._request.batches.get_nowait()
+        except queue.Empty:
+            return  # Still searching
+        if batch is None:
+            self._request = None
+            return False
+        self.ids.results_list.data.extend({'hit': hit} for hit in batch)
         
-        self.ids.results_grid.add_widget(card_box)
+    def _stop_feeding(self):
+        """Cancel the search of the previous query."""
+        Clock.unschedule(self._feed_batch)
+        if self._request is not None:
+            self._request.cancel()
+            self._request = None
         
-    def _update_card_background(self, instance, value):
-        """Update card background when size/position changes."""
-        instance.canvas.before.clear()
-        with instance.canvas.before:
-            from kivy.graphics import Color, RoundedRectangle
-            Color(1, 1, 1, 0.9)
-            RoundedRectangle(pos=instance.pos, size=instance.size, radius=[15])
\ No newline at end of file
+    def on_leave(self):
+        """Stop feeding results when leaving the screen."""
+        self._stop_feeding()
@@ -1,11 +1,7 @@
 """
 Answer handling logic for study screens.
 """
-from core.utils.text_processing import (
-    process_answer,
-    compare_answers,
-    format_display_text
-)
+from core.utils.text_processing import AnswerVerdict, format_display_text
 from gui.utils.ui_feedback import format_feedback_message
 
 class AnswerHandler:
@@ -14,19 +10,18 @@ class AnswerHandler:
     def __init__(self, screen):
         self.screen = screen
         
-    def process_user_answer(self, user_input: str, correct_answer: str) -> bool:
+    def grade_user_answer(self, user_input: str, card) -> AnswerVerdict:
         """
-        Process and validate user answer.
+        Grade the user answer, accepting small typos.
         
         Args:
             user_input: User's answer
-            correct_answer: Correct answer to compare against
+            card: Card whose cached answer key is compared against
             
         Returns:
-            bool: True if answer is correct
+            AnswerVerdict: CORRECT, TYPO (rated as hard) or WRONG
         """
-        processed_input = process_answer(user_input)
-        return compare_answers(processed_input, correct_answer)
+        return card.grade_answer(user_input)
         
     def show_feedback(self, is_correct: bool, formatted_answer: str = None):
         """Display feedback for answer."""
@@ -40,4 +35,11 @@ class AnswerHandler:
             self.screen.ids.feedback_label.color = feedback['color']
             if formatted_answer:
                 self.screen.ids.user_input.text = formatted_answer
-                self.screen.ids.user_input.foreground_color = (0.8, 0, 0, 1)
\ No newline at end of file
+                self.screen.ids.user_input.foreground_color = (0.8, 0, 0, 1)
+                
+    def show_typo_feedback(self, formatted_answer: str):
+        """Display feedback for an answer accepted with typos."""
+        feedback = format_feedback_message("Accepted with a typo", True)
+        self.screen.ids.feedback_label.text = feedback['text']
+        self.screen.ids.feedback_label.color = feedback['color']
+        self.screen.ids.user_input.text = formatted_answer
@@ -1,7 +1,7 @@
 """
 Card display management for study screens.
 """
-from core.utils.text_processing import format_display_text
+from gui.utils.ui_helpers import format_for_widget
 
 class CardDisplay:
     """Manages card display formatting."""
@@ -11,13 +11,13 @@ class CardDisplay:
         
     def show_question(self, question: str):
         """Format and display question."""
-        formatted = format_display_text(question)
-        self.screen.ids.question_label.text = formatted
+        question_label = self.screen.ids.question_label
+        question_label.text = format_for_widget(question, question_label)
         
     def show_answer(self, answer: str):
         """Format and display answer."""
-        formatted = format_display_text(answer)
-        self.screen.ids.user_input.text = formatted
+        user_input = self.screen.ids.user_input
+        user_input.text = format_for_widget(answer, user_input)
         
     def clear_display(self):
         """Clear question and answer display."""
@@ -3,7 +3,7 @@ Card loading and management functionality.
 """
 from typing import List
 from core.flashcard import Flashcard
-from core.algorithm.sm2 import is_due
+from core.algorithm.sm2 import today_ordinal
 
 class CardLoader:
     """Handles loading and managing flashcards."""
@@ -11,8 +11,11 @@ class CardLoader:
     @staticmethod
     def get_due_cards(cards: List[Flashcard], category: str) -> List[Flashcard]:
         """Get cards due for review in a category."""
-        category_cards = [card for card in cards if card.category == category]
-        return [card for card in category_cards if is_due(card.last_review, card.interval)]
+        today = today_ordinal()
+        return [
+            card for card in cards
+            if card.category == category and card.due_day <= today
+        ]
 
     @staticmethod
     def format_question(card: Flashcard) -> str:
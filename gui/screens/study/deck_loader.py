@@ -0,0 +1,98 @@
+"""
+Background loading of study decks.
+"""
+import threading
+from typing import Callable, Optional
+from kivy.clock import Clock
+from core.deck_cache import get_deck_cache
+from core.manager import FlashcardManager
+
+class LoadCancelled(Exception):
+    """Raised inside a worker to abandon a cancelled load."""
+
+class DeckLoadRequest:
+    """
+    A pending deck load.
+
+    Callbacks run on the Kivy main thread and never after cancel() was
+    called there, so a screen can cancel a load for a category the user
+    has left and ignore it from then on.
+    """
+
+    def __init__(self, category: str, on_loaded: Callable[[FlashcardManager], None],
+                 on_progress: Optional[Callable[[int, int], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Initialize the request.
+
+        Args:
+            category: Category to load
+            on_loaded: Receives the loaded manager
+            on_progress: Receives (cards read, cards stored) while loading
+            on_error: Receives the exception if loading fails
+        """
+        self.category = category
+        self.on_loaded = on_loaded
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self._cancelled = threading.Event()
+        self._reported = -1  # Last percentage handed to on_progress
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the load was cancelled."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the load; the worker stops at its next progress report."""
+        self._cancelled.set()
+
+    def _report_progress(self, done: int, total: int) -> None:
+        """Forward progress to the main thread once per percent (worker thread)."""
+        if self.cancelled:
+            raise LoadCancelled(self.category)
+        if self.on_progress is None:
+            return
+        percent = done * 100 // total if total else 100
+        if percent != self._reported:
+            self._reported = percent
+            Clock.schedule_once(lambda dt: self._deliver(self.on_progress, done, total))
+
+    def _deliver(self, callback: Callable, *args) -> None:
+        """Run a callback on the main thread unless the load was cancelled."""
+        if not self.cancelled:
+            callback(*args)
+
+def _run(request: DeckLoadRequest) -> None:
+    """Load a request's deck and hand the outcome to the main thread (worker thread)."""
+    try:
+        manager = get_deck_cache().get_manager(request.category, progress=request._report_progress)
+    except LoadCancelled:
+        return
+    except Exception as e:
+        if request.on_error is not None:
+            Clock.schedule_once(lambda dt, error=e: request._deliver(request.on_error, error))
+        return
+    Clock.schedule_once(lambda dt: request._deliver(request.on_loaded, manager))
+
+def load_deck(category: str, on_loaded: Callable[[FlashcardManager], None],
+              on_progress: Optional[Callable[[int, int], None]] = None,
+              on_error: Optional[Callable[[Exception], None]] = None) -> DeckLoadRequest:
+    """
+    Load a category's deck on a worker thread.
+
+    Decks already in the shared deck cache are handed over on the next
+    frame without being read again.
+
+    Args:
+        category: Category to load
+        on_loaded: Receives the loaded manager on the main thread
+        on_progress: Receives (cards read, cards stored) on the main thread
+        on_error: Receives the exception on the main thread if loading fails
+
+    Returns:
+        DeckLoadRequest: Handle to cancel the load
+    """
+    request = DeckLoadRequest(category, on_loaded, on_progress, on_error)
+    threading.Thread(target=_run, args=(request,), name=f'deck-load-{category}', daemon=True).start()
+    return request
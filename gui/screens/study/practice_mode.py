@@ -2,22 +2,24 @@
 Practice mode implementation without affecting card statistics.
 """
 from kivy.clock import Clock
-from core.utils.text_processor import normalize_text, format_display_text
-from gui.utils.ui_helpers import toggle_widget
+from core.utils.text_processing import AnswerVerdict
+from gui.utils.ui_helpers import format_for_widget, toggle_widget
 from gui.utils.ui_feedback import format_feedback_message
+from gui.screens.study.answer_handler import AnswerHandler
 
 class PracticeMode:
     def __init__(self, screen):
         self.screen = screen
+        self.answer_handler = AnswerHandler(screen)
 
     def check_answer(self, user_input: str, current_card) -> None:
         """Handle answer checking in practice mode."""
-        # Normalize both answers for comparison
-        normalized_input = normalize_text(user_input)
-        normalized_answer = normalize_text(current_card.answer)
-        
-        if normalized_input == normalized_answer:
+        # Only the input is normalized; the card caches its answer key
+        verdict = current_card.grade_answer(user_input)
+        if verdict is AnswerVerdict.CORRECT:
             self._handle_correct_answer()
+        elif verdict is AnswerVerdict.TYPO:
+            self._handle_typo_answer(current_card.answer)
         else:
             self._handle_incorrect_answer(current_card.answer)
 
@@ -28,10 +30,16 @@ class PracticeMode:
         self.screen.ids.feedback_label.color = feedback['color']
         toggle_widget(self.screen.ids.check_button, False)
 
+    def _handle_typo_answer(self, correct_answer: str):
+        """Handle an answer accepted with typos in practice mode."""
+        # Show the correct spelling
+        self.answer_handler.show_typo_feedback(format_for_widget(correct_answer, self.screen.ids.user_input))
+        toggle_widget(self.screen.ids.check_button, False)
+
     def _handle_incorrect_answer(self, correct_answer: str):
         """Handle incorrect answer in practice mode."""
         # Format the display of the correct answer
-        formatted_answer = format_display_text(correct_answer)
+        formatted_answer = format_for_widget(correct_answer, self.screen.ids.user_input)
         feedback = format_feedback_message(f"... is the correct answer", False)
         self.screen.ids.feedback_label.text = feedback['text']
         self.screen.ids.feedback_label.color = feedback['color']
@@ -0,0 +1,126 @@
+"""
+Study session queue with cards prepared ahead of display.
+"""
+from collections import deque
+from typing import Callable, Deque, List, Optional
+from kivy.clock import Clock
+from core.flashcard import Flashcard
+
+# Cards kept prepared ahead of the current one
+LOOKAHEAD = 3
+
+class SessionQueue:
+    """
+    Cards left in a study session, the next few prepared in idle time.
+
+    After each card is shown, a clock callback prepares the next cards
+    (wrapping their display text and building their answer keys, which
+    fills the layout and normalization caches) and reads the next round
+    of session cards before the current round runs out. Showing the next
+    card then only takes cache hits. Text measurement and the due-date
+    scheduler belong to the main thread, so preparation runs in clock
+    callbacks between transitions rather than on a worker thread.
+    """
+
+    def __init__(self, fetch: Callable[[], List[Flashcard]],
+                 prepare_card: Callable[[Flashcard], None],
+                 keep: Optional[Callable[[Flashcard], bool]] = None,
+                 lookahead: int = LOOKAHEAD):
+        """
+        Initialize the queue.
+
+        Args:
+            fetch: Returns the cards of the next round, e.g. the due cards
+            prepare_card: Prepares a card for display and grading
+            keep: Tells whether a card read ahead of time still belongs in
+                its round, e.g. is still due after reviews made since
+            lookahead: Number of cards to prepare ahead
+        """
+        self.fetch = fetch
+        self.prepare_card = prepare_card
+        self.keep = keep
+        self.lookahead = lookahead
+        self._pending: Deque[Flashcard] = deque()
+        self._prepared = 0  # Leading pending cards already prepared
+        self._next_round: Optional[List[Flashcard]] = None
+        self._next_prepared = 0
+        self._check_pending = False  # Pending cards were read ahead and need keep
+        self._event = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def pop(self) -> Optional[Flashcard]:
+        """
+        Take the next card, starting a new round when this one is done.
+
+        Returns:
+            Optional[Flashcard]: The next card, or None if no cards are left
+        """
+        card = self._take()
+        if card is None:
+            card = self._start_round()
+        if card is not None:
+            self._schedule_prepare()
+        return card
+
+    def push(self, card: Flashcard) -> None:
+        """Add a card to the end of the current round."""
+        self._pending.append(card)
+        self._schedule_prepare()
+
+    def reset(self) -> None:
+        """Drop all cards, e.g. when the session mode changes."""
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        self._pending.clear()
+        self._prepared = 0
+        self._next_round = None
+        self._next_prepared = 0
+        self._check_pending = False
+
+    def _take(self) -> Optional[Flashcard]:
+        """Pop the first pending card that still belongs in the round."""
+        while self._pending:
+            card = self._pending.popleft()
+            self._prepared = max(0, self._prepared - 1)
+            if not self._check_pending or self.keep is None or self.keep(card):
+                return card
+        return None
+
+    def _start_round(self) -> Optional[Flashcard]:
+        """Move the read-ahead round in, or read one now, and take its first card."""
+        next_round, self._next_round = self._next_round, None
+        if next_round is not None:
+            self._pending.extend(next_round)
+            self._prepared = self._next_prepared
+            self._check_pending = True
+            card = self._take()
+            if card is not None:
+                return card
+        # Nothing read ahead, or nothing of it left; the fresh round needs no checks
+        self._pending.extend(self.fetch())
+        self._prepared = 0
+        self._check_pending = False
+        return self._take()
+
+    def _schedule_prepare(self) -> None:
+        """Prepare ahead on the next frame."""
+        if self._event is None:
+            self._event = Clock.schedule_once(self.prepare)
+
+    def prepare(self, *args) -> None:
+        """Prepare the next cards and read the next round if this one is ending."""
+        self._event = None
+        while self._prepared < min(self.lookahead, len(self._pending)):
+            self.prepare_card(self._pending[self._prepared])
+            self._prepared += 1
+        if len(self._pending) < self.lookahead and self._next_round is None:
+            self._next_round = self.fetch()
+            self._next_prepared = 0
+        if self._next_round is not None:
+            wanted = min(self.lookahead - len(self._pending), len(self._next_round))
+            while self._next_prepared < wanted:
+                self.prepare_card(self._next_round[self._next_prepared])
+                self._next_prepared += 1
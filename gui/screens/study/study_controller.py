@@ -3,44 +3,57 @@ Study controller managing study logic and modes.
 """
 from typing import Optional, List
 from kivy.clock import Clock
+from core.algorithm.sm2 import today_ordinal
+from core.deck_cache import get_deck_cache
+from core.flashcard import Flashcard
 from core.manager import FlashcardManager
 from gui.screens.study.modes import StudyModeType
 from gui.screens.study.study_mode import StudyMode
 from gui.screens.study.practice_mode import PracticeMode
-from gui.screens.study.card_loader import CardLoader
+from gui.screens.study.session_queue import SessionQueue
+from gui.utils.ui_helpers import format_for_widget
 import random
 
 class StudyController:
     """Controls study session flow and mode switching."""
     
-    def __init__(self, screen, category: str):
+    def __init__(self, screen, category: str, flashcard_manager: Optional[FlashcardManager] = None):
         self.screen = screen
-        self.flashcard_manager = FlashcardManager(category=category)
+        # Screens pass in decks loaded in the background; otherwise load here
+        self.flashcard_manager = flashcard_manager or get_deck_cache().get_manager(category)
         self.current_card = None
         self.mode_type = StudyModeType.SPACED_REPETITION
         self.study_mode = StudyMode(screen)
         self.practice_mode = PracticeMode(screen)
-        self.available_cards = []
+        self.available_cards = SessionQueue(self._session_cards, self._prepare_card, self._still_due)
         
     def load_next_card(self) -> None:
         """Load the next card based on current mode."""
-        if not self.available_cards:
-            # Reload all cards when list is empty
-            self.available_cards = self.flashcard_manager.get_due_cards(self.screen.category)
-            if not self.available_cards:
-                self.screen.ids.question_label.text = "No cards available!"
-                self.current_card = None
-                self.screen.ui_manager.disable_all_buttons()
-                return
-            # Shuffle cards for practice mode
-            if self.mode_type == StudyModeType.PRACTICE:
-                random.shuffle(self.available_cards)
-        
-        # Get next card and remove it from available cards
-        self.current_card = self.available_cards.pop(0)
+        # The queue starts a new round of due cards when the current one is done
+        self.current_card = self.available_cards.pop()
+        if self.current_card is None:
+            self.screen.ids.question_label.text = "No cards available!"
+            self.screen.ui_manager.disable_all_buttons()
+            return
         self._update_question_display()
         self.screen.reset_ui_state()
         
+    def _session_cards(self) -> List[Flashcard]:
+        """Get the cards of the next round: the due cards, shuffled in practice mode."""
+        cards = self.flashcard_manager.get_due_cards(self.screen.category)
+        if self.mode_type == StudyModeType.PRACTICE:
+            random.shuffle(cards)
+        return cards
+        
+    def _still_due(self, card: Flashcard) -> bool:
+        """Check a card read ahead against reviews made since; practice does not review."""
+        return self.mode_type == StudyModeType.PRACTICE or card.due_day <= today_ordinal()
+        
+    def _prepare_card(self, card: Flashcard) -> None:
+        """Wrap a card's question and build its answer key before it is shown."""
+        format_for_widget(card.question, self.screen.ids.question_label)
+        card.prepare_answer()
+        
     def check_answer(self, user_input: str) -> None:
         """Check answer using current mode."""
         if not self.current_card:
@@ -59,22 +72,20 @@ class StudyController:
         if self.mode_type == StudyModeType.PRACTICE:
             if difficulty == 'again':
                 # Put the card back in rotation for practice mode
-                self.available_cards.append(self.current_card)
+                self.available_cards.push(self.current_card)
             Clock.schedule_once(lambda dt: self.load_next_card(), 0.5)
         else:
-            self.current_card.update_review(difficulty)
-            self.flashcard_manager.save_cards()
+            self.flashcard_manager.review_card(self.current_card, difficulty)
             Clock.schedule_once(lambda dt: self.load_next_card(), 0.5)
         
     def switch_mode(self, mode_type: StudyModeType) -> None:
         """Switch between study modes."""
         self.mode_type = mode_type
-        self.available_cards = []  # Reset available cards on mode switch
+        self.available_cards.reset()  # Reset available cards on mode switch
         self.load_next_card()
         
     def _update_question_display(self) -> None:
         """Update the question display."""
         if self.current_card:
-            from core.utils.text_processor import format_display_text
-            formatted_question = format_display_text(self.current_card.question)
-            self.screen.ids.question_label.text = formatted_question
\ No newline at end of file
+            question_label = self.screen.ids.question_label
+            question_label.text = format_for_widget(self.current_card.question, question_label)
\ No newline at end of file
@@ -2,25 +2,27 @@
 Study mode implementation with spaced repetition.
 """
 from kivy.clock import Clock
-from core.utils.text_processor import normalize_text, format_display_text
-from gui.utils.ui_helpers import toggle_widget
+from core.utils.text_processing import AnswerVerdict
+from gui.utils.ui_helpers import format_for_widget, toggle_widget
 from gui.utils.ui_feedback import format_feedback_message
+from gui.screens.study.answer_handler import AnswerHandler
 
 class StudyMode:
     def __init__(self, screen):
         self.screen = screen
+        self.answer_handler = AnswerHandler(screen)
         
     def check_answer(self, user_input: str, current_card) -> None:
         """Handle answer checking in study mode."""
-        # Normalize both answers for comparison
-        normalized_input = normalize_text(user_input)
-        normalized_answer = normalize_text(current_card.answer)
-        
-        if normalized_input == normalized_answer:
+        # Only the input is normalized; the card caches its answer key
+        verdict = current_card.grade_answer(user_input)
+        if verdict is AnswerVerdict.CORRECT:
             self._handle_correct_answer()
+        elif verdict is AnswerVerdict.TYPO:
+            self._handle_typo_answer(format_for_widget(current_card.answer, self.screen.ids.user_input))
         else:
             # Format the display of the correct answer
-            formatted_answer = format_display_text(current_card.answer)
+            formatted_answer = format_for_widget(current_card.answer, self.screen.ids.user_input)
             self._handle_incorrect_answer(formatted_answer)
 
     def _handle_correct_answer(self) -> None:
@@ -31,6 +33,12 @@ class StudyMode:
         # Auto-handle as easy for correct answers
         Clock.schedule_once(lambda dt: self.screen.handle_difficulty('easy'), 0.5)
 
+    def _handle_typo_answer(self, formatted_answer: str) -> None:
+        """Handle an answer accepted with typos in study mode."""
+        # Show the correct spelling, then rate the card as hard
+        self.answer_handler.show_typo_feedback(formatted_answer)
+        Clock.schedule_once(lambda dt: self.screen.handle_difficulty('hard'), 1.5)
+
     def _handle_incorrect_answer(self, formatted_answer: str) -> None:
         """Handle incorrect answer in study mode."""
         feedback = format_feedback_message(f"... is the correct answer", False)
@@ -41,4 +41,11 @@ class UIStateManager:
         toggle_widget(self.screen.ids.check_button, False)
         toggle_widget(self.screen.ids.next_button, False)
         toggle_widget(self.screen.ids.study_buttons, False)
-        toggle_widget(self.screen.ids.practice_button, False)
\ No newline at end of file
+        toggle_widget(self.screen.ids.practice_button, False)
+        
+    def show_loading(self, text: str):
+        """Show a loading message with all buttons disabled."""
+        self.screen.ids.question_label.text = text
+        self.screen.ids.user_input.text = ""
+        self.screen.ids.feedback_label.text = ""
+        self.disable_all_buttons()
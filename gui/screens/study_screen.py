@@ -3,12 +3,14 @@ Study screen implementation.
 """
 from kivy.uix.screenmanager import Screen
 from kivy.clock import Clock
-from core.manager import FlashcardManager
+from core.deck_cache import get_deck_cache
+from core.utils.text_processing import AnswerVerdict
 from gui.screens.study.modes import StudyModeType
 from gui.screens.study.study_controller import StudyController
 from gui.screens.study.answer_handler import AnswerHandler
 from gui.screens.study.ui_state_manager import UIStateManager
 from gui.screens.study.card_display import CardDisplay
+from gui.screens.study.deck_loader import load_deck
 
 class StudyScreen(Screen):
     """Main study screen handling UI interactions."""
@@ -17,31 +19,84 @@ class StudyScreen(Screen):
         super().__init__(**kwargs)
         self.controller = None
         self.category = None
+        self.load_request = None
+        self.pinned_category = None  # Category kept loaded in the deck cache for this session
         self.answer_handler = AnswerHandler(self)
         self.ui_manager = UIStateManager(self)
         self.card_display = CardDisplay(self)
         
     def set_category(self, category: str) -> None:
-        """Initialize study controller with selected category."""
+        """Load the selected category in the background and start studying it."""
+        self.cancel_loading()
+        self.release_deck()
         self.category = category
-        self.controller = StudyController(self, category)
+        self.controller = None
+        # Keep the deck from being evicted while the session uses its manager
+        get_deck_cache().pin(category)
+        self.pinned_category = category
+        self.ui_manager.show_loading(f"Loading {category}...")
+        self.load_request = load_deck(
+            category, self.on_deck_loaded,
+            on_progress=self.on_load_progress, on_error=self.on_load_error
+        )
+        
+    def on_load_progress(self, done: int, total: int) -> None:
+        """Show how much of the deck has been read."""
+        percent = done * 100 // total if total else 100
+        self.ids.question_label.text = f"Loading {self.category}... {percent}%"
+        
+    def on_deck_loaded(self, flashcard_manager) -> None:
+        """Start the session once the deck is loaded."""
+        self.load_request = None
+        self.controller = StudyController(self, self.category, flashcard_manager)
         self.controller.load_next_card()
         
+    def on_load_error(self, error: Exception) -> None:
+        """Report a deck that could not be loaded."""
+        self.load_request = None
+        self.ids.question_label.text = f"Could not load {self.category}"
+        
+    def cancel_loading(self) -> None:
+        """Cancel a deck load that has not finished."""
+        if self.load_request:
+            self.load_request.cancel()
+            self.load_request = None
+        
+    def release_deck(self) -> None:
+        """Let the deck cache evict the deck of the last session."""
+        if self.pinned_category is not None:
+            get_deck_cache().unpin(self.pinned_category)
+            self.pinned_category = None
+        
+    def on_leave(self, *args) -> None:
+        """Write pending reviews when leaving the study screen."""
+        self.cancel_loading()
+        if self.controller:
+            self.controller.flashcard_manager.flush()
+        self.release_deck()
+        
     def check_answer(self) -> None:
         """Handle answer checking."""
         if self.controller and self.controller.current_card:
             user_answer = self.ids.user_input.text
-            is_correct = self.answer_handler.process_user_answer(
+            verdict = self.answer_handler.grade_user_answer(
                 user_answer,
-                self.controller.current_card.answer
+                self.controller.current_card
             )
             
-            if is_correct:
+            if verdict is AnswerVerdict.CORRECT:
                 self.answer_handler.show_feedback(True)
                 if self.controller.mode_type == StudyModeType.PRACTICE:
                     Clock.schedule_once(lambda dt: self.next_practice_card(), 1.0)
                 else:
                     Clock.schedule_once(lambda dt: self.handle_difficulty('easy'), 0.5)
+            elif verdict is AnswerVerdict.TYPO:
+                # Show the correct spelling a little longer; typos count as hard
+                self.answer_handler.show_typo_feedback(self.controller.current_card.answer)
+                if self.controller.mode_type == StudyModeType.PRACTICE:
+                    Clock.schedule_once(lambda dt: self.next_practice_card(), 1.5)
+                else:
+                    Clock.schedule_once(lambda dt: self.handle_difficulty('hard'), 1.5)
             else:
                 formatted_answer = self.controller.current_card.answer
                 self.answer_handler.show_feedback(False, formatted_answer)
@@ -0,0 +1,312 @@
+"""
+Cache of parsed KV rule trees.
+
+Parsing a KV file compiles every property expression; the compiled rule
+tree is stored with marshal, keyed by a hash of the file, its path, the
+Kivy version and the Python bytecode version, so a launch only parses
+files that changed since they were last cached.
+
+Precompile the app's KV files with:
+
+    python -m gui.utils.kv_cache
+"""
+import argparse
+import glob
+import hashlib
+import importlib.util
+import marshal
+import os
+from functools import partial
+from typing import Any, List, Optional, Tuple
+import kivy
+from kivy.factory import Factory
+from kivy.lang import Builder
+from kivy.lang.parser import Parser, ParserRule, ParserRuleProperty
+from kivy.logger import Logger
+from kivy.resources import resource_find
+from core.utils.file_handler import write_bytes_atomic
+
+GUI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KV_CACHE_DIR = os.path.join(GUI_DIR, 'kv', '__kvcache__')
+CACHE_SUFFIX = '.kvc'
+# Bumped when the cached tree layout changes
+CACHE_FORMAT = 1
+# Builder internals apply_parser relies on; without them files load uncached
+BUILDER_MEMBERS = ('rules', 'templates', 'files', '_current_filename',
+                   '_clear_matchcache', 'template', '_apply_rule')
+
+def cache_key(filename: str, content: str) -> str:
+    """
+    Get the cache key of a KV file.
+
+    Args:
+        filename: Path the rules are registered under
+        content: Text of the file
+
+    Returns:
+        str: Hex digest naming the cache file
+    """
+    digest = hashlib.sha256()
+    for part in (str(CACHE_FORMAT), kivy.__version__, importlib.util.MAGIC_NUMBER.hex(),
+                 filename, content):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def _dump_property(prop: ParserRuleProperty) -> Tuple:
+    """Convert a compiled property to marshal-able data."""
+    return (prop.line, prop.name, prop.value, prop.ignore_prev, prop.mode,
+            prop.co_value, prop.watched_keys)
+
+def _dump_rule(rule: Optional[ParserRule]) -> Optional[Tuple]:
+    """Convert a compiled rule and its children to marshal-able data."""
+    if rule is None:
+        return None
+    return (rule.line, rule.name, rule.level, rule.id,
+            [_dump_property(prop) for prop in rule.properties.values()],
+            [_dump_property(prop) for prop in rule.handlers],
+            [_dump_rule(child) for child in rule.children],
+            _dump_rule(rule.canvas_before), _dump_rule(rule.canvas_root),
+            _dump_rule(rule.canvas_after))
+
+def dump_parser(parser: Parser) -> bytes:
+    """
+    Serialize a parsed KV file.
+
+    Args:
+        parser: Parser that has parsed and precompiled the file
+
+    Returns:
+        bytes: Marshalled rule tree
+
+    Raises:
+        ValueError: If a precomputed property value cannot be marshalled
+    """
+    roots = [rule for _, rule in parser.rules]
+    roots.extend(rule for _, _, rule in parser.templates)
+    if parser.root is not None:
+        roots.append(parser.root)
+    # A rule with several selectors appears once per selector
+    unique = sorted({id(rule): rule for rule in roots}.values(), key=lambda rule: rule.line)
+    return marshal.dumps((parser.directives, [_dump_rule(rule) for rule in unique]))
+
+def _load_property(parser: Parser, data: Tuple) -> ParserRuleProperty:
+    """Rebuild a compiled property."""
+    line, name, value, ignore_prev, mode, co_value, watched_keys = data
+    prop = ParserRuleProperty(parser, line, name, value, ignore_prev)
+    prop.mode = mode
+    prop.co_value = co_value
+    prop.watched_keys = watched_keys
+    return prop
+
+def _load_rule(parser: Parser, data: Optional[Tuple]) -> Optional[ParserRule]:
+    """Rebuild a compiled rule; top-level rules register their selectors on the parser."""
+    if data is None:
+        return None
+    line, name, level, rule_id, properties, handlers, children, before, root, after = data
+    rule = ParserRule(parser, line, name, level)
+    rule.id = rule_id
+    for prop in properties:
+        prop = _load_property(parser, prop)
+        rule.properties[prop.name] = prop
+    rule.handlers = [_load_property(parser, prop) for prop in handlers]
+    rule.children = [_load_rule(parser, child) for child in children]
+    rule.canvas_before = _load_rule(parser, before)
+    rule.canvas_root = _load_rule(parser, root)
+    rule.canvas_after = _load_rule(parser, after)
+    return rule
+
+def load_parser(data: bytes, filename: str, content: str) -> Parser:
+    """
+    Rebuild a parser from a serialized rule tree.
+
+    Directives (imports, #:set, includes) are executed again, as a fresh
+    parse would.
+
+    Args:
+        data: Output of dump_parser
+        filename: Path the rules are registered under
+        content: Text of the file, kept for error messages
+
+    Returns:
+        Parser: Parser equivalent to parsing the file
+    """
+    directives, rules = marshal.loads(data)
+    if not isinstance(directives, list) or not isinstance(rules, list):
+        raise ValueError('Malformed KV cache entry')
+    parser = Parser.__new__(Parser)
+    parser.rules = []
+    parser.templates = []
+    parser.root = None
+    parser.dynamic_classes = {}
+    parser.filename = filename
+    parser.sourcecode = list(enumerate(content.splitlines()))
+    parser.directives = [tuple(directive) for directive in directives]
+    parser.execute_directives()
+    for rule in rules:
+        _load_rule(parser, rule)
+    # A Parser with fields this module does not fill must be parsed instead
+    if not all(hasattr(parser, name) for name in getattr(Parser, '__slots__', ())):
+        raise ValueError('KV cache entry does not match this Parser')
+    return parser
+
+def _cache_path(cache_dir: str, key: str) -> str:
+    """Get the cache file of a key."""
+    return os.path.join(cache_dir, key + CACHE_SUFFIX)
+
+def _read_cache(cache_dir: str, key: str) -> Optional[bytes]:
+    """Read a cache entry, if present."""
+    try:
+        with open(_cache_path(cache_dir, key), 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _write_cache(cache_dir: str, key: str, parser: Parser) -> bool:
+    """Store a parsed file; failures only cost a parse on the next launch."""
+    try:
+        data = dump_parser(parser)
+    except ValueError:
+        return False
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return False
+    return write_bytes_atomic(_cache_path(cache_dir, key), data)
+
+def parse_kv_file(filename: str, cache_dir: str = KV_CACHE_DIR) -> Tuple[Parser, bool]:
+    """
+    Get the parsed rule tree of a KV file, from the cache if it is current.
+
+    Args:
+        filename: Path of the KV file
+        cache_dir: Directory of the cache files
+
+    Returns:
+        Tuple[Parser, bool]: The parser and whether it came from the cache
+    """
+    with open(filename, 'r', encoding='utf8') as f:
+        content = f.read()
+    key = cache_key(filename, content)
+    data = _read_cache(cache_dir, key)
+    if data is not None:
+        try:
+            return load_parser(data, filename, content), True
+        except Exception:
+            pass  # Damaged or incompatible entry; parse and replace it
+    parser = Parser(content=content, filename=filename)
+    _write_cache(cache_dir, key, parser)
+    return parser, False
+
+def apply_parser(parser: Parser, filename: str) -> Any:
+    """
+    Merge a parsed KV file into the Builder.
+
+    Does what Builder.load_string does once its Parser has run: registers
+    the rules, templates and dynamic classes under the file name and
+    builds the root widget.
+
+    Args:
+        parser: Parsed rule tree of the file
+        filename: Path the rules are registered under
+
+    Returns:
+        The root widget of the file, if it defines one
+    """
+    if filename in Builder.files:
+        Logger.warning(
+            'Lang: The file {} is loaded multiples times, '
+            'you might have unwanted behaviors.'.format(filename))
+    Builder._current_filename = filename
+    try:
+        Builder.rules.extend(parser.rules)
+        Builder._clear_matchcache()
+        for name, cls, template in parser.templates:
+            Builder.templates[name] = (cls, template, filename)
+            Factory.register(name, cls=partial(Builder.template, name),
+                             is_template=True, warn=True)
+        for name, baseclasses in parser.dynamic_classes.items():
+            Factory.register(name, baseclasses=baseclasses, filename=filename, warn=True)
+        if parser.templates or parser.dynamic_classes or parser.rules:
+            Builder.files.append(filename)
+        if parser.root is None:
+            return None
+        widget = Factory.get(parser.root.name)(__no_builder=True)
+        rule_children = []
+        widget.apply_class_lang_rules(root=widget, rule_children=rule_children)
+        Builder._apply_rule(widget, parser.root, parser.root, rule_children=rule_children)
+        for child in rule_children:
+            child.dispatch('on_kv_post', widget)
+        widget.dispatch('on_kv_post', widget)
+        return widget
+    finally:
+        Builder._current_filename = None
+
+def load_kv_file(filename: str, cache_dir: str = KV_CACHE_DIR) -> Any:
+    """
+    Load a KV file like Builder.load_file, using the rule cache.
+
+    Falls back to Builder.load_file if the Builder lacks the internals
+    apply_parser relies on or the file cannot be parsed here.
+
+    Args:
+        filename: Path of the KV file
+        cache_dir: Directory of the cache files
+
+    Returns:
+        The root widget of the file, if it defines one
+    """
+    filename = resource_find(filename) or filename
+    if not all(hasattr(Builder, member) for member in BUILDER_MEMBERS):
+        return Builder.load_file(filename)
+    try:
+        parser, _ = parse_kv_file(filename, cache_dir)
+    except Exception:
+        # Let Builder report syntax errors the way it always does
+        return Builder.load_file(filename)
+    return apply_parser(parser, filename)
+
+def app_kv_files() -> List[str]:
+    """Get the paths of the app's KV files."""
+    return [os.path.join(os.path.dirname(GUI_DIR), 'app.kv')] + sorted(
+        glob.glob(os.path.join(GUI_DIR, 'kv', '*.kv')))
+
+def build_cache(filenames: List[str], cache_dir: str = KV_CACHE_DIR) -> List[str]:
+    """
+    Parse KV files into the cache and remove entries no file uses.
+
+    Args:
+        filenames: KV files to cache
+        cache_dir: Directory of the cache files
+
+    Returns:
+        List[str]: Files whose cache entry was written
+    """
+    built = []
+    keys = set()
+    for filename in filenames:
+        filename = resource_find(filename) or filename
+        with open(filename, 'r', encoding='utf8') as f:
+            content = f.read()
+        key = cache_key(filename, content)
+        keys.add(key)
+        if _write_cache(cache_dir, key, Parser(content=content, filename=filename)):
+            built.append(filename)
+    for path in glob.glob(os.path.join(cache_dir, '*' + CACHE_SUFFIX)):
+        if os.path.basename(path)[:-len(CACHE_SUFFIX)] not in keys:
+            os.remove(path)
+    return built
+
+def main(argv=None) -> int:
+    """Precompile KV files into the rule cache."""
+    parser = argparse.ArgumentParser(description='Precompile KV files into the rule cache.')
+    parser.add_argument('files', nargs='*', help='KV files (default: the app\'s KV files)')
+    parser.add_argument('--cache-dir', default=KV_CACHE_DIR, help='Cache directory')
+    args = parser.parse_args(argv)
+    filenames = args.files or app_kv_files()
+    built = build_cache(filenames, args.cache_dir)
+    print(f"Cached {len(built)} of {len(filenames)} KV files in {args.cache_dir}")
+    return 0 if len(built) == len(filenames) else 1
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,37 +1,100 @@
 """
 Utility functions for screen management.
 """
-from typing import Dict, Any
+import importlib
+import os
+from typing import Callable, Dict, Set
 from kivy.uix.screenmanager import ScreenManager, Screen
+from core.tracing import span
+from gui.utils.kv_cache import load_kv_file
+
+KV_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'kv')
+
+# Screen name -> (module, class name, KV file in gui/kv)
+SCREENS = {
+    'home': ('gui.screens.home_screen', 'HomeScreen', 'home_screen.kv'),
+    'category': ('gui.screens.category_screen', 'CategoryScreen', 'category_screen.kv'),
+    'study': ('gui.screens.study_screen', 'StudyScreen', 'study_screen.kv'),
+    'add_card': ('gui.screens.add_card_screen', 'AddCardScreen', 'add_card_screen.kv'),
+    'search': ('gui.screens.search_screen', 'SearchScreen', 'search_screen.kv')
+}
+
+_loaded_kv_files: Set[str] = set()
+
+def load_kv_once(kv_path: str) -> None:
+    """Load a KV file unless it was loaded before."""
+    if kv_path not in _loaded_kv_files:
+        with span(os.path.basename(kv_path), 'kv'):
+            load_kv_file(kv_path)
+        _loaded_kv_files.add(kv_path)
+
+class LazyScreenManager(ScreenManager):
+    """
+    Screen manager that builds registered screens on first use.
+
+    A screen is created when it is first looked up, e.g. by setting
+    current to its name, so start-up only pays for the first screen.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._factories: Dict[str, Callable[[], Screen]] = {}
+
+    def register(self, name: str, factory: Callable[[], Screen]) -> None:
+        """
+        Register a screen to be built on first use.
+
+        Args:
+            name: Screen name
+            factory: Function creating the screen
+        """
+        self._factories[name] = factory
+
+    def has_screen(self, name: str) -> bool:
+        """Check whether a screen exists or is registered."""
+        return name in self._factories or super().has_screen(name)
+
+    def get_screen(self, name: str) -> Screen:
+        """Get a screen, building it if it is registered but not created yet."""
+        factory = self._factories.pop(name, None)
+        if factory is not None:
+            self.add_widget(factory())
+        return super().get_screen(name)
+
+def screen_factory(name: str, module: str, class_name: str, kv_file: str) -> Callable[[], Screen]:
+    """
+    Create a factory that imports a screen, loads its KV rules and builds it.
+
+    Args:
+        name: Screen name
+        module: Module defining the screen class
+        class_name: Screen class name
+        kv_file: KV file of the screen in gui/kv
+
+    Returns:
+        Callable[[], Screen]: The factory
+    """
+    def build() -> Screen:
+        with span(class_name, 'screen'):
+            load_kv_once(os.path.join(KV_DIR, kv_file))
+            screen_class = getattr(importlib.import_module(module), class_name)
+            return screen_class(name=name)
+    return build
 
 class ScreenManagerUtil:
     @staticmethod
     def create_screen_manager() -> ScreenManager:
         """
-        Creates and initializes the screen manager with all screens.
-        
+        Creates the screen manager with all screens registered.
+
+        Screens, their modules and their KV rules are loaded on first
+        navigation; only the home screen is built here.
+
         Returns:
             ScreenManager: The initialized screen manager
         """
-        sm = ScreenManager()
-        
-        # Import screens here to avoid circular imports
-        from gui.screens.home_screen import HomeScreen
-        from gui.screens.category_screen import CategoryScreen
-        from gui.screens.study_screen import StudyScreen
-        from gui.screens.add_card_screen import AddCardScreen
-        from gui.screens.search_screen import SearchScreen
-        
-        # Add all screens
-        screens = {
-            'home': HomeScreen,
-            'category': CategoryScreen,
-            'study': StudyScreen,
-            'add_card': AddCardScreen,
-            'search': SearchScreen
-        }
-        
-        for name, screen_class in screens.items():
-            sm.add_widget(screen_class(name=name))
-        
-        return sm
\ No newline at end of file
+        sm = LazyScreenManager()
+        for name, (module, class_name, kv_file) in SCREENS.items():
+            sm.register(name, screen_factory(name, module, class_name, kv_file))
+        sm.current = 'home'
+        return sm
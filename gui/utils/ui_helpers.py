@@ -1,8 +1,9 @@
 """
 Utility functions for UI operations.
 """
-from typing import Tuple
+from typing import Optional, Tuple
 from kivy.uix.widget import Widget
+from core.utils.text_processing.layout import TextLayout, get_layout, wrap_text
 
 def get_feedback_color(success: bool) -> Tuple[float, float, float, float]:
     """
@@ -27,22 +28,61 @@ def format_long_text(text: str, max_length: int = 40) -> str:
     Returns:
         str: The formatted text
     """
-    words = text.split()
-    lines = []
-    current_line = []
+    return wrap_text(text, max_length)
+
+def get_font_layout(font_name: str, font_size: float) -> TextLayout:
+    """
+    Get the shared text layout of a font, measuring words with the Kivy text provider.
     
-    for word in words:
-        if len(' '.join(current_line + [word])) <= max_length:
-            current_line.append(word)
-        else:
-            if current_line:
-                lines.append(' '.join(current_line))
-            current_line = [word]
+    Args:
+        font_name (str): Font name or file
+        font_size (float): Font size in pixels
+        
+    Returns:
+        TextLayout: Layout caching word widths and wrapped texts of the font
+    """
+    label = None
+
+    def measure(text: str) -> float:
+        nonlocal label
+        if label is None:
+            # Imported on first measurement so the text provider loads lazily
+            from kivy.core.text import Label as CoreLabel
+            label = CoreLabel(font_name=font_name, font_size=font_size)
+        return label.get_extents(text)[0]
+    return get_layout((font_name, font_size), measure)
+
+def _text_width(widget: Widget) -> Optional[float]:
+    """Get the width available for text in a widget that is on screen."""
+    if not isinstance(widget, Widget) or widget.get_root_window() is None:
+        return None  # Not laid out yet
+    text_size = getattr(widget, 'text_size', None)
+    if text_size and text_size[0]:
+        return text_size[0]
+    padding = getattr(widget, 'padding', None) or (0, 0, 0, 0)
+    # Padding is [left, top, right, bottom], or [horizontal, vertical]
+    horizontal = padding[0] + padding[2] if len(padding) == 4 else 2 * padding[0]
+    return widget.width - horizontal
+
+def format_for_widget(text: str, widget: Widget, max_length: int = 40) -> str:
+    """
+    Formats text for display in a widget by adding line breaks.
     
-    if current_line:
-        lines.append(' '.join(current_line))
+    Lines are filled to the widget's width in its font; widgets that are
+    not on screen yet get lines of max_length characters.
     
-    return '\n'.join(lines)
+    Args:
+        text (str): The text to format
+        widget (Widget): Label or text input showing the text
+        max_length (int): Maximum characters per line without a known width
+        
+    Returns:
+        str: The formatted text
+    """
+    width = _text_width(widget)
+    if width is None or width <= 0:
+        return wrap_text(text, max_length)
+    return get_font_layout(widget.font_name, widget.font_size).wrap(text, width)
 
 def toggle_widget(widget: Widget, show: bool) -> None:
     """
@@ -1,6 +1,11 @@
+from core.tracing import save_trace, span, start_trace, stop_trace
+
+# Trace start-up when FLASHCARDS_TRACE is set; started first to include Kivy's imports
+start_trace()
+
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.config import Config
-from kivy.lang import Builder
 
 # Set the window dimensions for the app
 Config.set('graphics', 'width', '414')
@@ -9,14 +14,32 @@ Config.set('graphics', 'height', '736')
 class FlashcardApp(App):
     def build(self):
         """Build the app by loading the KV files and setting up the screen manager."""
-        # Load all KV files
-        Builder.load_file('app.kv')
-        
         # Import here to avoid circular imports
+        from gui.utils.kv_cache import load_kv_file
         from gui.utils.screen_manager import ScreenManagerUtil
         
+        # Load the root KV file from the rule cache; screen KV files are loaded with their screens
+        with span('app.kv', 'kv'):
+            load_kv_file('app.kv')
+        
         # Create and return the screen manager
-        return ScreenManagerUtil.create_screen_manager()
+        with span('create_screen_manager', 'screen'):
+            screen_manager = ScreenManagerUtil.create_screen_manager()
+        # Write the start-up spans once the first frame is drawn
+        Clock.schedule_once(lambda dt: save_trace())
+        return screen_manager
+
+    def on_pause(self):
+        """Write pending card changes before Android may kill the paused app."""
+        from core.storage import flush_all
+        flush_all()
+        return True
+
+    def on_stop(self):
+        """Write pending card changes before exiting."""
+        from core.storage import flush_all
+        flush_all()
+        stop_trace()
 
 if __name__ == '__main__':
     __version__ = '1.2.0'  # Set the app version
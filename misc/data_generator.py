@@ -1,75 +1,200 @@
 import json
 import argparse
+import glob
+import hashlib
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Input files are split into chunks of this many bytes for the worker processes
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Function to parse a single vocabulary line into a word pair (or None)
+def parse_vocab_line(line):
+    # Skip empty lines and lines that don't contain ' - '
+    line = line.strip()
+    if not line or ' - ' not in line:
+        return None
+
+    german, hungarian = line.split(' - ', 1)
+    return german.strip(), hungarian.strip()
+
+# Generator yielding the word pairs of a vocabulary file line by line
+def iter_vocab_file(file_path):
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            pair = parse_vocab_line(line)
+            if pair:
+                yield pair
 
 # Function to read and parse the vocabulary file
 def parse_vocab_file(file_path):
+    return list(iter_vocab_file(file_path))
+
+# Function to parse the lines starting in the byte range [start, end) of a file
+def parse_vocab_chunk(file_path, start, end):
     word_pairs = []
-    
-    with open(file_path, 'r', encoding='utf-8') as file:
-        for line in file:
-            # Skip empty lines and lines that don't contain ' - '
-            line = line.strip()
-            if not line or ' - ' not in line:
-                continue
-            
-            german, hungarian = line.split(' - ')
-            word_pairs.append((german.strip(), hungarian.strip()))
-    
+    with open(file_path, 'rb') as file:
+        if start > 0:
+            # Skip the line that began in the previous chunk
+            file.seek(start - 1)
+            file.readline()
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            pair = parse_vocab_line(line.decode('utf-8'))
+            if pair:
+                word_pairs.append(pair)
     return word_pairs
 
-# Function to format the data as required
-def format_flashcards(word_pairs, category):
-    formatted_cards = []
-    
+# Function to split files into (path, start, end) chunks
+def iter_chunks(file_paths, chunk_size=CHUNK_SIZE):
+    for file_path in file_paths:
+        size = os.path.getsize(file_path)
+        for start in range(0, max(size, 1), chunk_size):
+            yield file_path, start, min(start + chunk_size, size)
+
+# Generator yielding the word pairs of many files, parsed by a process pool.
+# At most twice as many chunks as workers are in flight, which bounds memory,
+# and pairs are yielded in input order.
+def iter_vocab_files(file_paths, workers=None, chunk_size=CHUNK_SIZE):
+    workers = workers or os.cpu_count() or 1
+    chunks = iter_chunks(file_paths, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield from parse_vocab_chunk(*chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(parse_vocab_chunk, *chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+# Function to expand file names and glob patterns into a sorted list of files
+def expand_inputs(patterns):
+    file_paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            if path not in file_paths:
+                file_paths.append(path)
+    return file_paths
+
+# Function to build a compact, direction-independent key of a word pair
+def pair_key(first, second):
+    joined = '\x00'.join(sorted((first, second)))
+    return hashlib.blake2b(joined.encode('utf-8'), digest_size=8).digest()
+
+# Function to collect the keys of all cards already stored in deck files
+def load_existing_keys(storage_path):
+    keys = set()
+    for deck_path in glob.glob(os.path.join(storage_path, '*.json')):
+        with open(deck_path, 'r', encoding='utf-8') as f:
+            try:
+                cards = json.load(f)
+            except json.JSONDecodeError:
+                continue
+        for card in cards if isinstance(cards, list) else []:
+            keys.add(pair_key(card.get('question', ''), card.get('answer', '')))
+    # Reviews and additions not yet compacted into the deck files
+    for journal_path in glob.glob(os.path.join(storage_path, '*.journal')):
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    card = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                keys.add(pair_key(card.get('question', ''), card.get('answer', '')))
+    return keys
+
+# Generator skipping pairs that are stored already or were seen earlier in the import
+def dedup_pairs(word_pairs, existing_keys=None):
+    seen = set(existing_keys or ())
+    for german, hungarian in word_pairs:
+        key = pair_key(german, hungarian)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield german, hungarian
+
+# Generator yielding the flashcards of word pairs in both directions
+def iter_flashcards(word_pairs, category):
     for german, hungarian in word_pairs:
-        formatted_cards.append({
+        yield {
             "question": german,
             "answer": hungarian,
             "interval": 2,
             "last_review": None,
             "score": 0,
             "category": category
-        })
-        formatted_cards.append({
+        }
+        yield {
             "question": hungarian,
             "answer": german,
             "interval": 2,
             "last_review": None,
             "score": 0,
             "category": category
-        })
-    
-    return formatted_cards
+        }
 
-# Main function to parse the file and generate JSON
+# Function to format the data as required
+def format_flashcards(word_pairs, category):
+    return list(iter_flashcards(word_pairs, category))
+
+# Function to format one flat card the way json.dumps(cards, indent=4) lays out array items.
+# Values are encoded with the C-accelerated encoder; the indent=4 encoder is pure Python.
+def format_card_json(card, encode=json.JSONEncoder(ensure_ascii=False).encode):
+    fields = ',\n        '.join(f'{encode(key)}: {encode(value)}' for key, value in card.items())
+    return '    {\n        ' + fields + '\n    }'
+
+# Function to write flashcards as a JSON array one card at a time.
+# The output matches json.dumps(cards, indent=4) and replaces the file atomically.
+def write_json_stream(cards, output_file):
+    temp_file = output_file + '.tmp'
+    count = 0
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for card in cards:
+            f.write(',\n' if count else '\n')
+            f.write(format_card_json(card))
+            count += 1
+        f.write('\n]' if count else ']')
+    os.replace(temp_file, output_file)
+    return count
+
+# Main function to parse the files and generate JSON
 def main():
     # Parse command-line arguments
-    parser = argparse.ArgumentParser(description="Generate flashcards from vocabulary file.")
-    parser.add_argument('--file', required=True, help="Path to the vocabulary file.")
+    parser = argparse.ArgumentParser(description="Generate flashcards from vocabulary files.")
+    parser.add_argument('--file', required=True, nargs='+',
+                        help="Vocabulary files or glob patterns (quote patterns to avoid shell expansion).")
     parser.add_argument('--category', required=True, help="Category for the flashcards.")
+    parser.add_argument('--output', help="Output file, defaults to <category>.json.")
+    parser.add_argument('--storage', help="Deck directory whose existing cards are skipped.")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count).")
     args = parser.parse_args()
 
-    # Parse the vocabulary file
-    word_pairs = parse_vocab_file(args.file)
-
-    # Format the word pairs into flashcards
-    formatted_flashcards = format_flashcards(word_pairs, args.category)
-
-    # Convert the result to JSON format
-    formatted_json = json.dumps(formatted_flashcards, ensure_ascii=False, indent=4)
+    file_paths = expand_inputs(args.file)
+    if not file_paths:
+        parser.error("no input files match")
 
-    # Print to console (for verification)
-    print(formatted_json)
+    # Stream word pairs from the worker processes, dropping duplicates
+    existing_keys = load_existing_keys(args.storage) if args.storage else None
+    word_pairs = dedup_pairs(iter_vocab_files(file_paths, args.workers), existing_keys)
 
     # Sanitize category name: replace spaces with underscores
     sanitized_category = args.category.replace(' ', '_')
 
     # Save the JSON data to a file named after the category (no "flashcards" in the filename)
-    output_file = f'{sanitized_category}.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(formatted_json)
+    output_file = args.output or f'{sanitized_category}.json'
+    count = write_json_stream(iter_flashcards(word_pairs, args.category), output_file)
 
-    print(f"Flashcards have been saved to {output_file}")
+    print(f"{count} flashcards from {len(file_paths)} file(s) have been saved to {output_file}")
 
 # Run the script
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+"""
+Tests for the columnar card store.
+"""
+import unittest
+import tempfile
+import shutil
+from core.card_store import CardStore, CardView
+from core.flashcard import Flashcard
+from core.manager import FlashcardManager
+
+class TestCardStore(unittest.TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.card = Flashcard(
+            question="der Kreis", answer="kör", category="Test",
+            interval=6, last_review="2024-03-01", repetitions=2, easiness=2.36, score=1
+        )
+        self.store = CardStore([self.card, {"question": "Hund", "answer": "kutya", "category": "Test"}])
+        
+    def test_views_match_cards(self):
+        """Test reading cards through views.
+        
+        Specification:
+            Views expose the same fields and storage data as Flashcard
+            
+        Criteria:
+            - Should compare equal to the source card
+            - Should return the same stored data and due day
+            - Should reuse one view per row
+        """
+        view = self.store[0]
+        self.assertIsInstance(view, CardView)
+        self.assertEqual(view, self.card)
+        self.assertEqual(view.to_dict(), self.card.to_dict())
+        self.assertEqual(view.due_day, self.card.due_day)
+        self.assertIs(self.store[0], view)
+        self.assertEqual(self.store[1].last_review, None)
+        self.assertEqual(self.store[1].due_day, 0)
+        
+    def test_updates_write_columns(self):
+        """Test changing cards through views.
+        
+        Specification:
+            Reviews and edits update the store in place
+            
+        Criteria:
+            - Should apply the same SM2 update as Flashcard
+            - Should rebuild the answer key after the answer changes
+        """
+        view = self.store[0]
+        view.update_review('good')
+        self.card.update_review('good')
+        self.assertEqual(view.to_dict(), self.card.to_dict())
+        self.assertTrue(view.check_answer("Kor"))
+        view.answer = "Kreis"
+        self.assertTrue(view.check_answer("kreis"))
+        self.assertFalse(view.check_answer("kor"))
+        
+    def test_compact_manager(self):
+        """Test a manager keeping cards in a store.
+        
+        Specification:
+            Compact managers load, add and save cards like regular managers
+            
+        Criteria:
+            - Should hold the cards in a CardStore
+            - Should reject duplicates and persist added cards
+        """
+        test_dir = tempfile.mkdtemp()
+        try:
+            manager = FlashcardManager(storage_path=test_dir, category="Test", compact=True)
+            self.assertTrue(manager.add_card("Q1", "A1", "Test"))
+            self.assertFalse(manager.add_card("A1", "Q1", "Test"))
+            self.assertIsInstance(manager.cards, CardStore)
+            manager.review_card(manager.get_due_cards("Test")[0], 'easy')
+            
+            reloaded = FlashcardManager(storage_path=test_dir, category="Test", compact=True)
+            self.assertEqual(
+                [card.to_dict() for card in reloaded.cards],
+                [card.to_dict() for card in manager.cards]
+            )
+        finally:
+            shutil.rmtree(test_dir)
@@ -0,0 +1,177 @@
+"""
+Tests for the shared deck cache.
+"""
+import unittest
+import tempfile
+import shutil
+import threading
+from unittest.mock import patch
+from core.deck_cache import DeckCache
+from core.manager import FlashcardManager
+
+class TestDeckCache(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        writer = FlashcardManager(storage_path=self.test_dir)
+        writer.add_card("Q1", "A1", "Category1")
+        writer.add_card("Q2", "A2", "Category2")
+        self.cache = DeckCache(storage_path=self.test_dir)
+        
+    def tearDown(self):
+        """Clean up test environment."""
+        self.cache.flush()
+        shutil.rmtree(self.test_dir)
+        
+    def test_lazy_shared_loading(self):
+        """Test lazy loading of shared decks.
+        
+        Specification:
+            Categories load on first access and are shared afterwards
+            
+        Criteria:
+            - Should not load any deck before access
+            - Should return the same manager for repeated access
+        """
+        self.assertEqual(self.cache.categories(), ["Category1", "Category2"])
+        self.assertEqual(self.cache.loaded_categories(), [])
+        manager = self.cache.get_manager("Category1")
+        self.assertIs(self.cache.get_manager("Category1"), manager)
+        self.assertEqual(self.cache.loaded_categories(), ["Category1"])
+        
+    def test_invalidates_on_external_change(self):
+        """Test invalidation by file signature.
+        
+        Specification:
+            A deck changed on disk by another writer is reloaded
+            
+        Criteria:
+            - Should reload after an external write
+            - Should keep the entry after the cache's own writes
+        """
+        manager = self.cache.get_manager("Category1")
+        manager.review_card(manager.cards[0], 'easy')
+        manager.flush()
+        self.assertIs(self.cache.get_manager("Category1"), manager)
+        
+        external = FlashcardManager(storage_path=self.test_dir, category="Category1")
+        external.add_card("Q3", "A3", "Category1")
+        reloaded = self.cache.get_manager("Category1")
+        self.assertIsNot(reloaded, manager)
+        self.assertEqual(len(reloaded.cards), 4)
+        
+    def test_evicts_least_recently_used(self):
+        """Test eviction under the memory budget.
+        
+        Specification:
+            Least recently used decks are dropped beyond the budget
+            
+        Criteria:
+            - Should keep the most recently used deck
+            - Should evict the older deck
+        """
+        self.cache.memory_budget = 1
+        self.cache.get_manager("Category1")
+        self.cache.get_manager("Category2")
+        self.assertEqual(self.cache.loaded_categories(), ["Category2"])
+        
+    def test_pinned_decks_are_not_evicted(self):
+        """Test pinning decks in use.
+        
+        Specification:
+            A pinned deck keeps its single manager regardless of the budget
+            
+        Criteria:
+            - Should evict unpinned decks only
+            - Should return the same manager while pinned
+            - Should evict the deck once unpinned
+        """
+        self.cache.memory_budget = 1
+        self.cache.pin("Category1")
+        manager = self.cache.get_manager("Category1")
+        self.cache.get_manager("Category2")
+        self.cache.get_manager("Category3")
+        self.assertEqual(self.cache.loaded_categories(), ["Category1", "Category3"])
+        self.assertIs(self.cache.get_manager("Category1"), manager)
+        self.cache.evict("Category1")
+        self.assertIn("Category1", self.cache.loaded_categories())
+        
+        self.cache.unpin("Category1")
+        self.cache.get_manager("Category2")
+        self.assertEqual(self.cache.loaded_categories(), ["Category2"])
+        
+    def test_add_card_checks_all_categories(self):
+        """Test duplicate checks across categories.
+        
+        Specification:
+            Adding through the cache rejects pairs stored in any category
+            
+        Criteria:
+            - Should reject a reversed pair from another category
+            - Should list a newly added category before it is flushed
+        """
+        self.assertFalse(self.cache.add_card("A2", "Q2", "Category1"))
+        self.assertTrue(self.cache.add_card("Q4", "A4", "Category3"))
+        self.assertIn("Category3", self.cache.categories())
+        
+    def test_duplicate_checks_do_not_load_decks(self):
+        """Test duplicate checks against decks that are not loaded.
+        
+        Specification:
+            Checks use stored pair hashes instead of loading or reloading decks
+            
+        Criteria:
+            - Should not load decks to check them
+            - Should find pairs of evicted decks, including unflushed additions
+            - Should see pairs written by another writer
+        """
+        self.cache.memory_budget = 1
+        with patch.object(self.cache, '_load', wraps=self.cache._load) as load:
+            self.assertTrue(self.cache.is_duplicate("A1", "Q1"))
+            self.assertFalse(self.cache.is_duplicate("Q1", "A2"))
+            self.assertEqual(load.call_count, 0)
+            
+            self.assertTrue(self.cache.add_card("Q5", "A5", "Category1"))
+            self.assertTrue(self.cache.add_card("Q6", "A6", "Category2"))
+            self.assertEqual(self.cache.loaded_categories(), ["Category2"])
+            self.assertTrue(self.cache.is_duplicate("A5", "Q5"))
+            self.assertFalse(self.cache.add_card("Q5", "A5", "Category2"))
+            self.assertEqual(load.call_count, 2)
+        
+        external = FlashcardManager(storage_path=self.test_dir, category="Category1")
+        external.add_card("Q7", "A7", "Category1")
+        self.assertTrue(self.cache.is_duplicate("Q7", "A7"))
+        self.assertEqual(self.cache.loaded_categories(), ["Category2"])
+        
+    def test_loads_without_blocking_other_categories(self):
+        """Test concurrent loading.
+        
+        Specification:
+            A deck is read outside the cache lock and loaded once
+            
+        Criteria:
+            - Should serve other categories while a deck is being read
+            - Should hand concurrent callers the deck being read
+        """
+        reading = threading.Event()
+        release = threading.Event()
+        
+        def progress(done, total):
+            reading.set()
+            release.wait(5)
+            
+        results = []
+        first = threading.Thread(target=lambda: results.append(self.cache.get_manager("Category1", progress=progress)))
+        first.start()
+        self.assertTrue(reading.wait(5))
+        waiting = threading.Thread(target=lambda: results.append(self.cache.get_manager("Category1")))
+        waiting.start()
+        
+        self.assertEqual(len(self.cache.get_manager("Category2").cards), 2)
+        self.assertEqual(self.cache.loaded_categories(), ["Category2"])
+        release.set()
+        first.join(5)
+        waiting.join(5)
+        self.assertEqual(len(results), 2)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(self.cache.loaded_categories(), ["Category2", "Category1"])
@@ -4,6 +4,7 @@ Tests for Flashcard model.
 import unittest
 from datetime import datetime
 from core.flashcard import Flashcard
+from core.utils.text_processing.normalizer import NORMALIZER_VERSION
 
 class TestFlashcard(unittest.TestCase):
     def setUp(self):
@@ -79,4 +80,29 @@ class TestFlashcard(unittest.TestCase):
         initial_interval = self.card.interval
         self.card.update_review("easy")
         self.assertGreater(self.card.interval, initial_interval)
-        self.assertIsNotNone(self.card.last_review)
\ No newline at end of file
+        self.assertIsNotNone(self.card.last_review)
+
+    def test_answer_key_persistence(self):
+        """Test stored answer comparison keys.
+        
+        Specification:
+            Answer keys are saved with the card and rebuilt when stale
+            
+        Criteria:
+            - Should store only the normalized answer with a version stamp
+            - Should derive the grammar tokens from the stored key
+            - Should restore a stored key without re-normalizing
+            - Should rebuild keys of other normalizer versions or edited answers
+        """
+        self.card.answer = "Café, die Cafés"
+        data = self.card.to_dict()
+        self.assertEqual(data['answer_key'], {'version': NORMALIZER_VERSION, 'normalized': "cafe, die cafes"})
+        restored = Flashcard.from_dict(data)
+        self.assertEqual(restored.answer_key.tokens, ("cafe", ",", "die", "cafes"))
+        self.assertEqual(restored.answer_key, self.card.get_answer_key())
+        self.assertTrue(restored.check_answer("cafe , die cafes"))
+        
+        data['answer_key']['version'] = -1
+        self.assertIsNone(Flashcard.from_dict(data).answer_key)
+        restored.answer = "Tee"
+        self.assertTrue(restored.check_answer("tee"))
@@ -6,6 +6,9 @@ import os
 import tempfile
 import shutil
 from core.manager import FlashcardManager
+from core.utils.text_processing import (
+    clear_answer_sides, get_category_languages, set_category_languages
+)
 
 class TestFlashcardManager(unittest.TestCase):
     def setUp(self):
@@ -43,4 +46,123 @@ class TestFlashcardManager(unittest.TestCase):
         questions = {card.question for card in category1_cards}
         answers = {card.answer for card in category1_cards}
         self.assertEqual(questions, {"Q1", "A1"})
-        self.assertEqual(answers, {"A1", "Q1"})
\ No newline at end of file
+        self.assertEqual(answers, {"A1", "Q1"})
+
+    def test_add_card_rejects_duplicates(self):
+        """Test duplicate prevention through the card index.
+        
+        Specification:
+            Verify that a pair already stored in either direction is rejected
+            
+        Criteria:
+            - Should reject the same question/answer pair
+            - Should reject the reversed pair
+            - Should not add any cards for rejected pairs
+        """
+        self.assertTrue(self.manager.add_card("Q1", "A1", "Category1"))
+        self.assertFalse(self.manager.add_card("Q1", "A1", "Category1"))
+        self.assertFalse(self.manager.add_card("A1", "Q1", "Category2"))
+        self.assertEqual(len(self.manager.cards), 2)
+        self.assertEqual(self.manager.get_categories(), ["Category1"])
+        
+    def test_load_indexes_saved_cards(self):
+        """Test that loading rebuilds the category index.
+        
+        Specification:
+            Verify saved cards are indexed again after loading
+            
+        Criteria:
+            - Should load saved cards into their category
+            - Should detect duplicates against loaded cards
+        """
+        manager = FlashcardManager(storage_path=self.test_dir, category="Category1")
+        manager.add_card("Q1", "A1", "Category1")
+        
+        reloaded = FlashcardManager(storage_path=self.test_dir)
+        self.assertEqual(len(reloaded.get_due_cards("Category1")), 2)
+        self.assertTrue(reloaded._is_duplicate("A1", "Q1"))
+
+    def test_write_behind_coalesces_saves(self):
+        """Test write-behind persistence.
+        
+        Specification:
+            Saves are deferred until the flusher runs
+            
+        Criteria:
+            - Should not write before the flush
+            - Should mark the category as unsaved
+            - Should persist all pending reviews in one flush
+        """
+        manager = FlashcardManager(
+            storage_path=self.test_dir, category="Category1",
+            write_behind=True, flush_delay=60
+        )
+        manager.add_card("Q1", "A1", "Category1")
+        for card in manager.cards:
+            manager.review_card(card, 'easy')
+        self.assertTrue(manager.has_unsaved_changes())
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "Category1.json")))
+        
+        manager.flush()
+        self.assertFalse(manager.has_unsaved_changes())
+        reloaded = FlashcardManager(storage_path=self.test_dir, category="Category1")
+        self.assertTrue(all(card.last_review for card in reloaded.cards))
+        
+    def test_category_languages_select_folding(self):
+        """Test per-category folding languages.
+        
+        Specification:
+            Answers are compared with the folding profile of their language
+            
+        Criteria:
+            - Should keep Hungarian accents significant
+            - Should fold German umlauts and sharp s to their transliteration
+            - Should restore the selection in a new manager
+        """
+        self.manager.add_card("der Kreis", "kör", "Lektion 7")
+        self.manager.add_card("die Straße", "utca", "Lektion 7")
+        to_hungarian, to_german = self.manager.index.get_category("Lektion 7")[:2]
+        street = self.manager.index.get_category("Lektion 7")[3]
+        self.assertTrue(to_hungarian.check_answer("kor"))
+        
+        self.assertTrue(self.manager.set_category_languages("Lektion 7", ("de", "hu")))
+        self.addCleanup(set_category_languages, "Lektion 7", None)
+        self.assertEqual(to_hungarian.get_answer_language(), "hu")
+        self.assertEqual(to_german.get_answer_language(), "de")
+        self.assertFalse(to_hungarian.check_answer("kor"))
+        self.assertTrue(to_hungarian.check_answer("KÖR"))
+        self.assertTrue(street.check_answer("die Strasse"))
+        self.assertTrue(street.check_answer("Die Straße"))
+        
+        set_category_languages("Lektion 7", None)
+        FlashcardManager(storage_path=self.test_dir)
+        self.assertEqual(get_category_languages("Lektion 7"), ("de", "hu"))
+        with self.assertRaises(ValueError):
+            self.manager.set_category_languages("Lektion 7", ("xx",))
+
+    def test_answer_language_from_side_order(self):
+        """Test resolving answer languages without detectable markers.
+        
+        Specification:
+            Cards whose text names no language take it from the side they were entered on
+            
+        Criteria:
+            - Should grade the entered card's answer as the second language
+            - Should grade the reverse card's answer as the first language
+            - Should resolve the sides again from a reloaded deck
+        """
+        self.manager.add_card("Kreis", "kör", "Lektion 8")
+        self.assertTrue(self.manager.set_category_languages("Lektion 8", ("de", "hu")))
+        self.addCleanup(clear_answer_sides, "Lektion 8")
+        self.addCleanup(set_category_languages, "Lektion 8", None)
+        to_hungarian, to_german = self.manager.index.get_category("Lektion 8")
+        self.assertEqual(to_hungarian.get_answer_language(), "hu")
+        self.assertEqual(to_german.get_answer_language(), "de")
+        self.assertFalse(to_hungarian.check_answer("kor"))
+        self.assertTrue(to_hungarian.check_answer("kör"))
+        
+        clear_answer_sides("Lektion 8")
+        reloaded = FlashcardManager(storage_path=self.test_dir, category="Lektion 8")
+        to_hungarian = reloaded.index.get_category("Lektion 8")[0]
+        self.assertEqual(to_hungarian.get_answer_language(), "hu")
+        self.assertFalse(to_hungarian.check_answer("kor"))
@@ -0,0 +1,122 @@
+"""
+Tests for the due-date scheduler.
+"""
+import unittest
+import tempfile
+from datetime import datetime, timedelta
+from core.flashcard import Flashcard
+from core.manager import FlashcardManager
+from core.scheduler import DueScheduler
+from core.algorithm.sm2 import today_ordinal
+
+class TestDueScheduler(unittest.TestCase):
+    def setUp(self):
+        """Set up test data."""
+        today = datetime.now()
+        self.new_card = Flashcard(question="Q1", answer="A1", category="Test")
+        self.overdue_card = Flashcard(
+            question="Q2", answer="A2", category="Test",
+            last_review=(today - timedelta(days=5)).strftime('%Y-%m-%d'), interval=2
+        )
+        self.future_card = Flashcard(
+            question="Q3", answer="A3", category="Test",
+            last_review=today.strftime('%Y-%m-%d'), interval=3
+        )
+        self.scheduler = DueScheduler([self.future_card, self.overdue_card, self.new_card])
+        
+    def test_due_cards(self):
+        """Test retrieving the due set.
+        
+        Specification:
+            Return all cards whose due day has been reached
+            
+        Criteria:
+            - Should include new and overdue cards
+            - Should exclude cards due in the future
+            - Should keep cards scheduled after the query
+        """
+        due = self.scheduler.due_cards()
+        self.assertEqual(due, [self.new_card, self.overdue_card])
+        self.assertEqual(self.scheduler.due_cards(), due)
+        
+    def test_next_due_includes_future_cards(self):
+        """Test retrieving the next N cards in due order.
+        
+        Specification:
+            Return cards ordered by due day regardless of due status
+            
+        Criteria:
+            - Should respect the requested count
+            - Should order cards by due day
+        """
+        self.assertEqual(
+            self.scheduler.next_due(3),
+            [self.new_card, self.overdue_card, self.future_card]
+        )
+        self.assertEqual(len(self.scheduler.next_due(1)), 1)
+        
+    def test_reschedule_after_review(self):
+        """Test re-keying a reviewed card.
+        
+        Specification:
+            A reviewed card moves to its new due day
+            
+        Criteria:
+            - Should remove the card from the due set after a good review
+            - Should pick up cards reviewed without an explicit reschedule
+        """
+        self.new_card.update_review('easy')
+        self.scheduler.reschedule(self.new_card)
+        self.overdue_card.update_review('easy')
+        self.assertEqual(self.scheduler.due_cards(), [])
+        
+    def test_reschedule_moves_card_earlier(self):
+        """Test re-keying a card whose due day moved earlier.
+        
+        Specification:
+            reschedule() is required for cards that become due sooner
+            
+        Criteria:
+            - Should keep the old position until the card is rescheduled
+            - Should order the card by its new due day after reschedule()
+            - Should re-key cards reviewed through the manager
+        """
+        later_card = Flashcard(
+            question="Q4", answer="A4", category="Test",
+            last_review=datetime.now().strftime('%Y-%m-%d'), interval=2
+        )
+        scheduler = DueScheduler([self.future_card, later_card])
+        self.future_card.update_review('again')
+        self.assertEqual(self.future_card.due_day, today_ordinal() + 1)
+        self.assertEqual(scheduler.next_due(1), [later_card])
+        scheduler.reschedule(self.future_card)
+        self.assertEqual(scheduler.next_due(2), [self.future_card, later_card])
+        
+        with tempfile.TemporaryDirectory() as storage:
+            manager = FlashcardManager(storage_path=storage)
+            manager.add_card("Q5", "A5", "Test")
+            first, second = manager.index.get_category("Test")
+            for card in (first, second):
+                manager.review_card(card, 'easy')
+            manager.review_card(first, 'easy')
+            self.assertEqual(manager.get_next_due_cards("Test", 1), [second])
+            manager.review_card(first, 'again')
+            self.assertEqual(manager.get_next_due_cards("Test", 1), [first])
+            manager.flush()
+        
+    def test_time_until_next_due(self):
+        """Test time until the next card is due.
+        
+        Specification:
+            Report the remaining time until the earliest due card
+            
+        Criteria:
+            - Should be zero when cards are already due
+            - Should be positive when nothing is due yet
+            - Should be None for an empty scheduler
+        """
+        self.assertEqual(self.scheduler.time_until_next_due(), timedelta(0))
+        scheduler = DueScheduler([self.future_card])
+        self.assertGreater(scheduler.time_until_next_due(), timedelta(0))
+        self.assertEqual(self.future_card.due_day, today_ordinal() + 3)
+        self.assertIsNone(DueScheduler().time_until_next_due())
@@ -0,0 +1,109 @@
+"""
+Tests for the search index.
+"""
+import unittest
+from core.flashcard import Flashcard
+from core.search_index import SearchIndex, fold_text, match_spans
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up test data."""
+        self.circle = Flashcard(question="kör", answer="der Kreis, die Kreise", category="Test")
+        self.reverse = Flashcard(question="der Kreis, die Kreise", answer="kör", category="Test")
+        self.body = Flashcard(question="Körper", answer="test", category="Test")
+        self.index = SearchIndex([self.circle, self.reverse, self.body])
+        
+    def test_fold_text(self):
+        """Test accent folding.
+        
+        Specification:
+            Folded text ignores case, accents and repeated whitespace
+            
+        Criteria:
+            - Should lowercase and strip accents
+            - Should collapse whitespace
+        """
+        self.assertEqual(fold_text("  Körper\n  Ärger "), "korper arger")
+        
+    def test_substring_search_both_sides(self):
+        """Test accent-folded substring search.
+        
+        Specification:
+            Queries match questions and answers without accents
+            
+        Criteria:
+            - Should match answers as well as questions
+            - Should rank exact question matches first
+            - Should return spans in the original text
+        """
+        hits = self.index.search("kor")
+        self.assertEqual(hits[0].card, self.circle)
+        self.assertEqual(hits[0].question_spans, [(0, 3)])
+        self.assertIn(self.reverse, [hit.card for hit in hits])
+        self.assertEqual(self.index.search("KREISE")[0].question_spans, [(15, 21)])
+        
+    def test_short_queries_match_word_prefixes(self):
+        """Test prefix matching for short queries.
+        
+        Specification:
+            One- and two-character queries match word prefixes
+            
+        Criteria:
+            - Should match words starting with the query
+            - Should not match the query inside a word
+        """
+        self.assertEqual(len(self.index.search("kr")), 2)
+        self.assertEqual(self.index.search("es"), [])
+        
+    def test_index_updates(self):
+        """Test keeping the index current.
+        
+        Specification:
+            Added, edited and removed cards are reflected in results
+            
+        Criteria:
+            - Should find added cards
+            - Should find edited text and forget the old text
+            - Should drop removed cards
+        """
+        card = Flashcard(question="Hund", answer="kutya", category="Test")
+        self.index.add_card(card)
+        self.assertEqual(self.index.search("hund")[0].card, card)
+        card.question = "der Hund"
+        self.index.update_card(card)
+        self.assertEqual(self.index.search("der h")[0].card, card)
+        self.index.remove_card(card)
+        self.assertEqual(self.index.search("kutya"), [])
+
+    def test_iter_search_batches(self):
+        """Test streaming all hits in batches.
+        
+        Specification:
+            iter_search yields every match in ranked batches
+            
+        Criteria:
+            - Should yield batches no larger than batch_size
+            - Should return the same order as search
+        """
+        batches = list(self.index.iter_search("kor", batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        streamed = [hit.card for batch in batches for hit in batch]
+        self.assertEqual(streamed, [hit.card for hit in self.index.search("kor")])
+        self.assertEqual(list(self.index.iter_search("  ")), [])
+        
+    def test_overlapping_matches_merge(self):
+        """Test spans of a query that overlaps itself.
+        
+        Specification:
+            Overlapping occurrences are highlighted as one span
+            
+        Criteria:
+            - Should merge overlapping occurrences
+            - Should keep separate occurrences apart
+        """
+        self.assertEqual(match_spans("banana", "ana"), [(1, 6)])
+        self.assertEqual(match_spans("Ananas Banane", "an"), [(0, 4), (8, 12)])
+        self.index.add_card(Flashcard(question="Ananas", answer="ananász", category="Test"))
+        hit = self.index.search("ana")[0]
+        self.assertEqual(hit.question_spans, [(0, 5)])
+        self.assertEqual(hit.answer_spans, [(0, 5)])
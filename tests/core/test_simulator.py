@@ -0,0 +1,59 @@
+"""
+Tests for the review simulator.
+"""
+import unittest
+from core.flashcard import Flashcard
+
+try:
+    import numpy as np
+    from core.algorithm.simulator import SessionSettings, SimulationDeck, simulate
+except ImportError:  # NumPy is optional
+    np = None
+
+def perfect_recall(elapsed, interval, easiness):
+    """Recall model where every card is remembered."""
+    return np.ones(len(elapsed))
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestSimulator(unittest.TestCase):
+    def test_perfect_recall_follows_sm2_intervals(self):
+        """Test scheduling with perfect recall.
+        
+        Specification:
+            With every answer rated good, a card is reviewed after 2, 6 and
+            then round(interval * easiness) days
+            
+        Criteria:
+            - Should introduce new_per_day cards per day
+            - Should review cards on their due days
+            - Should report full retention
+        """
+        settings = SessionSettings(new_per_day=1, first_recall=1.0, easy_fraction=0.0)
+        result = simulate(SimulationDeck.synthetic(1), 12, settings, perfect_recall, start_day=0, seed=1)
+        self.assertEqual(result.new_cards.tolist(), [1] + [0] * 11)
+        # Introduced on day 0, then due on day 2, day 8 and day 8 + round(6 * 2.5) = 23
+        self.assertEqual(np.flatnonzero(result.reviews).tolist(), [2, 8])
+        self.assertEqual(result.summary()['retention'], 1.0)
+        self.assertEqual(result.learned, 1)
+        
+    def test_review_cap_leaves_backlog(self):
+        """Test the daily review cap.
+        
+        Specification:
+            Reviews beyond max_reviews_per_day are carried over
+            
+        Criteria:
+            - Should never exceed the cap
+            - Should report the leftover due cards as backlog
+        """
+        cards = [
+            Flashcard(question=f"q{i}", answer="a", category="Test", last_review="2024-01-01")
+            for i in range(10)
+        ]
+        deck = SimulationDeck.from_cards(cards)
+        start = cards[0].due_day
+        settings = SessionSettings(new_per_day=0, max_reviews_per_day=4)
+        result = simulate(deck, 2, settings, perfect_recall, start_day=start, seed=1)
+        self.assertEqual(result.reviews.tolist(), [4, 4])
+        self.assertEqual(result.backlog.tolist(), [6, 2])
+        self.assertEqual(deck.last_day.tolist(), [start - 1] * 10)  # Input left unchanged
@@ -0,0 +1,56 @@
+"""
+Tests for the vectorized SM2 implementation.
+"""
+import random
+import unittest
+from core.algorithm.sm2 import SM2Data, calculate_next_review
+
+try:
+    import numpy as np
+    from core.algorithm.sm2_batch import calculate_next_reviews, qualities_from_difficulties
+except ImportError:  # NumPy is optional
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestSM2Batch(unittest.TestCase):
+    def test_matches_scalar_algorithm(self):
+        """Test equivalence with the scalar algorithm.
+        
+        Specification:
+            Batch updates equal calculate_next_review for every card
+            
+        Criteria:
+            - Should produce identical easiness, interval and repetitions
+            - Should clamp out-of-range qualities
+            - Should round half intervals like round()
+        """
+        rng = random.Random(11)
+        states = [SM2Data()]
+        # Repeatedly review random cards to reach realistic states
+        for _ in range(3000):
+            state = rng.choice(states)
+            states.append(calculate_next_review(rng.randint(0, 5), state)[0])
+        states.append(SM2Data(easiness=2.5, interval=3, repetitions=4))  # 7.5 rounds to 8
+        states.append(SM2Data(easiness=1.3, interval=5, repetitions=3))  # 6.5 rounds to 6
+        qualities = [rng.randint(-1, 6) for _ in states]
+        
+        result = calculate_next_reviews(
+            qualities,
+            [s.easiness for s in states],
+            [s.interval for s in states],
+            [s.repetitions for s in states],
+            today=1000
+        )
+        for i, (quality, state) in enumerate(zip(qualities, states)):
+            expected = calculate_next_review(quality, state)[0]
+            self.assertEqual(result.easiness[i], expected.easiness)
+            self.assertEqual(result.interval[i], expected.interval)
+            self.assertEqual(result.repetitions[i], expected.repetitions)
+            self.assertEqual(result.due_day[i], 1000 + expected.interval)
+            
+    def test_qualities_from_difficulties(self):
+        """Test converting difficulty ratings in bulk."""
+        self.assertEqual(
+            qualities_from_difficulties(['again', 'hard', 'good', 'easy']).tolist(),
+            [0, 2, 3, 5]
+        )
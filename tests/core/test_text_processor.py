@@ -2,7 +2,9 @@
 Tests for text processing utilities.
 """
 import unittest
+from core.flashcard import Flashcard
 from core.utils.text_processor import normalize_text, format_display_text
+from core.utils.text_processing import AnswerVerdict, TextLayout, bounded_edit_distance, normalize_answer
 
 class TestTextProcessor(unittest.TestCase):
     def test_normalize_text_removes_spaces(self):
@@ -44,4 +46,82 @@ class TestTextProcessor(unittest.TestCase):
             - Should handle multiple accented characters
         """
         text = "hôtel crémè"
-        self.assertEqual(normalize_text(text), "hotel creme")
\ No newline at end of file
+        self.assertEqual(normalize_text(text), "hotel creme")
+
+    def test_normalize_answer_single_pass(self):
+        """Test combined normalization and grammar splitting.
+        
+        Specification:
+            Verify one pass yields the normalized text and its parts
+            
+        Criteria:
+            - Should match normalize_text for ASCII and accented input
+            - Should split commas off as separate parts
+            - Should reuse the cached result for repeated input
+        """
+        for text in ("Der Kreis,\n die  Kreise", "hôtel crémè, ÄRGER"):
+            result = normalize_answer(text)
+            self.assertEqual(result.text, normalize_text(text))
+            self.assertEqual(result.parts, tuple(result.text.replace(',', ' , ').split()))
+        self.assertEqual(normalize_answer("Der Kreis,\n die  Kreise").parts,
+                         ("der", "kreis", ",", "die", "kreise"))
+        self.assertIs(normalize_answer("Der Kreis,\n die  Kreise"),
+                      normalize_answer("Der Kreis,\n die  Kreise"))
+        
+    def test_bounded_edit_distance(self):
+        """Test the bounded edit distance.
+        
+        Specification:
+            Verify distances are exact up to the bound
+            
+        Criteria:
+            - Should count insertions, deletions and substitutions
+            - Should report distances above the bound as bound + 1
+        """
+        self.assertEqual(bounded_edit_distance("unterschied", "unterschied", 2), 0)
+        self.assertEqual(bounded_edit_distance("unterschied", "untershied", 2), 1)
+        self.assertEqual(bounded_edit_distance("kitten", "sitting", 3), 3)
+        self.assertEqual(bounded_edit_distance("kitten", "sitting", 2), 3)
+        self.assertEqual(bounded_edit_distance("", "abc", 1), 2)
+        
+    def test_grade_answer_accepts_typos(self):
+        """Test typo-tolerant grading.
+        
+        Specification:
+            Verify misspelled answers are accepted as typos
+            
+        Criteria:
+            - Should grade exact matches as correct
+            - Should accept a typo in a long word
+            - Should reject typos in short words and wrong words
+        """
+        card = Flashcard(question="különbséget tesz",
+                         answer="unterscheiden, unterschied, hat unterschieden", category="Test")
+        self.assertIs(card.grade_answer("Unterscheiden, unterschied, hat unterschieden"),
+                      AnswerVerdict.CORRECT)
+        self.assertIs(card.grade_answer("unterscheiden, untershied, hat unterschieden"),
+                      AnswerVerdict.TYPO)
+        self.assertIs(card.grade_answer("unterscheiden, unterschied, hta unterschieden"),
+                      AnswerVerdict.WRONG)
+        self.assertIs(card.grade_answer("entscheiden, entschied, hat entschieden"),
+                      AnswerVerdict.WRONG)
+        self.assertFalse(card.check_answer("unterscheiden, untershied, hat unterschieden"))
+        
+    def test_text_layout_wraps_linearly(self):
+        """Test the shared wrap engine.
+        
+        Specification:
+            Verify greedy wrapping by measured width
+            
+        Criteria:
+            - Should fill lines up to the width
+            - Should give overlong words their own line
+            - Should measure with a custom width function
+            - Should return cached results for repeated texts
+        """
+        text = "This is a long text that needs to be formatted extraordinarily"
+        self.assertEqual(format_display_text(text, 20),
+                         "This is a long text\nthat needs to be\nformatted\nextraordinarily")
+        wide = TextLayout(measure=lambda word: sum(2 if char.isupper() else 1 for char in word))
+        self.assertEqual(wide.wrap("AB cd EF gh", 7), "AB cd\nEF gh")
+        self.assertIs(wide.wrap("AB cd EF gh", 7), wide.wrap("AB cd EF gh", 7))
@@ -0,0 +1,71 @@
+"""
+Tests for start-up tracing.
+"""
+import unittest
+import tempfile
+import shutil
+import json
+import os
+import builtins
+import sys
+from core import tracing
+from core.manager import FlashcardManager
+
+class TestStartupTrace(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.trace_path = os.path.join(self.test_dir, 'trace.json')
+        self.original_import = builtins.__import__
+
+    def tearDown(self):
+        """Clean up test environment."""
+        tracing.stop_trace()
+        builtins.__import__ = self.original_import
+        shutil.rmtree(self.test_dir)
+
+    def test_disabled_without_path(self):
+        """Test tracing being opt-in.
+
+        Specification:
+            Without a path or environment variable nothing is traced
+
+        Criteria:
+            - Should not start a trace
+            - Should leave the import function untouched
+        """
+        os.environ.pop(tracing.TRACE_ENV, None)
+        self.assertIsNone(tracing.start_trace())
+        self.assertIs(builtins.__import__, self.original_import)
+        with tracing.span('nothing'):
+            pass
+        self.assertIsNone(tracing.get_trace())
+
+    def test_writes_chrome_trace(self):
+        """Test the written trace file.
+
+        Specification:
+            Imports, spans and card loads are written as complete events
+
+        Criteria:
+            - Should record the import of a new module
+            - Should record the card load with its category
+            - Should write Chrome trace JSON
+        """
+        tracing.start_trace(self.trace_path)
+        sys.modules.pop('colorsys', None)
+        import colorsys  # noqa: F401
+        with tracing.span('build', 'app'):
+            FlashcardManager(storage_path=os.path.join(self.test_dir, 'decks'), category='Cat')
+        tracing.stop_trace()
+
+        with open(self.trace_path, encoding='utf-8') as f:
+            events = json.load(f)['traceEvents']
+        names = {(event['cat'], event['name']) for event in events}
+        self.assertIn(('import', 'colorsys'), names)
+        self.assertIn(('app', 'build'), names)
+        self.assertIn(('load', 'load_cards'), names)
+        load = next(event for event in events if event['name'] == 'load_cards')
+        self.assertEqual(load['args']['category'], 'Cat')
+        self.assertTrue(all(event['ph'] == 'X' and event['dur'] >= 0 for event in events))
+        self.assertIs(builtins.__import__, self.original_import)
@@ -0,0 +1,76 @@
+"""
+Tests for background deck loading.
+"""
+import unittest
+import tempfile
+import shutil
+import time
+from unittest.mock import patch
+from kivy.clock import Clock
+from core.deck_cache import DeckCache
+from core.flashcard import Flashcard
+from core.storage import JsonStorageBackend
+from gui.screens.study.deck_loader import load_deck
+
+def run_clock_until(condition, timeout: float = 5.0) -> None:
+    """Tick the Kivy clock until a condition holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        Clock.tick()
+
+class TestDeckLoader(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        cards = [Flashcard(f"Frage {i}", f"Antwort {i}", "Big") for i in range(1200)]
+        JsonStorageBackend(self.test_dir).save_category("Big", cards)
+        self.cache = DeckCache(storage_path=self.test_dir)
+        patcher = patch('gui.screens.study.deck_loader.get_deck_cache', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.cache.flush()
+        shutil.rmtree(self.test_dir)
+
+    def test_loads_with_progress(self):
+        """Test loading a deck in the background.
+
+        Specification:
+            Decks load on a worker thread and are handed to the main thread
+
+        Criteria:
+            - Should report progress up to the full deck
+            - Should deliver the loaded manager through the clock
+        """
+        loaded = []
+        progress = []
+        load_deck("Big", loaded.append, on_progress=lambda done, total: progress.append((done, total)))
+        run_clock_until(lambda: loaded)
+
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(len(loaded[0].cards), 1200)
+        self.assertIs(loaded[0], self.cache.get_manager("Big"))
+        self.assertEqual(progress[-1], (1200, 1200))
+
+    def test_cancelled_load_is_not_delivered(self):
+        """Test cancelling a load.
+
+        Specification:
+            A load cancelled on the main thread never calls back
+
+        Criteria:
+            - Should not deliver the manager or progress
+            - Should leave the cache usable
+        """
+        loaded = []
+        progress = []
+        request = load_deck("Big", loaded.append, on_progress=lambda *args: progress.append(args))
+        request.cancel()
+        run_clock_until(lambda: False, timeout=0.3)
+
+        self.assertTrue(request.cancelled)
+        self.assertEqual(loaded, [])
+        self.assertEqual(progress, [])
+        self.assertEqual(len(self.cache.get_manager("Big").cards), 1200)
@@ -0,0 +1,126 @@
+"""
+Tests for the KV rule cache.
+"""
+import unittest
+import tempfile
+import shutil
+import os
+from kivy.factory import Factory
+from kivy.lang import Builder
+from unittest.mock import patch
+from gui.utils import kv_cache
+
+KV_RULES = """
+#:set accent_size 21
+<CachedTestLabel@Label>:
+    text: 'cached ' + str(1 + 1)
+    font_size: accent_size
+    halign: 'center'
+    on_touch_down: self.text = 'touched'
+"""
+
+KV_ROOT = """
+BoxLayout:
+    CachedTestLabel:
+        id: label
+"""
+
+class TestKvCache(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.test_dir, 'cache')
+        self.kv_path = os.path.join(self.test_dir, 'cached_test.kv')
+        with open(self.kv_path, 'w', encoding='utf-8') as f:
+            f.write(KV_RULES)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        Builder.unload_file(self.kv_path)
+        shutil.rmtree(self.test_dir)
+
+    def test_cached_rules_match_parsed_rules(self):
+        """Test loading rules from the cache.
+
+        Specification:
+            A cached rule tree behaves like a freshly parsed one
+
+        Criteria:
+            - Should parse and cache the file on first load
+            - Should load the unchanged file from the cache
+            - Should apply the cached rules and directives to new widgets
+        """
+        parser, cached = kv_cache.parse_kv_file(self.kv_path, self.cache_dir)
+        self.assertFalse(cached)
+        fresh = kv_cache.dump_parser(parser)
+
+        parser, cached = kv_cache.parse_kv_file(self.kv_path, self.cache_dir)
+        self.assertTrue(cached)
+        self.assertEqual(kv_cache.dump_parser(parser), fresh)
+
+        kv_cache.load_kv_file(self.kv_path, self.cache_dir)
+        label = Factory.CachedTestLabel()
+        self.assertEqual(label.text, 'cached 2')
+        self.assertEqual(label.font_size, 21)
+        self.assertEqual(label.halign, 'center')
+
+    def test_changed_file_is_reparsed(self):
+        """Test cache invalidation.
+
+        Specification:
+            Editing a KV file makes its cache entry stale
+
+        Criteria:
+            - Should parse the edited file again
+            - Should prune entries of old versions when rebuilding
+        """
+        kv_cache.parse_kv_file(self.kv_path, self.cache_dir)
+        with open(self.kv_path, 'a', encoding='utf-8') as f:
+            f.write("    bold: True\n")
+        _, cached = kv_cache.parse_kv_file(self.kv_path, self.cache_dir)
+        self.assertFalse(cached)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+        self.assertEqual(kv_cache.build_cache([self.kv_path], self.cache_dir), [self.kv_path])
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_cached_root_widget(self):
+        """Test building a root widget from the cache.
+
+        Specification:
+            A cached file with a root rule returns its widget like Builder.load_file
+
+        Criteria:
+            - Should build the root widget and its children from cached rules
+            - Should not register a file without rules, as Builder does
+        """
+        kv_cache.load_kv_file(self.kv_path, self.cache_dir)
+        root_path = os.path.join(self.test_dir, 'cached_root.kv')
+        with open(root_path, 'w', encoding='utf-8') as f:
+            f.write(KV_ROOT)
+        self.addCleanup(Builder.unload_file, root_path)
+        kv_cache.parse_kv_file(root_path, self.cache_dir)
+
+        root = kv_cache.load_kv_file(root_path, self.cache_dir)
+        self.assertEqual(root.ids.label.text, 'cached 2')
+        self.assertNotIn(root_path, Builder.files)
+
+    def test_falls_back_to_builder(self):
+        """Test loading without the cache.
+
+        Specification:
+            Files load through Builder.load_file when the cached path cannot be used
+
+        Criteria:
+            - Should use Builder.load_file if Builder internals are missing
+            - Should use Builder.load_file if the file does not parse
+        """
+        with patch.object(kv_cache, 'BUILDER_MEMBERS', kv_cache.BUILDER_MEMBERS + ('_missing',)), \
+                patch.object(Builder, 'load_file') as load_file:
+            kv_cache.load_kv_file(self.kv_path, self.cache_dir)
+        load_file.assert_called_once_with(self.kv_path)
+
+        with patch.object(kv_cache, 'parse_kv_file', side_effect=ValueError), \
+                patch.object(Builder, 'load_file') as load_file:
+            kv_cache.load_kv_file(self.kv_path, self.cache_dir)
+        load_file.assert_called_once_with(self.kv_path)
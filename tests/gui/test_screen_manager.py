@@ -0,0 +1,41 @@
+"""
+Tests for lazy screen management.
+"""
+import unittest
+from gui.utils.screen_manager import ScreenManagerUtil, SCREENS
+
+class TestLazyScreenManager(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment."""
+        self.manager = ScreenManagerUtil.create_screen_manager()
+        
+    def test_only_home_screen_is_built(self):
+        """Test start-up screen construction.
+        
+        Specification:
+            Only the first screen is built when the app starts
+            
+        Criteria:
+            - Should show the home screen
+            - Should report unbuilt screens as available
+        """
+        self.assertEqual(self.manager.current, 'home')
+        self.assertEqual(self.manager.screen_names, ['home'])
+        for name in SCREENS:
+            self.assertTrue(self.manager.has_screen(name))
+        self.assertFalse(self.manager.has_screen('missing'))
+        
+    def test_screen_built_on_first_lookup(self):
+        """Test building a screen on demand.
+        
+        Specification:
+            Screens and their KV rules are created on first use
+            
+        Criteria:
+            - Should build the screen with its KV ids
+            - Should reuse the screen afterwards
+        """
+        screen = self.manager.get_screen('search')
+        self.assertIn('results_list', screen.ids)
+        self.assertIs(self.manager.get_screen('search'), screen)
+        self.assertEqual(sorted(self.manager.screen_names), ['home', 'search'])
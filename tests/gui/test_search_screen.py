@@ -0,0 +1,72 @@
+"""
+Tests for the search screen.
+"""
+import unittest
+import threading
+from unittest.mock import MagicMock, patch
+from core.flashcard import Flashcard
+from core.search_index import SearchIndex
+from gui.screens.search_screen import SearchRequest, highlight_spans
+
+class TestSearchScreen(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment."""
+        cards = [Flashcard(f"Frage {i}", f"Antwort {i}", "Big") for i in range(120)]
+        self.index = SearchIndex(cards)
+        self.cache = MagicMock()
+        self.cache.search_index.return_value = self.index
+        patcher = patch('gui.screens.search_screen.get_deck_cache', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_highlight_spans(self):
+        """Test match highlighting.
+
+        Specification:
+            Matched spans are shown in bold without repeating text
+
+        Criteria:
+            - Should bold each span and escape markup
+            - Should not repeat text of overlapping or unsorted spans
+        """
+        self.assertEqual(highlight_spans("a [b] c", [(2, 5)]), "a [b]&bl;b&br;[/b] c")
+        self.assertEqual(highlight_spans("banana", [(1, 4), (3, 6)]), "b[b]ana[/b][b]na[/b]")
+        self.assertEqual(highlight_spans("banana", [(3, 6), (1, 4), (2, 3)]), "b[b]ana[/b][b]na[/b]")
+
+    def test_search_runs_in_background(self):
+        """Test searching on a worker thread.
+
+        Specification:
+            The index is built and hits are ranked off the main thread
+
+        Criteria:
+            - Should build the index on the worker thread
+            - Should queue every hit in ranked batches, then None
+        """
+        threads = []
+        self.cache.search_index.side_effect = lambda: threads.append(threading.current_thread()) or self.index
+        request = SearchRequest("frage", batch_size=50).start()
+        batches = []
+        for batch in iter(lambda: request.batches.get(timeout=5), None):
+            batches.append(batch)
+        self.assertNotIn(threading.main_thread(), threads)
+        self.assertEqual([len(batch) for batch in batches], [50, 50, 20])
+        streamed = [hit.card for batch in batches for hit in batch]
+        self.assertEqual(streamed, [hit.card for hit in self.index.search("frage", limit=120)])
+
+    def test_cancelled_search_stops(self):
+        """Test cancelling a search.
+
+        Specification:
+            A cancelled worker stops without filling the queue further
+
+        Criteria:
+            - Should compute only a bounded number of batches ahead
+            - Should stop after cancel
+        """
+        request = SearchRequest("frage", batch_size=10).start()
+        request.batches.get(timeout=5)
+        request.cancel()
+        request._thread.join(5)
+        self.assertFalse(request._thread.is_alive())
+        self.assertLessEqual(request.batches.qsize(), 2)
@@ -0,0 +1,65 @@
+"""
+Tests for the prefetching study session queue.
+"""
+import unittest
+from unittest.mock import MagicMock
+from gui.screens.study.session_queue import SessionQueue
+
+class TestSessionQueue(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment."""
+        self.rounds = [["a", "b", "c", "d", "e"], ["b", "e", "f"]]
+        self.fetch = MagicMock(side_effect=lambda: list(self.rounds.pop(0)) if self.rounds else [])
+        self.prepare_card = MagicMock()
+        self.reviewed = set()
+        self.queue = SessionQueue(self.fetch, self.prepare_card,
+                                  keep=lambda card: card not in self.reviewed, lookahead=3)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.queue.reset()
+
+    def test_prepares_next_cards_ahead(self):
+        """Test preparing cards in idle time.
+
+        Specification:
+            The next cards are prepared after a card is taken, not when shown
+
+        Criteria:
+            - Should prepare the lookahead cards once
+            - Should not prepare cards when they are taken
+        """
+        self.assertEqual(self.queue.pop(), "a")
+        self.prepare_card.assert_not_called()
+        self.queue.prepare()
+        self.assertEqual([call.args[0] for call in self.prepare_card.call_args_list], ["b", "c", "d"])
+
+        self.prepare_card.reset_mock()
+        self.assertEqual(self.queue.pop(), "b")
+        self.queue.prepare()
+        self.assertEqual([call.args[0] for call in self.prepare_card.call_args_list], ["e"])
+        self.assertEqual(self.fetch.call_count, 1)
+
+    def test_next_round_read_ahead(self):
+        """Test reading the next round before the current one ends.
+
+        Specification:
+            The next round is read while cards remain, and cards reviewed
+            since are dropped from it
+
+        Criteria:
+            - Should read the next round once fewer cards than the lookahead remain
+            - Should skip cards that no longer belong in the round
+        """
+        for expected in "abc":
+            self.assertEqual(self.queue.pop(), expected)
+            self.reviewed.add(expected)
+            self.queue.prepare()
+        self.assertEqual(self.fetch.call_count, 2)
+
+        self.assertEqual(self.queue.pop(), "d")
+        self.assertEqual(self.queue.pop(), "e")
+        self.reviewed.update("de")
+        # 'b' and 'e' were reviewed after the round was read
+        self.assertEqual(self.queue.pop(), "f")
+        self.assertIsNone(self.queue.pop())
@@ -2,7 +2,8 @@
 Tests for study modes.
 """
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+from core.flashcard import Flashcard
 from gui.screens.study.study_mode import StudyMode
 from gui.screens.study.practice_mode import PracticeMode
 
@@ -14,8 +15,7 @@ class TestStudyMode(unittest.TestCase):
         
     def test_correct_answer(self):
         """Test handling correct answer."""
-        card = MagicMock()
-        card.answer = "Test answer"
+        card = Flashcard(question="Test question", answer="Test answer", category="Test")
         self.mode.check_answer("Test answer", card)
         self.assertEqual(
             self.screen.ids.feedback_label.text,
@@ -24,13 +24,23 @@ class TestStudyMode(unittest.TestCase):
         
     def test_incorrect_answer(self):
         """Test handling incorrect answer."""
-        card = MagicMock()
-        card.answer = "Test answer"
+        card = Flashcard(question="Test question", answer="Test answer", category="Test")
         self.mode.check_answer("Wrong answer", card)
         self.assertEqual(
             self.screen.ids.user_input.foreground_color,
             (0.8, 0, 0, 1)
         )
+        
+    @patch('gui.screens.study.study_mode.Clock')
+    def test_typo_answer_rated_hard(self, mock_clock):
+        """Test handling an answer with a typo."""
+        card = Flashcard(question="Test question", answer="Test answers", category="Test")
+        self.mode.check_answer("Test answres", card)
+        self.assertEqual(self.screen.ids.feedback_label.text, "Accepted with a typo")
+        self.assertEqual(self.screen.ids.user_input.text, "Test answers")
+        callback = mock_clock.schedule_once.call_args[0][0]
+        callback(0)
+        self.screen.handle_difficulty.assert_called_once_with('hard')
 
 class TestPracticeMode(unittest.TestCase):
     def setUp(self):
@@ -40,8 +50,7 @@ class TestPracticeMode(unittest.TestCase):
         
     def test_correct_answer_practice(self):
         """Test handling correct answer in practice mode."""
-        card = MagicMock()
-        card.answer = "Test answer"
+        card = Flashcard(question="Test question", answer="Test answer", category="Test")
         self.mode.check_answer("Test answer", card)
         self.assertEqual(
             self.screen.ids.feedback_label.text,
@@ -50,7 +59,15 @@ class TestPracticeMode(unittest.TestCase):
         
     def test_incorrect_answer_practice(self):
         """Test handling incorrect answer in practice mode."""
-        card = MagicMock()
-        card.answer = "Test answer"
+        card = Flashcard(question="Test question", answer="Test answer", category="Test")
         self.mode.check_answer("Wrong answer", card)
-        self.assertTrue(self.screen.ids.next_button.opacity)
\ No newline at end of file
+        self.assertTrue(self.screen.ids.next_button.opacity)        
+    def test_typo_answer_practice(self):
+        """Test handling an answer with a typo in practice mode."""
+        card = Flashcard(question="Test question", answer="Test answers", category="Test")
+        with patch.object(self.mode.answer_handler, 'show_typo_feedback',
+                          wraps=self.mode.answer_handler.show_typo_feedback) as show_typo_feedback:
+            self.mode.check_answer("Test answres", card)
+        show_typo_feedback.assert_called_once_with("Test answers")
+        self.assertEqual(self.screen.ids.feedback_label.text, "Accepted with a typo")
+        self.assertEqual(self.screen.ids.user_input.text, "Test answers")
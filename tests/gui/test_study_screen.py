@@ -2,7 +2,7 @@
 Tests for StudyScreen functionality.
 """
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from kivy.properties import DictProperty
 from gui.screens.study_screen import StudyScreen
 from core.flashcard import Flashcard
@@ -73,4 +73,28 @@ class TestStudyScreen(unittest.TestCase):
         self.assertEqual(
             self.screen.ids['feedback_label'].text,
             "Correct!"
-        )
\ No newline at end of file
+        )
+        
+    @patch('gui.screens.study_screen.load_deck')
+    @patch('gui.screens.study_screen.get_deck_cache')
+    def test_session_pins_its_deck(self, mock_cache, mock_load_deck):
+        """Test keeping the studied deck loaded.
+        
+        Specification:
+            The deck of the current session is pinned in the deck cache
+            
+        Criteria:
+            - Should pin the category when a session starts
+            - Should release the previous category when switching
+            - Should release the pin when leaving the screen
+        """
+        cache = mock_cache.return_value
+        self.screen.ui_manager = MagicMock()
+        self.screen.set_category("Lektion 1")
+        cache.pin.assert_called_once_with("Lektion 1")
+        self.screen.set_category("Lektion 2")
+        cache.unpin.assert_called_once_with("Lektion 1")
+        self.screen.on_leave()
+        cache.unpin.assert_called_with("Lektion 2")
+        self.screen.on_leave()
+        self.assertEqual(cache.unpin.call_count, 2)
@@ -2,10 +2,13 @@
 Tests for UI helper functions.
 """
 import unittest
+from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 from gui.utils.ui_helpers import (
     get_feedback_color,
     format_long_text,
+    format_for_widget,
+    get_font_layout,
     toggle_widget
 )
 
@@ -73,4 +76,24 @@ class TestUIHelpers(unittest.TestCase):
         # Test hiding widget
         toggle_widget(widget, False)
         self.assertTrue(widget.disabled)
-        self.assertEqual(widget.opacity, 0)
\ No newline at end of file
+        self.assertEqual(widget.opacity, 0)
+
+    def test_format_for_widget(self):
+        """Test font-aware text formatting.
+        
+        Specification:
+            Verify lines are filled in the widget's font
+            
+        Criteria:
+            - Should use character lines for widgets not on screen
+            - Should keep lines within a width measured in the font
+            - Should reuse the font's layout
+        """
+        text = "mich sich aufregen, regte sich auf, hat sich aufgeregt über + A"
+        label = Label(font_size=18)
+        self.assertEqual(format_for_widget(text, label, max_length=20), format_long_text(text, 20))
+        
+        layout = get_font_layout(label.font_name, label.font_size)
+        self.assertIs(get_font_layout(label.font_name, label.font_size), layout)
+        for line in layout.wrap(text, 150).split('\n'):
+            self.assertLessEqual(layout.measure(line), 150)
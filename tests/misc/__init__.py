@@ -0,0 +1,3 @@
+"""
+Misc tests package initialization.
+"""
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Tests for the vocabulary import script.
+"""
+import unittest
+import tempfile
+import shutil
+import json
+import os
+from misc import data_generator
+
+VOCAB = (
+    "der Kreis - kör\n"
+    "\n"
+    "die Straße - utca\n"
+    "kein Trennzeichen\n"
+    "das Öl - olaj\n"
+    "  die Brücke  -  híd  \n"
+    "der \"Zug\" - vonat \\ vasút\n"
+)
+
+class TestDataGenerator(unittest.TestCase):
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.vocab_path = self.write_file('vocab.txt', VOCAB)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+
+    def write_file(self, name, content):
+        """Write a file to the test directory and return its path."""
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_records_split_across_chunks(self):
+        """Test parsing files in byte-range chunks.
+
+        Specification:
+            Every line is parsed once, whichever chunk its bytes start in
+
+        Criteria:
+            - Should match line-by-line parsing for every chunk size
+            - Should handle chunks ending inside multi-byte characters
+            - Should give the same pairs from the process pool
+        """
+        expected = data_generator.parse_vocab_file(self.vocab_path)
+        self.assertEqual(len(expected), 5)
+        size = os.path.getsize(self.vocab_path)
+        for chunk_size in range(1, size + 2):
+            pairs = list(data_generator.iter_vocab_files([self.vocab_path], workers=1, chunk_size=chunk_size))
+            self.assertEqual(pairs, expected, f"chunk size {chunk_size}")
+
+        pairs = list(data_generator.iter_vocab_files([self.vocab_path], workers=2, chunk_size=8))
+        self.assertEqual(pairs, expected)
+
+    def test_deduplication_across_chunks(self):
+        """Test removing duplicate pairs.
+
+        Specification:
+            A pair is imported once in either direction, wherever it appears
+
+        Criteria:
+            - Should drop repeats and reversed pairs from later chunks and files
+            - Should drop pairs already stored in deck files or journals
+            - Should keep the first occurrence in input order
+        """
+        other_path = self.write_file('more.txt', "utca - die Straße\nder Kreis - kör\ndas Haus - ház\n")
+        pairs = data_generator.iter_vocab_files([self.vocab_path, other_path], workers=1, chunk_size=16)
+        unique = list(data_generator.dedup_pairs(pairs))
+        self.assertEqual(unique, data_generator.parse_vocab_file(self.vocab_path) + [("das Haus", "ház")])
+
+        storage = os.path.join(self.test_dir, 'storage')
+        os.makedirs(storage)
+        with open(os.path.join(storage, 'Lektion_7.json'), 'w', encoding='utf-8') as f:
+            json.dump([{"question": "kör", "answer": "der Kreis"}], f)
+        with open(os.path.join(storage, 'Lektion_7.journal'), 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"question": "das Haus", "answer": "ház"}) + "\n")
+        existing = data_generator.load_existing_keys(storage)
+        pairs = data_generator.iter_vocab_files([self.vocab_path, other_path], workers=1, chunk_size=16)
+        unique = list(data_generator.dedup_pairs(pairs, existing))
+        self.assertNotIn(("der Kreis", "kör"), unique)
+        self.assertNotIn(("das Haus", "ház"), unique)
+        self.assertEqual(len(unique), 4)
+
+    def test_stream_matches_json_dumps(self):
+        """Test streaming the output file.
+
+        Specification:
+            Streamed output is byte-identical to the previous json.dumps serializer
+
+        Criteria:
+            - Should match json.dumps(cards, ensure_ascii=False, indent=4)
+            - Should escape quotes and backslashes and keep non-ASCII text
+            - Should match for an empty import
+        """
+        pairs = data_generator.parse_vocab_file(self.vocab_path)
+        for word_pairs in (pairs, []):
+            cards = data_generator.format_flashcards(word_pairs, "Lektion 7")
+            output_file = os.path.join(self.test_dir, 'Lektion_7.json')
+            count = data_generator.write_json_stream(iter(cards), output_file)
+            self.assertEqual(count, len(cards))
+            with open(output_file, 'rb') as f:
+                streamed = f.read()
+            self.assertEqual(streamed, json.dumps(cards, ensure_ascii=False, indent=4).encode('utf-8'))
+
+        card = data_generator.format_flashcards(pairs[-1:], "Lektion 7")[0]
+        self.assertEqual(data_generator.format_card_json(card),
+                         json.dumps([card], ensure_ascii=False, indent=4)[2:-2])
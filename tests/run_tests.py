@@ -21,14 +21,28 @@ def run_tests():
         
         # Add test modules explicitly
         test_modules = [
+            'tests.core.test_card_store',
+            'tests.core.test_deck_cache',
             'tests.core.test_flashcard',
             'tests.core.test_manager',
+            'tests.core.test_scheduler',
+            'tests.core.test_search_index',
+            'tests.core.test_simulator',
             'tests.core.test_sm2',
+            'tests.core.test_sm2_batch',
+            'tests.core.test_storage',
             'tests.core.test_text_processor',
+            'tests.core.test_tracing',
+            'tests.gui.test_deck_loader',
+            'tests.gui.test_kv_cache',
+            'tests.gui.test_screen_manager',
+            'tests.gui.test_search_screen',
+            'tests.gui.test_session_queue',
             'tests.gui.test_study_controller',
             'tests.gui.test_study_modes',
             'tests.gui.test_study_screen',
-            'tests.gui.test_ui_helpers'
+            'tests.gui.test_ui_helpers',
+            'tests.misc.test_data_generator'
         ]
         
         suite = unittest.TestSuite()